@@ -0,0 +1,526 @@
+"""
+API JSON v1: POST /api/v1/{modelo} e POST /api/v1/{modelo}/batch.
+
+Os modelos de classe única são avaliados pelos kernels vetorizados de
+models/batch.py, então um lote de milhares de cenários custa uma única
+chamada NumPy. Os modelos de prioridade usam vectorized=True e são
+avaliados cenário a cenário.
+
+Cada resultado tem a forma {"stable": bool, "metrics": {...} | None,
+"error": str | None}; cenários instáveis ou inválidos não derrubam o lote.
+
+Os modelos de classe única também têm POST /api/v1/{modelo}/sweep, que
+varre uma grade de parâmetros e devolve uma linha NDJSON por ponto, e
+M/M/c/K e M/M/c/N têm POST /api/v1/{modelo}/optimize, que busca o número de
+servidores (e, no M/M/c/K, a capacidade) de menor custo total.
+
+POST /api/v1/jackson avalia uma rede de Jackson aberta de nós M/M/c.
+
+POST /api/v1/{modelo}/inverse resolve o problema inverso para um lote de
+metas: o maior λ com W, Wq, P(Wq > t), P(W > t) ou P_block dentro da meta.
+"""
+
+import json
+import math
+from typing import Annotated, Dict, List, Literal, Optional, Union
+
+import numpy as np
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, create_model
+from starlette.concurrency import run_in_threadpool
+
+from models import batch
+from models.inverse import INVERSE_MODELS, max_arrival_rate
+from models.mg1_non_preemptive_priority import mg1_non_preemptive_priority_metrics
+from models.mg1_preemptive_priority import mg1_preemptive_priority_metrics
+from models.mm1_non_preemptive_priority import mm1_priority_non_preemptive_metrics
+from models.mm1_preemptive_priority import mm1_priority_preemptive_metrics
+from models.mmc_no_preemptive_priority import mmc_no_preemptive_priority
+from models.mmc_preemptive_priority import mmc_priority_preemptive_metrics
+from models.staffing import mmck_cost_optimization, mmcn_cost_optimization
+
+router = APIRouter(prefix="/api/v1", tags=["v1"])
+
+MAX_BATCH_SCENARIOS = 100_000
+MAX_SWEEP_POINTS = 10_000_000
+MAX_OPTIMIZE_STATES = 10_000_000
+MAX_OPTIMIZE_POINTS = 1_000_000
+
+
+class MM1Params(BaseModel):
+    arrival_rate: float = Field(ge=0, description="λ, taxa média de chegada")
+    service_rate: float = Field(gt=0, description="μ, taxa média de serviço")
+    waiting_time_w: float = Field(0.0, ge=0, description="t usado em P(W > t)")
+    waiting_time_wq: float = Field(0.0, ge=0, description="t usado em P(Wq > t)")
+
+
+class MMCParams(MM1Params):
+    num_servers: int = Field(ge=1, description="c, número de servidores")
+
+
+class MM1KParams(BaseModel):
+    arrival_rate: float = Field(gt=0, description="λ, taxa média de chegada")
+    service_rate: float = Field(gt=0, description="μ, taxa média de serviço")
+    max_capacity: int = Field(ge=1, description="K, capacidade máxima do sistema")
+
+
+class MMCKParams(MM1KParams):
+    num_servers: int = Field(ge=1, description="c, número de servidores")
+
+
+class MM1NParams(BaseModel):
+    arrival_rate: float = Field(gt=0, description="λ, taxa de chegada por cliente")
+    service_rate: float = Field(gt=0, description="μ, taxa média de serviço")
+    population_size: int = Field(ge=1, description="N, tamanho da população")
+
+
+class MMCNParams(MM1NParams):
+    num_servers: int = Field(ge=1, description="c, número de servidores")
+
+
+class MG1Params(BaseModel):
+    arrival_rate: float = Field(gt=0, description="λ, taxa média de chegada")
+    service_rate: float = Field(gt=0, description="μ, taxa média de serviço")
+    sigma_squared: float = Field(ge=0, description="σ², variância do tempo de serviço")
+
+
+class GGCParams(MG1Params):
+    num_servers: int = Field(ge=1, description="c, número de servidores")
+    arrival_scv: float = Field(1.0, ge=0, description="c_a², SCV dos intervalos entre chegadas (1 = Poisson)")
+
+
+# Valores por classe: taxas e variâncias >= 0, tempos de serviço > 0
+NonNegative = Annotated[float, Field(ge=0)]
+Positive = Annotated[float, Field(gt=0)]
+
+
+class MM1PriorityParams(BaseModel):
+    arrival_rates: List[NonNegative] = Field(min_length=1, description="λ de cada classe, da mais prioritária")
+    service_rate: float = Field(gt=0, description="μ, taxa média de serviço")
+
+
+class MMCPriorityParams(MM1PriorityParams):
+    num_servers: int = Field(ge=1, description="c, número de servidores")
+
+
+class MG1PriorityParams(BaseModel):
+    arrival_rates: List[NonNegative] = Field(min_length=1, description="λ de cada classe")
+    service_times: List[Positive] = Field(min_length=1, description="E[S] de cada classe")
+    service_variances: List[NonNegative] = Field(min_length=1, description="Var[S] de cada classe")
+
+
+class MMCKOptimizeParams(BaseModel):
+    arrival_rate: float = Field(gt=0, description="λ, taxa média de chegada")
+    service_rate: float = Field(gt=0, description="μ, taxa média de serviço")
+    max_capacity: int = Field(ge=1, description="K, capacidade máxima (maior K da busca)")
+    waiting_cost: float = Field(ge=0, description="CE, custo de espera por cliente")
+    service_cost: float = Field(ge=0, description="CA, custo por servidor")
+    blocking_cost: float = Field(0.0, ge=0, description="CB, custo por cliente bloqueado")
+    min_capacity: Optional[int] = Field(None, ge=1, description="busca K em [min_capacity, max_capacity]")
+
+
+class MMCNOptimizeParams(BaseModel):
+    arrival_rate: float = Field(gt=0, description="λ, taxa de chegada por cliente")
+    service_rate: float = Field(gt=0, description="μ, taxa média de serviço")
+    population_size: int = Field(ge=1, description="N, tamanho da população")
+    waiting_cost: float = Field(ge=0, description="CE, custo de espera por cliente")
+    service_cost: float = Field(ge=0, description="CA, custo por servidor")
+
+
+class JacksonEdge(BaseModel):
+    source: int = Field(ge=0, description="nó de origem")
+    target: int = Field(ge=0, description="nó de destino")
+    probability: float = Field(ge=0, le=1, description="P(ir de source para target)")
+
+
+class JacksonParams(BaseModel):
+    external_rates: List[float] = Field(min_length=1, max_length=MAX_BATCH_SCENARIOS, description="γ de cada nó")
+    service_rates: List[float] = Field(min_length=1, max_length=MAX_BATCH_SCENARIOS, description="μ de cada nó")
+    num_servers: List[int] = Field(min_length=1, max_length=MAX_BATCH_SCENARIOS, description="c de cada nó")
+    routing: List[JacksonEdge] = Field(default_factory=list, description="ligações; o restante sai da rede")
+
+
+class InverseResult(BaseModel):
+    feasible: bool
+    unbounded: bool
+    arrival_rate: Optional[float] = None
+    value: Optional[float] = None
+
+
+class InverseBatchResult(BaseModel):
+    model: str
+    metric: str
+    results: List[InverseResult]
+
+
+class ScenarioResult(BaseModel):
+    stable: bool
+    metrics: Optional[dict] = None
+    error: Optional[str] = None
+
+
+class ModelResult(ScenarioResult):
+    model: str
+
+
+class BatchResult(BaseModel):
+    model: str
+    results: List[ScenarioResult]
+
+
+class Range(BaseModel):
+    start: float
+    stop: float
+    num: int = Field(ge=1, le=MAX_SWEEP_POINTS, description="número de pontos, extremos inclusos")
+
+
+class SweepRequest(BaseModel):
+    fixed: Dict[str, float] = Field(default_factory=dict, description="parâmetros constantes")
+    grid: Dict[str, Union[List[float], Range]] = Field(
+        min_length=1, description="eixos da grade: lista de valores ou {start, stop, num}"
+    )
+    chunk_size: int = Field(1000, ge=1, le=MAX_BATCH_SCENARIOS)
+
+
+def _finite(values):
+    """JSON não tem NaN nem infinito: esses valores viram null."""
+    return [v if math.isfinite(v) else None for v in values]
+
+
+def _rows(columns):
+    """Converte o dict de arrays de um kernel em uma lista de resultados por cenário."""
+    stable = columns.pop("stable").tolist()
+    columns = {name: _finite(values.tolist()) for name, values in columns.items()}
+
+    results = []
+    for i, ok in enumerate(stable):
+        if ok:
+            metrics = {name: values[i] for name, values in columns.items()}
+            results.append({"stable": True, "metrics": metrics, "error": None})
+        else:
+            results.append(
+                {"stable": False, "metrics": None, "error": "Cenário inválido ou instável."}
+            )
+    return results
+
+
+def _vectorized(kernel, **fixed):
+    """Avalia todos os cenários de uma vez em um kernel de models/batch.py."""
+
+    def evaluate(scenarios):
+        fields = type(scenarios[0]).model_fields
+        arrays = {
+            name: np.array([getattr(s, name) for s in scenarios], dtype=float)
+            for name in fields
+        }
+        return _rows(kernel(**arrays, **fixed))
+
+    return evaluate
+
+
+def _per_scenario(function):
+    """Avalia os modelos de prioridade cenário a cenário, com saída vetorizada."""
+
+    def evaluate(scenarios):
+        results = []
+        for s in scenarios:
+            try:
+                metrics = function(**s.model_dump(), vectorized=True)
+            except (ValueError, IndexError, ZeroDivisionError) as e:
+                metrics = {"Erro": str(e)}
+
+            if "Erro" in metrics:
+                results.append({"stable": False, "metrics": None, "error": metrics["Erro"]})
+            else:
+                metrics = {
+                    name: _finite(np.asarray(values, dtype=float).tolist())
+                    for name, values in metrics.items()
+                }
+                results.append({"stable": True, "metrics": metrics, "error": None})
+        return results
+
+    return evaluate
+
+
+def _mmc_priority(function):
+    """Adapta os nomes dos parâmetros (s, servers) dos modelos M/M/c com prioridade."""
+    return lambda arrival_rates, service_rate, num_servers, vectorized: function(
+        arrival_rates, service_rate, num_servers, vectorized=vectorized
+    )
+
+
+# Modelos de classe única: nome na URL -> (parâmetros, kernel, argumentos fixos)
+KERNELS = {
+    "mm1": (MM1Params, batch.mm1_batch, {}),
+    "mmc": (MMCParams, batch.mmc_batch, {}),
+    "mm1k": (MM1KParams, batch.mm1k_batch, {}),
+    "mmck": (MMCKParams, batch.mmck_batch, {}),
+    "mm1n": (MM1NParams, batch.mmcn_batch, {"num_servers": 1}),
+    "mmcn": (MMCNParams, batch.mmcn_batch, {}),
+    "mg1": (MG1Params, batch.mg1_batch, {}),
+    "ggc": (GGCParams, batch.ggc_batch, {"method": "allen_cunneen"}),
+    "ggc_kingman": (GGCParams, batch.ggc_batch, {"method": "kingman"}),
+    "ggc_whitt": (GGCParams, batch.ggc_batch, {"method": "whitt"}),
+}
+
+# nome na URL -> (parâmetros, avaliador de uma lista de cenários)
+MODELS = {
+    **{
+        name: (params_model, _vectorized(kernel, **fixed))
+        for name, (params_model, kernel, fixed) in KERNELS.items()
+    },
+    "mm1_preemptive": (
+        MM1PriorityParams,
+        _per_scenario(mm1_priority_preemptive_metrics),
+    ),
+    "mm1_non_preemptive": (
+        MM1PriorityParams,
+        _per_scenario(mm1_priority_non_preemptive_metrics),
+    ),
+    "mmc_preemptive": (
+        MMCPriorityParams,
+        _per_scenario(_mmc_priority(mmc_priority_preemptive_metrics)),
+    ),
+    "mmc_no_preemptive": (
+        MMCPriorityParams,
+        _per_scenario(_mmc_priority(mmc_no_preemptive_priority)),
+    ),
+    "mg1_preemptive": (MG1PriorityParams, _per_scenario(mg1_preemptive_priority_metrics)),
+    "mg1_non_preemptive": (
+        MG1PriorityParams,
+        _per_scenario(mg1_non_preemptive_priority_metrics),
+    ),
+}
+
+
+def _add_routes(name, params_model, evaluate):
+    batch_model = create_model(
+        f"{params_model.__name__}Batch",
+        scenarios=(List[params_model], Field(min_length=1, max_length=MAX_BATCH_SCENARIOS)),
+    )
+
+    async def single(params: params_model):
+        (result,) = await run_in_threadpool(evaluate, [params])
+        return {"model": name, **result}
+
+    async def many(body: batch_model):
+        results = await run_in_threadpool(evaluate, body.scenarios)
+        return {"model": name, "results": results}
+
+    router.add_api_route(
+        f"/{name}", single, methods=["POST"], response_model=ModelResult, name=f"{name}"
+    )
+    router.add_api_route(
+        f"/{name}/batch", many, methods=["POST"], response_model=BatchResult, name=f"{name}_batch"
+    )
+
+
+for _name, (_params_model, _evaluate) in MODELS.items():
+    _add_routes(_name, _params_model, _evaluate)
+
+
+def _sweep_lines(kernel, constants, axes, chunk_size):
+    """
+    Linhas NDJSON do produto cartesiano dos eixos, avaliadas em blocos.
+
+    Os pontos de cada bloco saem de np.unravel_index sobre um intervalo de
+    índices, então a grade completa nunca é materializada.
+    """
+    names = list(axes)
+    shape = tuple(len(axes[name]) for name in names)
+    total = math.prod(shape)
+
+    for begin in range(0, total, chunk_size):
+        index = np.unravel_index(np.arange(begin, min(begin + chunk_size, total)), shape)
+        arrays = {name: axes[name][i] for name, i in zip(names, index)}
+        rows = _rows(kernel(**constants, **arrays))
+        points = {name: values.tolist() for name, values in arrays.items()}
+
+        lines = []
+        for j, row in enumerate(rows):
+            row = {"params": {name: values[j] for name, values in points.items()}, **row}
+            lines.append(json.dumps(row, ensure_ascii=False))
+        yield "\n".join(lines) + "\n"
+
+
+def _axis_adapter(field):
+    """Validador de uma lista de valores com o tipo e as restrições do campo (ge, gt, int)."""
+    item = Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+    return TypeAdapter(List[item])
+
+
+def _add_sweep_route(name, params_model, kernel, fixed):
+    fields = params_model.model_fields
+    adapters = {field: _axis_adapter(info) for field, info in fields.items()}
+
+    async def sweep(body: SweepRequest):
+        unknown = (set(body.fixed) | set(body.grid)) - set(fields)
+        if unknown:
+            raise HTTPException(422, f"Parâmetros desconhecidos: {', '.join(sorted(unknown))}")
+        repeated = set(body.fixed) & set(body.grid)
+        if repeated:
+            raise HTTPException(422, f"Parâmetros em fixed e grid: {', '.join(sorted(repeated))}")
+
+        axes = {
+            axis: np.asarray(
+                values if isinstance(values, list) else np.linspace(values.start, values.stop, values.num),
+                dtype=float,
+            )
+            for axis, values in body.grid.items()
+        }
+        if any(len(values) == 0 for values in axes.values()):
+            raise HTTPException(422, "Todos os eixos da grade precisam de ao menos um valor.")
+        if math.prod(len(values) for values in axes.values()) > MAX_SWEEP_POINTS:
+            raise HTTPException(422, f"A grade excede {MAX_SWEEP_POINTS} pontos.")
+
+        # Cada valor de cada eixo passa pelas restrições do campo (c = 2.5 ou
+        # K = 0 recusam a requisição inteira, não viram linhas da grade)
+        for axis, values in axes.items():
+            try:
+                axes[axis] = np.asarray(adapters[axis].validate_python(values.tolist()), dtype=float)
+            except ValidationError as e:
+                errors = json.loads(e.json())
+                for error in errors:
+                    error["loc"] = ["grid", axis, *error["loc"]]
+                raise HTTPException(422, errors)
+
+        # Os parâmetros fixos são validados junto com o primeiro ponto da grade
+        try:
+            first = params_model.model_validate(
+                {**body.fixed, **{axis: values[0] for axis, values in axes.items()}}
+            )
+        except ValidationError as e:
+            raise HTTPException(422, json.loads(e.json()))
+
+        constants = {field: float(getattr(first, field)) for field in fields if field not in axes}
+        return StreamingResponse(
+            _sweep_lines(kernel, {**constants, **fixed}, axes, body.chunk_size),
+            media_type="application/x-ndjson",
+        )
+
+    router.add_api_route(f"/{name}/sweep", sweep, methods=["POST"], name=f"{name}_sweep")
+
+
+for _name, (_params_model, _kernel, _fixed) in KERNELS.items():
+    _add_sweep_route(_name, _params_model, _kernel, _fixed)
+
+
+# nome na URL -> (parâmetros, busca, (estados por c, pontos (c, K) por c)). Cada c
+# da busca percorre uma cadeia com max K + 1 estados e avalia um ponto por
+# capacidade; a função também recebe os limites e para se a busca os excede.
+OPTIMIZERS = {
+    "mmck": (
+        MMCKOptimizeParams,
+        mmck_cost_optimization,
+        lambda p: (p.max_capacity + 1, p.max_capacity - (p.min_capacity or p.max_capacity) + 1),
+    ),
+    "mmcn": (MMCNOptimizeParams, mmcn_cost_optimization, lambda p: (p.population_size + 1, 1)),
+}
+
+
+def _add_optimize_route(name, params_model, function, size):
+    async def optimize(params: params_model):
+        states, points = size(params)
+        if states > MAX_OPTIMIZE_STATES:
+            raise HTTPException(422, f"A busca excede {MAX_OPTIMIZE_STATES} estados.")
+        if points > MAX_OPTIMIZE_POINTS:
+            raise HTTPException(422, f"A busca excede {MAX_OPTIMIZE_POINTS} capacidades.")
+
+        metrics = await run_in_threadpool(
+            function, **params.model_dump(), max_states=MAX_OPTIMIZE_STATES, max_points=MAX_OPTIMIZE_POINTS
+        )
+        if "Erro" in metrics:
+            return {"model": name, "stable": False, "metrics": None, "error": metrics["Erro"]}
+        return {"model": name, "stable": True, "metrics": metrics, "error": None}
+
+    router.add_api_route(
+        f"/{name}/optimize", optimize, methods=["POST"], response_model=ModelResult, name=f"{name}_optimize"
+    )
+
+
+for _name, (_params_model, _function, _states) in OPTIMIZERS.items():
+    _add_optimize_route(_name, _params_model, _function, _states)
+
+
+def _add_inverse_route(name, params_model):
+    fields = {
+        field: (info.annotation, info)
+        for field, info in params_model.model_fields.items()
+        if field != "arrival_rate"
+    }
+    target_model = create_model(
+        f"{params_model.__name__}Target",
+        bound=(float, Field(description="meta: a métrica deve ficar <= bound")),
+        **fields,
+    )
+    request_model = create_model(
+        f"{params_model.__name__}Inverse",
+        metric=(Literal["W", "Wq", "P_Wq_gt_t", "P_W_gt_t", "P_block"], ...),
+        targets=(List[target_model], Field(min_length=1, max_length=MAX_BATCH_SCENARIOS)),
+    )
+
+    def solve(body):
+        columns = {
+            field: np.array([getattr(t, field) for t in body.targets], dtype=float)
+            for field in target_model.model_fields
+        }
+        columns = max_arrival_rate(name, body.metric, **columns)
+        arrival_rate = columns["arrival_rate"].tolist()
+        value = _finite(columns["value"].tolist())
+        return [
+            {
+                "feasible": feasible,
+                "unbounded": unbounded,
+                "arrival_rate": rate if feasible and not unbounded else None,
+                "value": value[i],
+            }
+            for i, (feasible, unbounded, rate) in enumerate(
+                zip(columns["feasible"].tolist(), columns["unbounded"].tolist(), arrival_rate)
+            )
+        ]
+
+    async def inverse(body: request_model):
+        try:
+            results = await run_in_threadpool(solve, body)
+        except ValueError as e:
+            raise HTTPException(422, str(e))
+        return {"model": name, "metric": body.metric, "results": results}
+
+    router.add_api_route(
+        f"/{name}/inverse",
+        inverse,
+        methods=["POST"],
+        response_model=InverseBatchResult,
+        name=f"{name}_inverse",
+    )
+
+
+for _name in INVERSE_MODELS:
+    _add_inverse_route(_name, KERNELS[_name][0])
+
+
+def _jackson(params):
+    # O SciPy (solve esparso das equações de tráfego) só é importado aqui
+    from models.jackson_network import jackson_network_metrics, routing_matrix
+
+    num_nodes = len(params.external_rates)
+    if any(edge.source >= num_nodes or edge.target >= num_nodes for edge in params.routing):
+        return {"Erro": f"As ligações devem usar nós de 0 a {num_nodes - 1}."}
+    routing = routing_matrix(
+        [(edge.source, edge.target, edge.probability) for edge in params.routing], num_nodes
+    )
+    return jackson_network_metrics(params.external_rates, routing, params.service_rates, params.num_servers)
+
+
+@router.post("/jackson", response_model=ModelResult, name="jackson")
+async def jackson(params: JacksonParams):
+    metrics = await run_in_threadpool(_jackson, params)
+    if "Erro" in metrics:
+        return {"model": "jackson", "stable": False, "metrics": None, "error": metrics["Erro"]}
+    return {"model": "jackson", "stable": True, "metrics": metrics, "error": None}
+
+
+@router.get("/models")
+async def list_models():
+    return {name: params.model_json_schema() for name, (params, _) in MODELS.items()}
@@ -1,39 +1,120 @@
-from flask import Flask, render_template
-from routes.mm1 import bp as mm1_bp
-from routes.mmc import bp as mmc_bp
-from routes.mm1k import bp as mm1k_bp
-from routes.mmck import bp as mmck_bp
-from routes.mm1n import bp as mm1n_bp
-from routes.mmcn import bp as mmcn_bp
-from routes.mg1 import bp as mg1_bp
-from routes.mm1_preemptive import bp as mm1_preemptive_bp
-from routes.mm1_non_preemptive import bp as mm1n_non_preemptive_bp
-from routes.mmc_preemptive import bp as mmc_preemptive_bp
-from routes.mmc_no_preemptive import bp as mmc_no_preemptive_bp
-from routes.help import bp as help_bp
-from routes.formulas import bp as formulas_bp
-
-app = Flask(__name__)
-app.config["SECRET_KEY"] = "dev-key"
-
-app.register_blueprint(mm1_bp)
-app.register_blueprint(mmc_bp)
-app.register_blueprint(mm1k_bp)
-app.register_blueprint(mmck_bp)
-app.register_blueprint(mm1n_bp)
-app.register_blueprint(mmcn_bp)
-app.register_blueprint(mg1_bp)
-app.register_blueprint(mm1_preemptive_bp)
-app.register_blueprint(mm1n_non_preemptive_bp)
-app.register_blueprint(mmc_preemptive_bp)
-app.register_blueprint(mmc_no_preemptive_bp)
-app.register_blueprint(help_bp)
-app.register_blueprint(formulas_bp)
-
-
-@app.route("/")
-def index():
-    return render_template("index.html")
+import functools
+import importlib
+import logging
+import time
+
+from flask import Flask, jsonify, render_template
+
+from routes.metrics import init_metrics
+
+logger = logging.getLogger(__name__)
+
+# Blueprints de routes/: nome (módulo e prefixo da URL) -> [(regra, view, métodos)].
+# Com lazy=True as regras são registradas com os mesmos endpoints
+# ("mmc.index", ...), mas o módulo da rota (e os modelos que ele importa)
+# só é importado no primeiro request ao seu prefixo.
+BLUEPRINTS = {
+    "mm1": [("/", "index", ["GET", "POST"])],
+    "mmc": [("/", "index", ["GET", "POST"]), ("/staffing", "staffing", ["GET", "POST"])],
+    "mm1k": [("/", "index", ["GET", "POST"])],
+    "mmck": [("/", "index", ["GET", "POST"])],
+    "mm1n": [("/", "index", ["GET", "POST"])],
+    "mmcn": [("/", "index", ["GET", "POST"])],
+    "mg1": [("/", "index", ["GET", "POST"])],
+    "mm1_preemptive": [("/", "index", ["GET", "POST"])],
+    "mm1_non_preemptive": [("/", "index", ["GET", "POST"])],
+    "mmc_preemptive": [("/", "index", ["GET", "POST"])],
+    "mmc_no_preemptive": [("/", "index", ["GET", "POST"])],
+    "mva": [("/", "index", ["GET", "POST"])],
+    "help": [("/", "index", ["GET"])],
+    "formulas": [("/", "index", ["GET"])],
+}
+
+
+def _lazy_module(app, name):
+    """Importa routes.<name> uma única vez e registra o tempo de importação."""
+
+    @functools.lru_cache(maxsize=None)
+    def load():
+        start = time.perf_counter()
+        module = importlib.import_module(f"routes.{name}")
+        elapsed = time.perf_counter() - start
+        app.extensions["startup_report"]["lazy_imports"][name] = elapsed
+        logger.info("Rotas de /%s carregadas em %.1f ms", name, elapsed * 1000)
+        return module
+
+    return load
+
+
+def _lazy_view(load, function):
+    def view(**kwargs):
+        return getattr(load(), function)(**kwargs)
+
+    view.__name__ = function
+    return view
+
+
+def create_app(lazy=True):
+    """
+    Cria a aplicação Flask.
+
+    Parâmetros:
+        lazy (bool): se True (padrão), os módulos de routes/ e models/ só são
+            importados no primeiro request ao prefixo correspondente; se False,
+            todos os blueprints são importados e registrados na criação.
+
+    O relatório de inicialização (tempo de criação, rotas registradas e
+    importações adiadas já feitas) fica em app.extensions["startup_report"]
+    e em /startup. Os tempos por request (parse, compute, render) ficam em
+    /metrics, no formato do Prometheus.
+    """
+    start = time.perf_counter()
+    app = Flask(__name__)
+    app.config["SECRET_KEY"] = "dev-key"
+    report = {"lazy": lazy, "blueprints": len(BLUEPRINTS), "lazy_imports": {}}
+    app.extensions["startup_report"] = report
+    init_metrics(app)
+
+    for name, rules in BLUEPRINTS.items():
+        if lazy:
+            load = _lazy_module(app, name)
+            for rule, function, methods in rules:
+                app.add_url_rule(
+                    f"/{name}{rule}",
+                    endpoint=f"{name}.{function}",
+                    view_func=_lazy_view(load, function),
+                    methods=methods,
+                )
+        else:
+            app.register_blueprint(importlib.import_module(f"routes.{name}").bp)
+
+    @app.route("/")
+    def index():
+        return render_template("index.html")
+
+    @app.route("/cache/stats")
+    def cache_stats():
+        from models.erlang import erlang_cache_info
+        from routes.result_cache import result_cache_info
+
+        return jsonify(routes=result_cache_info(), erlang=erlang_cache_info())
+
+    @app.route("/startup")
+    def startup():
+        return jsonify(report)
+
+    report["rules"] = len(list(app.url_map.iter_rules()))
+    report["create_app_seconds"] = time.perf_counter() - start
+    logger.info(
+        "create_app: %d rotas em %.1f ms (lazy=%s)",
+        report["rules"],
+        report["create_app_seconds"] * 1000,
+        lazy,
+    )
+    return app
+
+
+app = create_app()
 
 
 if __name__ == "__main__":
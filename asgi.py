@@ -0,0 +1,53 @@
+"""
+Aplicação ASGI de produção (Procfile): /api/... vai para o FastAPI de
+api/v1.py e o resto para as páginas do Flask, no mesmo processo.
+
+Como as rotas do create_app(lazy=True), o FastAPI e api/v1.py (com os
+modelos, o NumPy e o SciPy que eles importam) só são carregados no primeiro
+request a /api; subir o processo e servir as páginas HTML não paga por eles.
+"""
+
+import functools
+
+from a2wsgi import WSGIMiddleware
+
+from app import app as flask_app
+
+API_PREFIX = "/api"
+
+flask_asgi = WSGIMiddleware(flask_app)
+
+
+@functools.lru_cache(maxsize=None)
+def api_app():
+    """Cria o FastAPI com o router v1 no primeiro uso."""
+    from fastapi import FastAPI
+
+    from api.v1 import router as api_v1_router
+
+    api = FastAPI(title="Teoria das Filas", docs_url="/api/docs", openapi_url="/api/openapi.json")
+    api.include_router(api_v1_router)
+    return api
+
+
+async def _lifespan(receive, send):
+    # Nada a iniciar nem encerrar: o FastAPI só é criado no primeiro request a /api
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+
+    path = scope.get("path", "")
+    if path == API_PREFIX or path.startswith(API_PREFIX + "/"):
+        await api_app()(scope, receive, send)
+    else:
+        await flask_asgi(scope, receive, send)
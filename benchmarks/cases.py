@@ -0,0 +1,152 @@
+"""
+Casos do benchmark: as 13 funções de models/ em tamanhos small/medium/huge
+(c, K, N ou número de classes), a MVA exata conferida contra a M/M/c/N e um
+POST por blueprint via test client.
+
+Cada caso é (nome, tamanho, função sem argumentos). Os caches (Erlang e de
+resultados das rotas) são esvaziados a cada chamada, para medir o cálculo
+e não o acerto de cache.
+"""
+
+import math
+
+from models.closed_network import EXACT_MAX_POPULATION, mva_metrics
+from models.erlang import erlang_cache_clear
+from models.mg1_non_preemptive_priority import mg1_non_preemptive_priority_metrics
+from models.mg1_preemptive_priority import mg1_preemptive_priority_metrics
+from models.mg1_queue import mg1_queue_metrics
+from models.mm1_non_preemptive_priority import mm1_priority_non_preemptive_metrics
+from models.mm1_preemptive_priority import mm1_priority_preemptive_metrics
+from models.mm1_queue import mm1_queue_metrics
+from models.mm1k_queue import mm1k_queue_metrics
+from models.mm1n_queue import mm1n_queue_metrics
+from models.mmc_no_preemptive_priority import mmc_no_preemptive_priority
+from models.mmc_preemptive_priority import mmc_priority_preemptive_metrics
+from models.mmc_queue import mmc_queue_metrics
+from models.mmck_queue import mmc_k_queue_metrics
+from models.mmcn_queue import mmcn_queue_metrics
+from routes.result_cache import result_cache_clear
+
+SIZES = {"small": 10, "medium": 1_000, "huge": 100_000}
+
+
+def _uncached(function, *args):
+    def run():
+        erlang_cache_clear()
+        return function(*args)
+
+    return run
+
+
+def _classes(size, load=0.9):
+    """size classes com taxas iguais e utilização total load (μ = 1)."""
+    return [load / size] * size
+
+
+def _checked_mva(size):
+    """
+    MVA exata de uma estação com c servidores e reflexão Z = 10: é a M/M/c/N
+    com λ = 1/Z por cliente, então Q tem de bater com o L de mmcn_queue_metrics.
+    """
+    population_size = min(size, EXACT_MAX_POPULATION)
+    c = max(1, population_size // 10)
+
+    def run():
+        mva = mva_metrics(population_size, [1.0], num_servers=[c], think_time=10.0, method="exact")
+        expected = mmcn_queue_metrics(0.1, 1.0, c, population_size, 0.0, 0.0)["Número Médio no Sistema (L)"]
+        Q = mva["Número Médio por Estação (Q)"][0]
+        if not math.isclose(Q, expected, rel_tol=1e-9):
+            raise RuntimeError(f"MVA exata com N={population_size}, c={c}: Q = {Q}, M/M/c/N dá L = {expected}")
+        return mva
+
+    return run
+
+
+def model_cases():
+    cases = []
+    for size_name, size in SIZES.items():
+        # Mantém ρ = 0.9 com c servidores e μ = 1
+        c = size
+        cases += [
+            ("mm1_queue_metrics", size_name, _uncached(mm1_queue_metrics, 0.9, 1.0, 1.0, 1.0, size)),
+            ("mmc_queue_metrics", size_name, _uncached(mmc_queue_metrics, 0.9 * c, 1.0, c, 1.0, 1.0, size)),
+            ("mm1k_queue_metrics", size_name, _uncached(mm1k_queue_metrics, 0.9, 1.0, size, 1.0, 1.0, 1)),
+            ("mmc_k_queue_metrics", size_name, _uncached(mmc_k_queue_metrics, 9.0, 1.0, 10, max(10, size), 1.0, 1.0, 1)),
+            ("mm1n_queue_metrics", size_name, _uncached(mm1n_queue_metrics, 0.5 / size, 1.0, size, 1.0, 1.0)),
+            ("mmcn_queue_metrics", size_name, _uncached(mmcn_queue_metrics, 0.01, 1.0, max(1, size // 100), size, 1.0, 1.0)),
+            (
+                "mm1_priority_preemptive_metrics",
+                size_name,
+                _uncached(mm1_priority_preemptive_metrics, _classes(size), 1.0),
+            ),
+            (
+                "mm1_priority_non_preemptive_metrics",
+                size_name,
+                _uncached(mm1_priority_non_preemptive_metrics, _classes(size), 1.0),
+            ),
+            (
+                "mmc_priority_preemptive_metrics",
+                size_name,
+                _uncached(mmc_priority_preemptive_metrics, _classes(size, 1.8), 1.0, 2),
+            ),
+            (
+                "mmc_no_preemptive_priority",
+                size_name,
+                _uncached(mmc_no_preemptive_priority, _classes(size, 1.8), 1.0, 2),
+            ),
+            (
+                "mg1_preemptive_priority_metrics",
+                size_name,
+                _uncached(mg1_preemptive_priority_metrics, _classes(size), [1.0] * size, [0.5] * size),
+            ),
+            (
+                "mg1_non_preemptive_priority_metrics",
+                size_name,
+                _uncached(mg1_non_preemptive_priority_metrics, _classes(size), [1.0] * size, [0.5] * size),
+            ),
+            ("mva_metrics", size_name, _checked_mva(size)),
+        ]
+    # O M/G/1 não tem parâmetro de tamanho
+    cases.append(("mg1_queue_metrics", "small", _uncached(mg1_queue_metrics, 0.9, 1.0, 0.5)))
+    return cases
+
+
+# Um POST por blueprint, com os parâmetros padrão das páginas
+ROUTE_CASES = {
+    "/mm1/": {"lambda": "2", "mu": "3", "t_w": "1", "t_wq": "1", "n": "20"},
+    "/mmc/": {"lambda": "2", "mu": "1", "c": "3", "t_w": "1", "t_wq": "1", "n": "20"},
+    "/mmc/staffing": {"mode": "mmc", "lambda": "50", "mu": "1", "max_wq": "0.1"},
+    "/mm1k/": {"lambda": "2", "mu": "3", "K": "10", "CE": "1", "CA": "1", "n": "2"},
+    "/mmck/": {"lambda": "2", "mu": "1", "c": "3", "K": "10", "CE": "1", "CA": "1", "n": "2"},
+    "/mm1n/": {"lambda": "0.1", "mu": "1", "N": "10", "CE": "1", "CA": "1"},
+    "/mmcn/": {"lambda": "0.1", "mu": "1", "s": "2", "N": "10", "CE": "1", "CA": "1"},
+    "/mg1/": {"mode": "mg1", "lambda": "2", "mu": "3", "sigma2": "0.1"},
+    "/mm1_preemptive/": {"lambda[]": ["1", "0.5"], "mu": "3"},
+    "/mm1_non_preemptive/": {"lambda[]": ["1", "0.5"], "mu": "3"},
+    "/mmc_preemptive/": {"lambda[]": ["1", "0.5"], "mu": "1", "servers": "2"},
+    "/mmc_no_preemptive/": {"lambda[]": ["1", "0.5"], "mu": "1", "servers": "2"},
+    "/mva/": {"N": "20", "Z": "1", "method": "exact", "S[]": ["0.05", "0.03"], "V[]": ["1", "2"], "c[]": ["1", "2"]},
+    "/help/": None,
+    "/formulas/": None,
+}
+
+
+def route_cases():
+    from app import create_app
+
+    client = create_app().test_client()
+    cases = []
+    for url, data in ROUTE_CASES.items():
+
+        def run(url=url, data=data):
+            erlang_cache_clear()
+            result_cache_clear()
+            response = client.post(url, data=data) if data is not None else client.get(url)
+            if response.status_code != 200:
+                raise RuntimeError(f"{url} respondeu {response.status_code}")
+            return response
+
+        # Primeiro request fora da medição: importa o módulo da rota (lazy)
+        run()
+        cases.append((f"route {url}", "request", run))
+    return cases
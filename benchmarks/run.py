@@ -0,0 +1,116 @@
+"""
+Roda o benchmark, grava os tempos em JSON e compara com uma linha de base.
+
+    python -m benchmarks.run --output benchmarks/baseline.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --threshold 0.25
+
+Sai com código 1 quando algum caso fica mais lento que a linha de base por
+mais que threshold (0.25 = 25%).
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+from benchmarks.cases import SIZES, model_cases, route_cases
+
+
+def _measure(run, repeat, min_time):
+    """
+    Melhor e mediana do tempo por chamada em repeat rodadas.
+
+    Cada rodada repete a chamada até somar min_time segundos, como o
+    autorange do timeit, para que funções de microssegundos sejam medidas.
+    """
+    start = time.perf_counter()
+    run()
+    loops = max(1, int(min_time / max(time.perf_counter() - start, 1e-9)))
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        times.append((time.perf_counter() - start) / loops)
+    return {"best": min(times), "median": statistics.median(times), "loops": loops}
+
+
+def run_benchmarks(sizes, repeat=5, min_time=0.05, pattern=None, routes=True):
+    cases = [case for case in model_cases() if case[1] in sizes]
+    if routes:
+        cases += route_cases()
+
+    results = {}
+    for name, size, run in cases:
+        key = f"{name}[{size}]"
+        if pattern and pattern not in key:
+            continue
+        results[key] = _measure(run, repeat, min_time)
+        print(f"{key:55s} {results[key]['best'] * 1e3:12.4f} ms", flush=True)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Lista de (caso, razão novo/base) que passaram do limite."""
+    regressions = []
+    for key, timing in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        ratio = timing["best"] / base["best"]
+        flag = "REGRESSÃO" if ratio > 1 + threshold else ""
+        print(f"{key:55s} {ratio:8.2f}x {flag}")
+        if flag:
+            regressions.append((key, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark dos modelos e rotas.")
+    parser.add_argument("--output", help="grava os resultados neste JSON")
+    parser.add_argument("--baseline", help="compara com este JSON")
+    parser.add_argument("--threshold", type=float, default=0.25, help="tolerância relativa (padrão 0.25)")
+    parser.add_argument("--sizes", default=",".join(SIZES), help="tamanhos, ex.: small,medium")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="segundos por rodada")
+    parser.add_argument("--filter", help="só casos cujo nome contém este texto")
+    parser.add_argument("--no-routes", action="store_true", help="pula as rotas")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.sizes.split(","),
+        repeat=args.repeat,
+        min_time=args.min_time,
+        pattern=args.filter,
+        routes=not args.no_routes,
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.platform(),
+                    "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "results": results,
+                },
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} caso(s) acima de {args.threshold:.0%} da linha de base.")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
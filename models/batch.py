@@ -0,0 +1,403 @@
+"""
+Versões vetorizadas (NumPy) dos modelos de classe única.
+
+Cada função aceita escalares ou arrays com broadcasting para λ, μ, c, K, N,
+σ² e t, e retorna um dicionário de arrays (um array por métrica) em vez de
+um dicionário por cenário. Cenários inválidos ou instáveis não geram um
+dicionário "Erro": ficam marcados como False na máscara "stable" e suas
+métricas valem NaN.
+"""
+
+import math
+
+import numpy as np
+
+
+def _broadcast(*values):
+    return [np.asarray(v, dtype=float) for v in np.broadcast_arrays(*values)]
+
+
+def _masked(stable, **metrics):
+    results = {name: np.where(stable, value, np.nan) for name, value in metrics.items()}
+    results["stable"] = stable
+    return results
+
+
+def mm1_batch(arrival_rate, service_rate, waiting_time_w=0.0, waiting_time_wq=0.0):
+    """
+    M/M/1 vetorizado.
+
+    Retorna arrays: rho, P0, L, Lq, W, Wq, P_W_gt_t, P_Wq_gt_t e a máscara stable.
+    """
+    lam, mu, t_w, t_wq = _broadcast(
+        arrival_rate, service_rate, waiting_time_w, waiting_time_wq
+    )
+    stable = (lam >= 0) & (mu > lam) & (t_w >= 0) & (t_wq >= 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rho = lam / mu
+        L = rho / (1 - rho)
+        Lq = rho**2 / (1 - rho)
+        W = 1 / (mu - lam)
+        Wq = rho / (mu - lam)
+        P_W = np.exp(-(mu - lam) * t_w)
+        P_Wq = rho * np.exp(-(mu - lam) * t_wq)
+
+    return _masked(
+        stable,
+        rho=rho,
+        P0=1 - rho,
+        L=L,
+        Lq=Lq,
+        W=W,
+        Wq=Wq,
+        P_W_gt_t=P_W,
+        P_Wq_gt_t=P_Wq,
+    )
+
+
+def _log_factorial(values):
+    """log(n!) elemento a elemento, avaliando math.lgamma só nos valores distintos."""
+    unique, inverse = np.unique(values, return_inverse=True)
+    logs = np.array([math.lgamma(v + 1) for v in unique])
+    return logs[inverse].reshape(values.shape)
+
+
+def _erlang_b(offered_load, num_servers):
+    """
+    Erlang B vetorizado pela recorrência de models/erlang.py.
+
+    O laço vai até max(c); cada elemento para de ser atualizado em seu próprio c.
+    """
+    b = np.ones_like(offered_load)
+    ab = np.empty_like(offered_load)
+    for k in range(1, int(num_servers.max(initial=0)) + 1):
+        np.multiply(offered_load, b, out=ab)
+        np.divide(ab, ab + k, out=b, where=k <= num_servers)
+    return b
+
+
+def _erlang_c(offered_load, num_servers):
+    """Erlang C vetorizado, C = B / (1 - ρ·(1 - B)), a partir de _erlang_b."""
+    b = _erlang_b(offered_load, num_servers)
+    return b / (1 - offered_load / num_servers * (1 - b))
+
+
+def mmc_batch(
+    arrival_rate, service_rate, num_servers, waiting_time_w=0.0, waiting_time_wq=0.0
+):
+    """
+    M/M/c vetorizado, sem fatoriais (Erlang B/C por recorrência).
+
+    Retorna arrays: rho, P0, P_queue, L, Lq, W, Wq, P_W_gt_t, P_Wq_gt_t e stable.
+    """
+    lam, mu, c, t_w, t_wq = _broadcast(
+        arrival_rate, service_rate, num_servers, waiting_time_w, waiting_time_wq
+    )
+    # c é truncado antes do teste de estabilidade: c = 2.5 vale como 2 servidores
+    c = np.floor(c)
+    stable = (lam >= 0) & (mu > 0) & (c >= 1) & (lam < c * mu) & (t_w >= 0) & (t_wq >= 0)
+    c = np.where(stable, c, 1)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        a = lam / mu
+        rho = a / c
+        B = _erlang_b(np.where(stable, a, 0.0), c)
+        log_term = c * np.log(a) - _log_factorial(c)
+        P_queue = B / (1 - rho * (1 - B))
+
+        # 1/P0 = S·(1 - B + B/(1 - ρ)), com S = Σ_{n<=c} a^n/n! = (a^c/c!)/B.
+        # Quando B cai em underflow (c >> a), S é e^a com precisão de máquina.
+        log_S = np.where(B > np.finfo(float).tiny, log_term - np.log(B), a)
+        P0 = np.exp(-log_S) / (1 - B + B / (1 - rho))
+
+        Lq = P_queue * rho / (1 - rho)
+        Wq = P_queue / (c * mu - lam)
+        W = Wq + 1 / mu
+        L = Lq + a
+
+        den = c - 1 - a
+        bracket = np.where(
+            den == 0, mu * t_w, -np.expm1(-mu * t_w * den) / den
+        )
+        P_W = np.exp(-mu * t_w) * (1 + P_queue * bracket)
+        P_Wq = P_queue * np.exp(-(c * mu - lam) * t_wq)
+
+    return _masked(
+        stable,
+        rho=rho,
+        P0=P0,
+        P_queue=P_queue,
+        L=L,
+        Lq=Lq,
+        W=W,
+        Wq=Wq,
+        P_W_gt_t=P_W,
+        P_Wq_gt_t=P_Wq,
+    )
+
+
+# Limite de (K+1)·|log ρ| para a série de L no M/M/1/K: o termo desprezado
+# da série e o cancelamento da fórmula fechada ficam ambos perto de 1e-14
+_MM1K_SERIES_LIMIT = 1e-2
+
+
+def mm1k_batch(arrival_rate, service_rate, max_capacity):
+    """
+    M/M/1/K vetorizado, estável também para ρ = 1 e ρ > 1.
+
+    Retorna arrays: rho, P0, P_block, lambda_eff, L, Lq, W, Wq e stable.
+    """
+    lam, mu, K = _broadcast(arrival_rate, service_rate, max_capacity)
+    stable = (lam > 0) & (mu > 0) & (K >= 1)
+    K = np.where(stable, np.floor(K), 1)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        rho = lam / mu
+        one = rho == 1
+        high = rho > 1
+        # Para ρ > 1 usa-se σ = 1/ρ, o que evita calcular ρ^(K+1)
+        sigma = np.where(high, 1 / rho, rho)
+        geo = -np.expm1((K + 1) * np.log(sigma))  # 1 - σ^(K+1)
+
+        P0 = np.where(
+            one,
+            1 / (K + 1),
+            np.where(high, (rho - 1) * np.exp((K + 1) * np.log(sigma)) / geo, (1 - rho) / geo),
+        )
+        P_block = np.where(
+            one,
+            1 / (K + 1),
+            np.where(high, (1 - sigma) / geo, (1 - rho) * np.exp(K * np.log(rho)) / geo),
+        )
+
+        # Perto de ρ = 1 as duas parcelas da fórmula fechada de L são da ordem
+        # de 1/(1 - ρ) e se cancelam; com h = log ρ e (K+1)·|h| pequeno, usa-se
+        # a série L = K/2 + h·(n² - 1)/12 - h³·(n² - 1)(n² + 1)/720, n = K + 1
+        h = np.log(rho)
+        n2 = (K + 1) ** 2
+        near_one = np.abs((K + 1) * h) < _MM1K_SERIES_LIMIT
+        L = np.where(
+            near_one,
+            K / 2 + h * (n2 - 1) / 12 - h**3 * (n2 - 1) * (n2 + 1) / 720,
+            np.where(
+                high,
+                rho / (1 - rho) + (K + 1) / geo,
+                rho / (1 - rho) - (K + 1) * np.exp((K + 1) * np.log(rho)) / geo,
+            ),
+        )
+        lambda_eff = lam * (1 - P_block)
+        Lq = L - (1 - P0)
+        W = L / lambda_eff
+        Wq = Lq / lambda_eff
+
+    return _masked(
+        stable,
+        rho=rho,
+        P0=P0,
+        P_block=P_block,
+        lambda_eff=lambda_eff,
+        L=L,
+        Lq=Lq,
+        W=W,
+        Wq=Wq,
+    )
+
+
+# Elementos (cenários × estados) por bloco do _birth_death_batch
+_BIRTH_DEATH_BLOCK_TERMS = 1_000_000
+
+
+def _birth_death_batch(log_ratio, num_servers, last_state):
+    """
+    Normaliza em log-space uma cadeia nascimento-morte vetorizada.
+
+    log_ratio(n) devolve log(P_n / P_{n-1}) para um array n de estados no
+    último eixo (os parâmetros do chamador ganham esse eixo com [..., None]).
+    Os estados até max(last_state) são percorridos em blocos: dentro de cada
+    bloco os pesos saem de uma soma cumulativa, e as somas são reescaladas
+    pelo maior termo visto, como em models.birth_death. Retorna P0, P_last,
+    E[N] e E[min(N, c)].
+    """
+    shape = num_servers.shape
+    log_w = np.zeros(shape)
+    log_max = np.zeros(shape)
+    total = np.ones(shape)
+    mean = np.zeros(shape)
+    busy = np.zeros(shape)
+
+    last = int(last_state.max(initial=0))
+    block = max(1, _BIRTH_DEATH_BLOCK_TERMS // max(1, num_servers.size))
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for start in range(1, last + 1, block):
+            n = np.arange(start, min(start + block, last + 1), dtype=float)
+            active = n <= last_state[..., None]
+            # Depois de last_state a razão vale 1 (log 0): o último peso se mantém
+            terms = log_w[..., None] + np.cumsum(np.where(active, log_ratio(n), 0.0), axis=-1)
+            new_max = np.maximum(log_max, np.where(active, terms, -np.inf).max(axis=-1))
+            w = np.where(active, np.exp(terms - new_max[..., None]), 0.0)
+            scale = np.exp(log_max - new_max)
+            total = total * scale + w.sum(axis=-1)
+            mean = mean * scale + w @ n
+            busy = busy * scale + (w * np.minimum(n, num_servers[..., None])).sum(axis=-1)
+            log_w = terms[..., -1]
+            log_max = new_max
+
+        P0 = np.exp(-log_max) / total
+        P_last = np.exp(log_w - log_max) / total
+    return P0, P_last, mean / total, busy / total
+
+
+def mmck_batch(arrival_rate, service_rate, num_servers, max_capacity):
+    """
+    M/M/c/K vetorizado por recorrência de razões com normalização em log-space.
+
+    Retorna arrays: rho, P0, P_block, lambda_eff, L, Lq, W, Wq, busy_servers e stable.
+    """
+    lam, mu, c, K = _broadcast(arrival_rate, service_rate, num_servers, max_capacity)
+    stable = (lam > 0) & (mu > 0) & (c >= 1) & (K >= 1)
+    c = np.where(stable, np.floor(c), 1)
+    K = np.where(stable, np.floor(K), 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_a = np.log(lam / mu)
+        P0, P_block, L, busy = _birth_death_batch(
+            lambda n: log_a[..., None] - np.log(np.minimum(n, c[..., None])), c, K
+        )
+        lambda_eff = lam * (1 - P_block)
+        Lq = L - busy
+        W = L / lambda_eff
+        Wq = Lq / lambda_eff
+
+    return _masked(
+        stable,
+        rho=lam / (c * mu),
+        P0=P0,
+        P_block=P_block,
+        lambda_eff=lambda_eff,
+        L=L,
+        Lq=Lq,
+        W=W,
+        Wq=Wq,
+        busy_servers=busy,
+    )
+
+
+def mmcn_batch(arrival_rate, service_rate, num_servers, population_size):
+    """
+    M/M/c/N (população finita) vetorizado; com c = 1 cobre o M/M/1/N.
+
+    Retorna arrays: rho, P0, lambda_eff, L, Lq, W, Wq e stable.
+    """
+    lam, mu, c, N = _broadcast(arrival_rate, service_rate, num_servers, population_size)
+    stable = (lam > 0) & (mu > 0) & (c >= 1) & (N >= 1)
+    c = np.where(stable, np.floor(c), 1)
+    N = np.where(stable, np.floor(N), 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_a = np.log(lam / mu)
+        P0, _, L, busy = _birth_death_batch(
+            lambda n: log_a[..., None]
+            + np.log(np.maximum(N[..., None] - n + 1, 1))
+            - np.log(np.minimum(n, c[..., None])),
+            c,
+            N,
+        )
+        lambda_eff = lam * (N - L)
+        Lq = L - busy
+        W = L / lambda_eff
+        Wq = Lq / lambda_eff
+
+    return _masked(
+        stable,
+        rho=N * lam / (c * mu),
+        P0=P0,
+        lambda_eff=lambda_eff,
+        L=L,
+        Lq=Lq,
+        W=W,
+        Wq=Wq,
+    )
+
+
+def mg1_batch(arrival_rate, service_rate, sigma_squared):
+    """
+    M/G/1 vetorizado (Pollaczek-Khinchine).
+
+    Retorna arrays: rho, P0, L, Lq, W, Wq e stable.
+    """
+    lam, mu, var = _broadcast(arrival_rate, service_rate, sigma_squared)
+    stable = (lam > 0) & (mu > lam) & (var >= 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rho = lam / mu
+        Lq = (lam**2 * var + rho**2) / (2 * (1 - rho))
+        Wq = Lq / lam
+
+    return _masked(
+        stable,
+        rho=rho,
+        P0=1 - rho,
+        L=rho + Lq,
+        Lq=Lq,
+        W=Wq + 1 / mu,
+        Wq=Wq,
+    )
+
+
+GGC_METHODS = ("allen_cunneen", "kingman", "whitt")
+
+
+def ggc_batch(arrival_rate, service_rate, num_servers, sigma_squared, arrival_scv=1.0, method="allen_cunneen"):
+    """
+    M/G/c e GI/G/c vetorizados por aproximação, a partir de λ, μ, c, σ² do
+    serviço (como no M/G/1) e do SCV das chegadas c_a² (1 = Poisson).
+
+    Com c_s² = σ²·μ² e Wq(M/M/c) = C(c, a) / (cμ - λ):
+      - allen_cunneen: Wq = (c_a² + c_s²)/2 · Wq(M/M/c);
+      - kingman: Wq = ρ^(√(2(c+1)) - 1) / (c·(1 - ρ)) · (c_a² + c_s²)/2 · 1/μ
+        (forma de Sakasegawa, que é a de Kingman com c = 1);
+      - whitt: Allen-Cunneen com a correção de Krämer e Langenbach-Belz do
+        QNA, exp(-2(1 - ρ)(1 - c_a²)² / (3ρ(c_a² + c_s²))), quando c_a² < 1.
+    Com c = 1 e c_a² = 1 as três coincidem com Pollaczek-Khinchine (mg1_batch).
+
+    Retorna arrays: rho, P_queue (Erlang C), L, Lq, W, Wq e stable.
+    """
+    if method not in GGC_METHODS:
+        raise ValueError(f"Aproximação desconhecida: {method}.")
+
+    lam, mu, c, var, ca2 = _broadcast(arrival_rate, service_rate, num_servers, sigma_squared, arrival_scv)
+    # c é truncado antes do teste de estabilidade, como no mmc_batch
+    c = np.floor(c)
+    stable = (lam > 0) & (mu > 0) & (c >= 1) & (lam < c * mu) & (var >= 0) & (ca2 >= 0)
+    c = np.where(stable, c, 1)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        a = lam / mu
+        rho = a / c
+        cs2 = var * mu**2
+        variability = (ca2 + cs2) / 2
+        P_queue = _erlang_c(np.where(stable, a, 0.0), c)
+        Wq_mmc = P_queue / (c * mu - lam)
+
+        if method == "kingman":
+            Wq = rho ** (np.sqrt(2 * (c + 1)) - 1) / (c * (1 - rho)) * variability / mu
+        elif method == "whitt":
+            klb = np.where(
+                ca2 < 1, np.exp(-2 * (1 - rho) * (1 - ca2) ** 2 / (3 * rho * (ca2 + cs2))), 1.0
+            )
+            Wq = variability * klb * Wq_mmc
+        else:
+            Wq = variability * Wq_mmc
+
+        W = Wq + 1 / mu
+
+    return _masked(
+        stable,
+        rho=rho,
+        P_queue=P_queue,
+        L=lam * W,
+        Lq=lam * Wq,
+        W=W,
+        Wq=Wq,
+    )
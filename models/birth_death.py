@@ -0,0 +1,91 @@
+"""
+Solver de cadeias de nascimento e morte finitas (n = 0..K), base das filas
+M/M/1/K, M/M/c/K, M/M/1/N e M/M/c/N.
+
+A cadeia é dada só pelos arrays de taxas λ_n (nascimento) e μ_n (morte).
+Pelo balanço detalhado, P_n / P_{n-1} = λ_{n-1} / μ_n, e os pesos são
+acumulados em escala logarítmica:
+
+    log(P_n / P_0) = Σ_{k=1..n} [log λ_{k-1} - log μ_k]
+
+normalizados pelo maior termo antes da exponencial, então não há estouro
+nem underflow relevante para K ou N na casa dos milhões, qualquer que seja
+ρ. Variantes dependentes do estado (desistência na chegada, abandono,
+serviço dependente da carga) são só outro array de taxas.
+"""
+
+import numpy as np
+
+
+def finite_capacity_rates(arrival_rate, service_rate, num_servers, max_capacity):
+    """Taxas (λ_n, μ_n), n = 0..K, da fila M/M/c/K."""
+    n = np.arange(max_capacity + 1)
+    birth = np.where(n < max_capacity, float(arrival_rate), 0.0)
+    death = service_rate * np.minimum(n, num_servers)
+    return birth, death
+
+
+def finite_source_rates(arrival_rate, service_rate, num_servers, population_size):
+    """Taxas (λ_n, μ_n), n = 0..N, da fila M/M/c/N (λ por cliente fora do sistema)."""
+    n = np.arange(population_size + 1)
+    birth = (population_size - n) * float(arrival_rate)
+    death = service_rate * np.minimum(n, num_servers)
+    return birth, death
+
+
+def stationary_distribution(birth, death):
+    """
+    Distribuição estacionária (P_0, ..., P_K) de uma cadeia de nascimento e morte, O(K).
+
+    Parâmetros:
+        birth: λ_n, n = 0..K (λ_K é ignorada).
+        death: μ_n, n = 0..K (μ_0 é ignorada; as demais devem ser positivas).
+
+    Retorna:
+        np.ndarray: probabilidades dos estados 0..K.
+    """
+    birth = np.asarray(birth, dtype=float)
+    death = np.asarray(death, dtype=float)
+    if np.any(death[1:] <= 0):
+        raise ValueError("As taxas de saída μ_n devem ser positivas para n >= 1.")
+    if np.any(birth < 0):
+        raise ValueError("As taxas de chegada λ_n não podem ser negativas.")
+
+    # Estados após um λ_n = 0 são inalcançáveis: log 0 = -inf vira peso 0
+    with np.errstate(divide="ignore"):
+        log_ratio = np.log(birth[:-1]) - np.log(death[1:])
+    log_terms = np.concatenate(([0.0], np.cumsum(log_ratio)))
+    terms = np.exp(log_terms - log_terms.max())
+    return terms / terms.sum()
+
+
+def birth_death_metrics(birth, death, num_servers):
+    """
+    Distribuição estacionária e métricas de uma fila de nascimento e morte.
+
+    Parâmetros:
+        birth, death: taxas λ_n e μ_n, n = 0..K (ver stationary_distribution).
+        num_servers (int): c, para Lq = E[max(N - c, 0)] e os servidores ocupados.
+
+    Retorna:
+        dict: probs, P0, L, Lq, busy_servers, lambda_eff = Σ λ_n·P_n, W e Wq
+        (pela lei de Little; 0 quando λ_eff = 0).
+    """
+    probs = stationary_distribution(birth, death)
+    n = np.arange(len(probs))
+
+    L = float(probs @ n)
+    busy_servers = float(probs @ np.minimum(n, num_servers))
+    Lq = float(probs @ np.maximum(n - num_servers, 0))
+    lambda_eff = float(probs[:-1] @ np.asarray(birth, dtype=float)[:-1])
+
+    return {
+        "probs": probs,
+        "P0": float(probs[0]),
+        "L": L,
+        "Lq": Lq,
+        "busy_servers": busy_servers,
+        "lambda_eff": lambda_eff,
+        "W": L / lambda_eff if lambda_eff > 0 else 0,
+        "Wq": Lq / lambda_eff if lambda_eff > 0 else 0,
+    }
@@ -0,0 +1,177 @@
+"""
+Redes fechadas com N clientes circulando por M estações (ex.: reflexão →
+CPU → banco de dados), por Análise do Valor Médio (MVA).
+
+Cada estação k tem demanda D_k = V_k·S_k (visitas por ciclo × tempo de
+serviço por visita) e c_k servidores; o tempo de reflexão Z é uma estação de
+atraso puro, sem fila.
+
+- Exata: pelas constantes de normalização G(n) da forma produto, obtidas
+  por convolução em escala logarítmica. Com c_k = 1, Q_k sai direto de G;
+  com c_k > 1 a distribuição de clientes na estação é
+  P_k(j) = f_k(j)·G_{-k}(N - j) / G(N), com G_{-k} a rede sem a estação k
+  (convoluções de prefixo e sufixo). Custo O(M·N²). A recursão de MVA com
+  as marginais p_k(j | n) evitaria o N², mas p_k(0 | n) = 1 - Σ p_k(j | n)
+  perde toda a precisão para N e c grandes.
+- Schweitzer e Bard: ponto fixo na população N, com Q_k(N-1) estimado por
+  (N-1)/N·Q_k(N) (Schweitzer) ou por Q_k(N) (Bard). Custo independente de N.
+  Estações com c_k > 1 entram pela aproximação de Seidmann: fila com
+  demanda D_k/c_k mais atraso D_k·(c_k - 1)/c_k.
+"""
+
+import numpy as np
+
+# Maior população da solução exata (method="auto" usa Schweitzer acima dela)
+EXACT_MAX_POPULATION = 1000
+
+# Termos somados por bloco na convolução em escala log
+CONVOLUTION_BLOCK_TERMS = 1_000_000
+
+# Critério de parada do ponto fixo: variação máxima de Q_k
+APPROXIMATE_TOLERANCE = 1e-10
+APPROXIMATE_MAX_ITERATIONS = 100_000
+
+
+def _log_weights(demand, num_servers, population_size, delay=False):
+    """
+    log f(j), j = 0..N: f(j) = D^j / Π_{i<=j} min(i, c) para uma estação com
+    c servidores, ou D^j / j! para a estação de atraso (c = ∞).
+    """
+    j = np.arange(population_size + 1)
+    rates = j if delay else np.minimum(j, num_servers)
+    with np.errstate(divide="ignore"):
+        return j * np.log(demand) - np.concatenate(([0.0], np.cumsum(np.log(rates[1:]))))
+
+
+def _log_convolve(a, b):
+    """
+    Convolução de duas sequências positivas dadas pelo log, truncada no
+    tamanho delas: log Σ_j exp(a_j + b_{n-j}), n = 0..N, com o maior termo de
+    cada n fatorado antes da exponencial. O(N²), em blocos de linhas.
+    """
+    size = len(a)
+    result = np.empty(size)
+    j = np.arange(size)
+    rows = max(1, CONVOLUTION_BLOCK_TERMS // size)
+    for start in range(0, size, rows):
+        n = np.arange(start, min(start + rows, size))
+        offset = n[:, None] - j[None, :]
+        terms = np.where(offset >= 0, a[None, :] + b[np.maximum(offset, 0)], -np.inf)
+        # Linha só com -inf (G = 0, ex.: rede vazia com n > 0) continua -inf
+        top = terms.max(axis=1)
+        top = np.where(np.isfinite(top), top, 0.0)
+        with np.errstate(divide="ignore"):
+            result[n] = top + np.log(np.exp(terms - top[:, None]).sum(axis=1))
+    return result
+
+
+def _exact_mva(population_size, demands, num_servers, think_time):
+    """Solução exata pelas constantes de normalização G(n); devolve (X, R_k, Q_k)."""
+    N = population_size
+    weights = [_log_weights(d, c, N) for d, c in zip(demands, num_servers)]
+    # Rede vazia: G(0) = 1 e G(n) = 0 para n > 0
+    empty = np.full(N + 1, -np.inf)
+    empty[0] = 0.0
+
+    # prefix[k]: estação de atraso mais as estações 0..k-1
+    prefix = [_log_weights(think_time, 1, N, delay=True) if think_time > 0 else empty]
+    for w in weights:
+        prefix.append(_log_convolve(prefix[-1], w))
+    log_G = prefix[-1]
+    X = float(np.exp(log_G[N - 1] - log_G[N]))
+
+    n = np.arange(N + 1)
+    Q = np.zeros(len(demands))
+    suffix = empty
+    for k in reversed(range(len(demands))):
+        if num_servers[k] == 1:
+            # Q_k = Σ_{n=1..N} D_k^n·G(N - n) / G(N)
+            Q[k] = np.exp(n[1:] * np.log(demands[k]) + log_G[N - 1 :: -1] - log_G[N]).sum()
+        else:
+            # P_k(j) = f_k(j)·G_{-k}(N - j) / G(N), com G_{-k} a rede sem a estação k
+            complement = _log_convolve(prefix[k], suffix)
+            log_probs = weights[k] + complement[::-1]
+            probs = np.exp(log_probs - log_probs.max())
+            Q[k] = probs @ n / probs.sum()
+        if k > 0:
+            suffix = _log_convolve(suffix, weights[k])
+
+    return X, Q / X, Q
+
+
+def _approximate_mva(population_size, demands, num_servers, think_time, factor):
+    """Ponto fixo de Schweitzer (factor = (N-1)/N) ou Bard (factor = 1)."""
+    queueing = demands / num_servers
+    delay = demands - queueing  # Seidmann: D·(c - 1)/c
+
+    Q = np.full(len(demands), population_size / len(demands))
+    X = 0.0
+    R = demands.copy()
+    for _ in range(APPROXIMATE_MAX_ITERATIONS):
+        R = queueing * (1 + factor * Q) + delay
+        X = population_size / (think_time + R.sum())
+        following = X * R
+        converged = np.abs(following - Q).max() < APPROXIMATE_TOLERANCE * max(1.0, population_size)
+        Q = following
+        if converged:
+            break
+    return X, R, Q
+
+
+def mva_metrics(population_size, service_times, visit_ratios=None, num_servers=None, think_time=0.0, method="auto"):
+    """
+    Métricas de uma rede fechada por MVA.
+
+    Parâmetros:
+        population_size (int): N, clientes circulando na rede.
+        service_times (list): S_k, tempo médio de serviço por visita a cada estação.
+        visit_ratios (list): V_k, visitas por ciclo (padrão 1 em todas).
+        num_servers (list): c_k, servidores de cada estação (padrão 1).
+        think_time (float): Z, tempo de reflexão (estação de atraso).
+        method (str): "exact", "schweitzer", "bard" ou "auto" (exata até
+            EXACT_MAX_POPULATION clientes, Schweitzer acima).
+
+    Retorna:
+        dict: vazão, tempos de resposta e de ciclo, número médio e utilização
+        da rede e de cada estação.
+    """
+    demands = np.asarray(service_times, dtype=float)
+    num_stations = len(demands)
+    visits = np.ones(num_stations) if visit_ratios is None else np.asarray(visit_ratios, dtype=float)
+    servers = np.ones(num_stations) if num_servers is None else np.floor(np.asarray(num_servers, dtype=float))
+
+    if num_stations == 0 or len(visits) != num_stations or len(servers) != num_stations:
+        return {"Erro": "Informe S, V e c para cada estação."}
+    if population_size < 1:
+        return {"Erro": "A população deve ter ao menos um cliente."}
+    if np.any(demands <= 0) or np.any(visits <= 0) or np.any(servers < 1) or think_time < 0:
+        return {"Erro": "S e V devem ser > 0, c >= 1 e Z >= 0."}
+    if method == "auto":
+        method = "exact" if population_size <= EXACT_MAX_POPULATION else "schweitzer"
+    if method not in ("exact", "schweitzer", "bard"):
+        return {"Erro": "Método deve ser exact, schweitzer, bard ou auto."}
+    if method == "exact" and population_size > EXACT_MAX_POPULATION:
+        return {"Erro": f"A MVA exata aceita até {EXACT_MAX_POPULATION} clientes; use schweitzer ou bard."}
+
+    population_size = int(population_size)
+    demands = demands * visits
+    if method == "exact":
+        X, R, Q = _exact_mva(population_size, demands, servers, think_time)
+    else:
+        factor = (population_size - 1) / population_size if method == "schweitzer" else 1.0
+        X, R, Q = _approximate_mva(population_size, demands, servers, think_time, factor)
+
+    response_time = float(R.sum())
+    return {
+        "Método": method,
+        "Vazão do Sistema (X)": X,
+        "Tempo de Resposta (R)": response_time,
+        "Tempo de Ciclo (R + Z)": response_time + think_time,
+        "Número Médio nas Estações (L)": float(Q.sum()),
+        "Clientes em Reflexão (X·Z)": X * think_time,
+        "Demanda por Estação (D)": demands.tolist(),
+        "Vazão por Estação (X·V)": (X * visits).tolist(),
+        "Utilização por Estação (U)": (X * demands / servers).tolist(),
+        "Tempo de Resposta por Estação (R)": R.tolist(),
+        "Número Médio por Estação (Q)": Q.tolist(),
+    }
@@ -0,0 +1,225 @@
+import functools
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from models.birth_death import finite_capacity_rates, stationary_distribution
+
+
+# Cache LRU compartilhado pelos modelos multi-servidor (M/M/c, M/M/c/K e
+# prioridades). É limitado pelo número de entradas e pelo total de estados
+# guardados, para que distribuições com K ou N enormes não esgotem a memória.
+CACHE_MAX_ENTRIES = 1024
+CACHE_MAX_STATES = 1_000_000
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0, "evictions": 0, "states": 0}
+
+
+def _memoized(size=lambda value: 1):
+    """
+    Memoiza um kernel no cache compartilhado, com chave (nome, argumentos).
+
+    size(value) informa quantos estados o resultado ocupa no cache.
+    """
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args):
+            key = (function.__name__,) + args
+            with _cache_lock:
+                entry = _cache.get(key)
+                if entry is not None:
+                    _cache.move_to_end(key)
+                    _cache_stats["hits"] += 1
+                    return entry[0]
+                _cache_stats["misses"] += 1
+
+            value = function(*args)
+            cost = size(value)
+            if cost > CACHE_MAX_STATES:
+                return value
+
+            with _cache_lock:
+                if key not in _cache:
+                    _cache[key] = (value, cost)
+                    _cache_stats["states"] += cost
+                while (
+                    len(_cache) > CACHE_MAX_ENTRIES
+                    or _cache_stats["states"] > CACHE_MAX_STATES
+                ):
+                    _, (_, evicted_cost) = _cache.popitem(last=False)
+                    _cache_stats["states"] -= evicted_cost
+                    _cache_stats["evictions"] += 1
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def erlang_cache_info():
+    """Contadores do cache: hits, misses, evictions, entries e states."""
+    with _cache_lock:
+        return dict(_cache_stats, entries=len(_cache))
+
+
+def erlang_cache_clear():
+    """Esvazia o cache e zera os contadores."""
+    with _cache_lock:
+        _cache.clear()
+        _cache_stats.update(hits=0, misses=0, evictions=0, states=0)
+
+
+@_memoized()
+def erlang_b(offered_load, num_servers):
+    """
+    Probabilidade de bloqueio de Erlang B, B(c, a).
+
+    Usa a recorrência B(0) = 1, B(k) = a·B(k-1) / (k + a·B(k-1)), que não
+    calcula fatoriais nem potências e por isso não estoura para c grande.
+
+    Parâmetros:
+        offered_load (float): a = λ / μ, carga oferecida em Erlangs.
+        num_servers (int): c, número de servidores.
+
+    Retorna:
+        float: B(c, a).
+    """
+    b = 1.0
+    for k in range(1, num_servers + 1):
+        b = offered_load * b / (k + offered_load * b)
+    return b
+
+
+def erlang_c(offered_load, num_servers):
+    """
+    Probabilidade de espera de Erlang C, C(c, a) = P(Wq > 0), obtida de B(c, a).
+
+    Requer a < c (sistema estável).
+    """
+    b = erlang_b(offered_load, num_servers)
+    rho = offered_load / num_servers
+    return b / (1 - rho * (1 - b))
+
+
+def _scaled_terms(ratio, last_state):
+    """
+    Pesos P_n / P_0 (n = 0..last_state) de uma cadeia nascimento-morte,
+    divididos pelo maior deles.
+
+    ratio(n) = P_n / P_{n-1} deve ser não crescente em n, como no M/M/c
+    (as filas finitas usam models.birth_death); assim o maior peso está no último
+    n com ratio(n) >= 1, encontrado por bisseção. A recorrência parte dele
+    para os dois lados, então nenhum termo estoura e os que viram zero por
+    underflow são desprezíveis frente à soma.
+    """
+    lo, hi = 0, last_state
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if ratio(mid) >= 1:
+            lo = mid
+        else:
+            hi = mid - 1
+    mode = lo
+
+    terms = [0.0] * (last_state + 1)
+    terms[mode] = 1.0
+    for n in range(mode, 0, -1):
+        terms[n - 1] = terms[n] / ratio(n)
+    for n in range(mode, last_state):
+        terms[n + 1] = terms[n] * ratio(n + 1)
+    return terms
+
+
+@_memoized(size=lambda value: len(value[0]))
+def mmc_distribution(offered_load, num_servers):
+    """
+    Distribuição estacionária de uma fila M/M/c até o estado c, em O(c).
+
+    Parâmetros:
+        offered_load (float): a = λ / μ, com a < c.
+        num_servers (int): c, número de servidores.
+
+    Retorna:
+        tuple: (probs, P_queue), onde probs = (P_0, ..., P_c) e P_queue é a
+        probabilidade de espera de Erlang C. Para n >= c vale P_n = P_c·ρ^(n-c).
+    """
+    rho = offered_load / num_servers
+    terms = _scaled_terms(
+        lambda n: offered_load / min(n, num_servers), num_servers
+    )
+
+    # O último termo da normalização é a soma geométrica dos estados n >= c
+    tail = terms[num_servers] / (1 - rho)
+    normalization = sum(terms[:num_servers]) + tail
+
+    probs = tuple(t / normalization for t in terms)
+    P_queue = tail / normalization
+    return probs, P_queue
+
+
+def mmc_state_probabilities(offered_load, num_servers, n_max, distribution=None):
+    """
+    Lista [P_0, ..., P_n_max] de uma fila M/M/c.
+
+    distribution: resultado de mmc_distribution já calculado, para reaproveitar.
+    """
+    probs, _ = distribution or mmc_distribution(offered_load, num_servers)
+    rho = offered_load / num_servers
+
+    result = list(probs[: n_max + 1])
+    p = probs[num_servers]
+    for _ in range(num_servers, n_max):
+        p *= rho
+        result.append(p)
+    return result
+
+
+def mmc_state_probability(offered_load, num_servers, n, distribution=None):
+    """
+    P_n de uma fila M/M/c em O(1) a partir da distribuição memoizada até c:
+    P_n da tabela para n < c e P_c·ρ^(n-c) para n >= c. n < 0 gera ValueError.
+    """
+    if n < 0:
+        raise ValueError("O número de clientes n deve ser >= 0.")
+    probs, _ = distribution or mmc_distribution(offered_load, num_servers)
+    if n < num_servers:
+        return probs[n]
+    return probs[num_servers] * (offered_load / num_servers) ** (n - num_servers)
+
+
+def mmc_tail_probability(offered_load, num_servers, n, distribution=None):
+    """
+    P(N > n) de uma fila M/M/c sem subtrair de 1, o que preserva caudas pequenas.
+
+    Para n >= c - 1 a cauda é geométrica: P(N > n) = C·ρ^(n - c + 1).
+    """
+    probs, P_queue = distribution or mmc_distribution(offered_load, num_servers)
+    rho = offered_load / num_servers
+
+    if n >= num_servers - 1:
+        return P_queue * rho ** (n - num_servers + 1)
+    return P_queue + sum(probs[n + 1 : num_servers])
+
+
+@_memoized(size=lambda value: len(value[0]))
+def mmck_distribution(offered_load, num_servers, max_capacity):
+    """
+    Distribuição estacionária de uma fila M/M/c/K em uma passada, O(K), pelo
+    solver de nascimento e morte (models.birth_death).
+
+    Vale para qualquer ρ (inclusive ρ = 1 e ρ > 1), pois não usa a soma
+    geométrica fechada nem calcula ρ^(K-c+1).
+
+    Retorna:
+        tuple: (probs, L, busy_servers), com probs = (P_0, ..., P_K),
+        L = E[N] e busy_servers = E[min(N, c)].
+    """
+    probs = stationary_distribution(
+        *finite_capacity_rates(offered_load, 1.0, num_servers, max_capacity)
+    )
+    n = np.arange(max_capacity + 1)
+    return tuple(probs.tolist()), float(probs @ n), float(probs @ np.minimum(n, num_servers))
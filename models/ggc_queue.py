@@ -0,0 +1,61 @@
+import math
+
+from models.batch import GGC_METHODS, ggc_batch
+
+
+def ggc_queue_metrics(arrival_rate, service_rate, num_servers, sigma_squared, arrival_scv=1.0, method="allen_cunneen"):
+    """
+    Calcula métricas aproximadas de uma fila M/G/c ou GI/G/c.
+
+    Parâmetros:
+    - arrival_rate (λ): Taxa média de chegada
+    - service_rate (μ): Taxa média de serviço
+    - num_servers (c): Número de servidores
+    - sigma_squared (σ²): Variância do tempo de serviço, como no M/G/1
+    - arrival_scv (c_a²): Coeficiente de variação ao quadrado dos intervalos
+      entre chegadas (1 = chegadas de Poisson, M/G/c)
+    - method: "allen_cunneen", "kingman" ou "whitt" (ver models.batch.ggc_batch)
+    """
+    if method not in GGC_METHODS:
+        return {"Erro": f"A aproximação deve ser uma de: {', '.join(GGC_METHODS)}."}
+    num_servers = math.floor(num_servers)
+    if arrival_rate <= 0 or service_rate <= 0 or num_servers < 1 or sigma_squared < 0 or arrival_scv < 0:
+        return {"Erro": "λ e μ devem ser > 0, c >= 1, σ² >= 0 e c_a² >= 0."}
+    if arrival_rate >= num_servers * service_rate:
+        return {"Erro": "O sistema é instável (ρ ≥ 1)."}
+
+    # Mesmo kernel vetorizado dos lotes da API, com escalares
+    results = {
+        name: float(value)
+        for name, value in ggc_batch(
+            arrival_rate, service_rate, num_servers, sigma_squared, arrival_scv, method
+        ).items()
+        if name != "stable"
+    }
+
+    return {
+        "Taxa de Ocupação (ρ)": results["rho"],
+        "Coeficiente de Variação² do Serviço (c_s²)": sigma_squared * service_rate**2,
+        "Probabilidade de Espera (Erlang C)": results["P_queue"],
+        "Número Médio no Sistema (L)": results["L"],
+        "Número Médio na Fila (Lq)": results["Lq"],
+        "Tempo Médio no Sistema (W)": results["W"],
+        "Tempo Médio na Fila (Wq)": results["Wq"],
+    }
+
+
+'''
+Esse código estende o M/G/1 para c servidores e chegadas não Poisson (GI/G/c)
+por aproximações: Allen-Cunneen, Kingman (forma de Sakasegawa) e Whitt (QNA).
+
+Ele recebe a taxa de chegada (λ), taxa de atendimento (μ), número de servidores (c),
+a variância do tempo de serviço (σ²) e o coeficiente de variação² das chegadas (c_a²).
+
+Retorna:
+
+- Taxa de ocupação (ρ),
+- Probabilidade de espera de Erlang C,
+- Médias de clientes e tempos na fila e no sistema (L, Lq, W, Wq).
+
+Se ρ ≥ 1, o sistema é instável e ele avisa isso.
+'''
@@ -0,0 +1,107 @@
+"""
+Problema inverso: maior taxa de chegada λ que ainda cumpre uma meta de W,
+Wq, P(Wq > t), P(W > t) ou P_block, para lotes inteiros de cenários.
+
+Todas essas métricas crescem com λ, então a resposta é a fronteira de um
+intervalo e sai por bisseção. A bisseção é vetorizada: cada passo é uma
+única chamada do kernel de models/batch.py com o array de λ de todos os
+cenários.
+"""
+
+import numpy as np
+
+from models import batch
+
+# nome -> (kernel, argumentos fixos, limite de estabilidade de λ ou None)
+INVERSE_MODELS = {
+    "mm1": (batch.mm1_batch, {}, lambda p: p["service_rate"]),
+    "mmc": (batch.mmc_batch, {}, lambda p: np.floor(p["num_servers"]) * p["service_rate"]),
+    "mm1k": (batch.mm1k_batch, {}, None),
+    "mmck": (batch.mmck_batch, {}, None),
+    "mm1n": (batch.mmcn_batch, {"num_servers": 1}, None),
+    "mmcn": (batch.mmcn_batch, {}, None),
+    "mg1": (batch.mg1_batch, {}, lambda p: p["service_rate"]),
+    **{
+        name: (batch.ggc_batch, {"method": method}, lambda p: np.floor(p["num_servers"]) * p["service_rate"])
+        for name, method in (("ggc", "allen_cunneen"), ("ggc_kingman", "kingman"), ("ggc_whitt", "whitt"))
+    },
+}
+
+# Nos modelos sem limite de estabilidade, λ dobra até 2^MAX_DOUBLINGS vezes
+# a capacidade cμ; se a meta ainda vale, λ é ilimitado. Bem acima disso os
+# kernels perdem precisão no cancelamento λ·(1 - P_block).
+MAX_DOUBLINGS = 30
+
+# λ mínimo testado, relativo à escala do cenário: abaixo dele a meta é
+# considerada inatingível
+MIN_RELATIVE_RATE = 1e-12
+
+BISECTION_STEPS = 64
+
+
+def max_arrival_rate(model, metric, bound, **params):
+    """
+    Maior λ com metric(λ) <= bound, cenário a cenário.
+
+    Parâmetros:
+        model (str): chave de INVERSE_MODELS.
+        metric (str): métrica do kernel (W, Wq, P_Wq_gt_t, P_W_gt_t, P_block).
+        bound: meta (escalar ou array).
+        **params: demais parâmetros do kernel, sem arrival_rate (escalares ou
+            arrays, com broadcasting).
+
+    Retorna:
+        dict: arrays arrival_rate (NaN onde a meta é inatingível, inf onde vale
+        para todo λ), value (a métrica nesse λ), feasible e unbounded.
+    """
+    kernel, fixed, stability_limit = INVERSE_MODELS[model]
+    names = list(params)
+    arrays = np.broadcast_arrays(
+        np.asarray(bound, dtype=float), *(np.asarray(params[name], dtype=float) for name in names)
+    )
+    bound = arrays[0]
+    params = {**dict(zip(names, arrays[1:])), **fixed}
+
+    def evaluate(arrival_rate):
+        results = kernel(arrival_rate, **params)
+        if metric not in results:
+            raise ValueError(f"O modelo {model} não calcula {metric}.")
+        value = results[metric]
+        return value, results["stable"] & (value <= bound)
+
+    # Escala do cenário: capacidade cμ (ou o limite de estabilidade)
+    if stability_limit is not None:
+        hi = np.asarray(stability_limit(params), dtype=float) * np.ones_like(bound)
+    else:
+        hi = np.asarray(params["service_rate"] * params.get("num_servers", 1), dtype=float) * np.ones_like(bound)
+
+    lo = hi * MIN_RELATIVE_RATE
+    _, feasible = evaluate(lo)
+
+    # Sem limite de estabilidade: dobra hi até a meta falhar
+    unbounded = np.zeros_like(feasible)
+    if stability_limit is None:
+        _, ok = evaluate(hi)
+        for _ in range(MAX_DOUBLINGS):
+            growing = feasible & ok
+            if not growing.any():
+                break
+            lo = np.where(growing, hi, lo)
+            hi = np.where(growing, 2 * hi, hi)
+            _, ok = evaluate(hi)
+        unbounded = feasible & ok
+
+    for _ in range(BISECTION_STEPS):
+        mid = (lo + hi) / 2
+        _, ok = evaluate(mid)
+        lo = np.where(ok, mid, lo)
+        hi = np.where(ok, hi, mid)
+
+    value, _ = evaluate(lo)
+    arrival_rate = np.where(unbounded, np.inf, np.where(feasible, lo, np.nan))
+    return {
+        "arrival_rate": arrival_rate,
+        "value": np.where(feasible & ~unbounded, value, np.nan),
+        "feasible": feasible,
+        "unbounded": unbounded,
+    }
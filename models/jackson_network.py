@@ -0,0 +1,136 @@
+"""
+Rede de Jackson aberta: nós M/M/c com roteamento probabilístico.
+
+As taxas de chegada de cada nó saem das equações de tráfego
+
+    λ_j = γ_j + Σ_i λ_i·r_ij,   ou seja,   (I - Rᵀ)·λ = γ,
+
+resolvidas por um solve esparso (R tem uma entrada por ligação entre nós):
+BiCGSTAB primeiro, que converge em poucas iterações quando os clientes
+deixam a rede com probabilidade razoável, e fatoração LU esparsa se ele
+não convergir. Em grafos aleatórios de milhares de nós a LU sofre com o
+preenchimento e leva segundos; o iterativo, milissegundos.
+
+Pelo teorema de Jackson cada nó se comporta como uma M/M/c isolada com
+taxa λ_j, então os nós são avaliados de uma vez pelo kernel vetorizado
+mmc_batch, e L e W da rede saem da soma dos nós e da lei de Little.
+"""
+
+import warnings
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import MatrixRankWarning, bicgstab, spsolve
+
+from models.batch import mmc_batch
+
+# Folga nas somas das linhas de R (erro de arredondamento das probabilidades)
+ROUTING_TOLERANCE = 1e-9
+
+# Resíduo relativo aceito na solução das equações de tráfego
+TRAFFIC_TOLERANCE = 1e-12
+
+
+def routing_matrix(edges, num_nodes):
+    """
+    Matriz de roteamento esparsa (CSR) a partir de ligações (origem, destino, probabilidade).
+
+    Ligações repetidas entre o mesmo par de nós são somadas; índices fora de
+    0..n-1 geram ValueError.
+    """
+    if len(edges) == 0:
+        return sparse.csr_matrix((num_nodes, num_nodes))
+    source, target, probability = (np.asarray(column) for column in zip(*edges))
+    return sparse.csr_matrix(
+        (probability.astype(float), (source.astype(int), target.astype(int))),
+        shape=(num_nodes, num_nodes),
+    )
+
+
+def traffic_rates(external_rates, routing):
+    """
+    Resolve (I - Rᵀ)·λ = γ; devolve None se o sistema é singular (há nós dos
+    quais os clientes nunca saem da rede).
+    """
+    num_nodes = len(external_rates)
+    system = (sparse.identity(num_nodes, format="csr") - routing.T).tocsr()
+    scale = np.linalg.norm(external_rates)
+
+    with np.errstate(all="ignore"):
+        rates, info = bicgstab(system, external_rates, rtol=TRAFFIC_TOLERANCE, atol=0.0, maxiter=10 * num_nodes)
+        if info != 0 or not np.linalg.norm(system @ rates - external_rates) <= 10 * TRAFFIC_TOLERANCE * scale:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", MatrixRankWarning)
+                rates = np.atleast_1d(spsolve(system.tocsc(), external_rates))
+            if not np.all(np.isfinite(rates)) or not (
+                np.linalg.norm(system @ rates - external_rates) <= 1e-8 * scale
+            ):
+                return None
+    return rates
+
+
+def jackson_network_metrics(external_rates, routing, service_rates, num_servers):
+    """
+    Métricas por nó e da rede de uma rede de Jackson aberta.
+
+    Parâmetros:
+        external_rates (list): γ_i, chegadas externas em cada nó.
+        routing: matriz R (n × n) com r_ij = P(ir do nó i para o j), densa ou
+            esparsa do SciPy (ver routing_matrix). 1 - Σ_j r_ij é a saída da rede.
+        service_rates (list): μ_i de cada nó.
+        num_servers (list): c_i de cada nó.
+
+    Retorna:
+        dict: taxas, ρ, L, Lq, W e Wq por nó, visitas por cliente, e L, W e
+        vazão da rede.
+    """
+    gamma = np.asarray(external_rates, dtype=float)
+    mu = np.asarray(service_rates, dtype=float)
+    c = np.asarray(num_servers, dtype=float)
+    num_nodes = len(gamma)
+
+    if num_nodes == 0 or len(mu) != num_nodes or len(c) != num_nodes:
+        return {"Erro": "γ, μ e c devem ter um valor por nó."}
+    if np.any(gamma < 0) or np.any(mu <= 0) or np.any(c < 1):
+        return {"Erro": "γ deve ser >= 0, μ > 0 e c >= 1 em todos os nós."}
+    if gamma.sum() <= 0:
+        return {"Erro": "A rede precisa de ao menos uma chegada externa."}
+
+    R = sparse.csr_matrix(routing, dtype=float)
+    if R.shape != (num_nodes, num_nodes):
+        return {"Erro": "A matriz de roteamento deve ser n × n."}
+    if R.nnz and R.data.min() < 0:
+        return {"Erro": "As probabilidades de roteamento não podem ser negativas."}
+    if np.any(np.asarray(R.sum(axis=1)).ravel() > 1 + ROUTING_TOLERANCE):
+        return {"Erro": "A soma das probabilidades de saída de um nó não pode passar de 1."}
+
+    # Equações de tráfego: (I - Rᵀ)·λ = γ
+    rates = traffic_rates(gamma, R)
+    if rates is None or np.any(rates < -ROUTING_TOLERANCE):
+        return {"Erro": "As equações de tráfego não têm solução: há nós dos quais os clientes nunca saem da rede."}
+    rates = np.maximum(rates, 0.0)
+
+    nodes = mmc_batch(rates, mu, c)
+    unstable = np.flatnonzero(~nodes["stable"])
+    if len(unstable):
+        listed = ", ".join(str(i) for i in unstable[:10])
+        more = "..." if len(unstable) > 10 else ""
+        return {"Erro": f"Nós instáveis (λ >= c·μ): {listed}{more}."}
+
+    throughput = gamma.sum()
+    L = float(nodes["L"].sum())
+
+    return {
+        "Taxa de Chegada por Nó (λ)": rates.tolist(),
+        "Taxa de Ocupação por Nó (ρ)": nodes["rho"].tolist(),
+        "Número Médio no Sistema por Nó (L)": nodes["L"].tolist(),
+        "Número Médio na Fila por Nó (Lq)": nodes["Lq"].tolist(),
+        "Tempo Médio no Sistema por Nó (W)": nodes["W"].tolist(),
+        "Tempo Médio na Fila por Nó (Wq)": nodes["Wq"].tolist(),
+        "Visitas por Cliente": (rates / throughput).tolist(),
+        "Vazão da Rede": throughput,
+        "Número Médio na Rede (L)": L,
+        "Número Médio em Fila na Rede (Lq)": float(nodes["Lq"].sum()),
+        "Tempo Médio na Rede (W)": L / throughput,
+        "Tempo Médio em Fila na Rede (Wq)": float(nodes["Lq"].sum()) / throughput,
+    }
@@ -1,6 +1,10 @@
-from decimal import Decimal, getcontext
+from decimal import Decimal, localcontext
+from itertools import accumulate
 
-def mg1_non_preemptive_priority_metrics(arrival_rates, service_times, service_variances):
+import numpy as np
+
+
+def mg1_non_preemptive_priority_metrics(arrival_rates, service_times, service_variances, vectorized=False, precision="float"):
     """
     Calcula métricas para M/G/1 com prioridade não-preemptiva baseada em SPT (versão corrigida).
 
@@ -8,71 +12,150 @@ def mg1_non_preemptive_priority_metrics(arrival_rates, service_times, service_va
     - arrival_rates: lista de taxas de chegada (λ) para cada classe
     - service_times: lista de tempos médios de serviço (E[S]) em horas
     - service_variances: lista de variâncias dos tempos de serviço (Var[S]) em horas²
+    - vectorized: se True, retorna um dict com um array por métrica (W, Wq, L, Lq),
+      na ordem original das classes
+    - precision: "float" (padrão, NumPy float64) ou "decimal" (Decimal com 10
+      dígitos, em contexto local e portanto seguro entre threads)
 
     Retorna:
     - dicionário com métricas por classe no formato Classe 1, Classe 2, etc.
     """
-    getcontext().prec = 10
-
     n = len(arrival_rates)
     if not (len(service_times) == len(service_variances) == n):
         return {"Erro": "Listas de entrada devem ter o mesmo comprimento."}
 
-    # Convertendo para Decimal
-    arrival_rates = [Decimal(str(l)) for l in arrival_rates]
-    service_times = [Decimal(str(s)) for s in service_times]
-    service_variances = [Decimal(str(v)) for v in service_variances]
+    if precision == "decimal":
+        return _metrics_decimal(arrival_rates, service_times, service_variances, vectorized)
 
-    # Ordenar por menor tempo de serviço (SPT)
-    classes = sorted(
-        [(i, arrival_rates[i], service_times[i], service_variances[i]) for i in range(n)],
-        key=lambda x: x[2]  # menor E[S] tem mais prioridade
-    )
-
-    arrival_rates = [c[1] for c in classes]
-    service_times = [c[2] for c in classes]
-    service_variances = [c[3] for c in classes]
-    original_indices = [c[0] for c in classes]
+    # Ordenar por menor tempo de serviço (SPT); a ordenação estável preserva
+    # a ordem original entre classes com o mesmo E[S]
+    order = np.argsort(np.asarray(service_times, dtype=float), kind="stable")
+    arrival_rates = np.asarray(arrival_rates, dtype=float)[order]
+    service_times = np.asarray(service_times, dtype=float)[order]
+    service_variances = np.asarray(service_variances, dtype=float)[order]
 
-    utilizacoes = [arrival_rates[i] * service_times[i] for i in range(n)]
-    rho_total = sum(utilizacoes)
+    utilizacoes = arrival_rates * service_times
+    rho_total = utilizacoes.sum()
 
     if rho_total >= 1:
         return {"Erro": "Sistema instável: soma das utilizações ≥ 1."}
 
     # E[S²] = Var[S] + (E[S])²
-    ES2 = [service_variances[i] + service_times[i] ** 2 for i in range(n)]
+    ES2 = service_variances + service_times**2
+
+    # O numerador é o mesmo para todas as classes
+    numerator = np.sum(arrival_rates * ES2)
+
+    # Somas acumuladas das utilizações até a classe i e até a classe i-1;
+    # para a classe de maior prioridade o termo (1 - ρ_{i-1}) vale 1
+    rho_i = np.cumsum(utilizacoes)
+    rho_i_minus_1 = np.concatenate(([0.0], rho_i[:-1]))
+
+    Wq = numerator / (2 * (1 - rho_i_minus_1) * (1 - rho_i))
+    W = Wq + service_times
+    L = arrival_rates * W
+    Lq = L - arrival_rates * service_times
+
+    if vectorized:
+        # Volta à ordem original das classes
+        arrays = {}
+        for name, values in (("W", W), ("Wq", Wq), ("L", L), ("Lq", Lq)):
+            arrays[name] = np.empty(n)
+            arrays[name][order] = values
+        return arrays
+
+    arrays = {"W": W.tolist(), "Wq": Wq.tolist(), "L": L.tolist(), "Lq": Lq.tolist()}
+    return _format(
+        arrival_rates.tolist(), service_times.tolist(), service_variances.tolist(), utilizacoes.tolist(), order.tolist(), arrays, float
+    )
 
-    results = {}
-    for i in range(n):
-        # Soma das utilizações até a classe i-1
-        rho_i_minus_1 = sum(utilizacoes[j] for j in range(i))
-        # Soma das utilizações até a classe i
-        rho_i = sum(utilizacoes[j] for j in range(i + 1))
 
+def _metrics_decimal(arrival_rates, service_times, service_variances, vectorized):
+    n = len(arrival_rates)
+
+    with localcontext() as ctx:
+        ctx.prec = 10
+
+        # Convertendo para Decimal
+        arrival_rates = [Decimal(str(l)) for l in arrival_rates]
+        service_times = [Decimal(str(s)) for s in service_times]
+        service_variances = [Decimal(str(v)) for v in service_variances]
+
+        # Ordenar por menor tempo de serviço (SPT)
+        classes = sorted(
+            [(i, arrival_rates[i], service_times[i], service_variances[i]) for i in range(n)],
+            key=lambda x: x[2]  # menor E[S] tem mais prioridade
+        )
+
+        arrival_rates = [c[1] for c in classes]
+        service_times = [c[2] for c in classes]
+        service_variances = [c[3] for c in classes]
+        original_indices = [c[0] for c in classes]
+
+        utilizacoes = [arrival_rates[i] * service_times[i] for i in range(n)]
+        rho_total = sum(utilizacoes)
+
+        if rho_total >= 1:
+            return {"Erro": "Sistema instável: soma das utilizações ≥ 1."}
+
+        # E[S²] = Var[S] + (E[S])²
+        ES2 = [service_variances[i] + service_times[i] ** 2 for i in range(n)]
+
+        # Somas acumuladas das utilizações até cada classe, em O(k)
+        rho_acumulado = list(accumulate(utilizacoes))
+
+        # O numerador é o mesmo para todas as classes
         numerator = sum(arrival_rates[j] * ES2[j] for j in range(n))
-        if i == 0:
-        # Classe com maior prioridade (i=0)
-            denominator = 2 * (1 - rho_i)
-        else:
-            denominator = 2 * (1 - rho_i_minus_1) * (1 - rho_i)
 
-        Wq = numerator / denominator
+        arrays = {"W": [], "Wq": [], "L": [], "Lq": []}
+        for i in range(n):
+            # Soma das utilizações até a classe i
+            rho_i = rho_acumulado[i]
+
+            if i == 0:
+                # Classe com maior prioridade (i=0)
+                denominator = 2 * (1 - rho_i)
+            else:
+                # Soma das utilizações até a classe i-1
+                rho_i_minus_1 = rho_acumulado[i - 1]
+                denominator = 2 * (1 - rho_i_minus_1) * (1 - rho_i)
 
-        W = Wq + service_times[i]
-        L = arrival_rates[i] * W
-        Lq =  L - arrival_rates[i] * service_times[i]
+            Wq = numerator / denominator
 
+            W = Wq + service_times[i]
+            L = arrival_rates[i] * W
+            Lq =  L - arrival_rates[i] * service_times[i]
+
+            arrays["W"].append(W)
+            arrays["Wq"].append(Wq)
+            arrays["L"].append(L)
+            arrays["Lq"].append(Lq)
+
+        if vectorized:
+            # Volta à ordem original das classes
+            vectors = {}
+            for name, values in arrays.items():
+                vectors[name] = np.empty(n)
+                vectors[name][original_indices] = [float(v) for v in values]
+            return vectors
+
+        return _format(arrival_rates, service_times, service_variances, utilizacoes, original_indices, arrays, Decimal)
+
+
+def _format(arrival_rates, service_times, service_variances, utilizacoes, original_indices, arrays, number):
+    """Dict por classe (na ordem SPT); number converte os valores para float ou Decimal."""
+    results = {}
+    for i in range(len(arrival_rates)):
         class_name = f"Classe {original_indices[i] + 1}"  # volta ao índice original
         results[class_name] = {
-            "Taxa de Chegada (λ)": round(arrival_rates[i], 5),
-            "Tempo Médio de Serviço (E[S])": round(service_times[i], 5),
-            "Variância do Serviço (Var[S])": round(service_variances[i], 7),
-            "Taxa de Ocupação (ρ)": round(utilizacoes[i], 5),
-            "Número Médio no Sistema (L)": round(L, 5),
-            "Número Médio na Fila (Lq)": round(Lq, 5),
-            "Tempo Médio no Sistema (W)": round(W, 5),
-            "Tempo Médio na Fila (Wq)": round(Wq, 5)
+            "Taxa de Chegada (λ)": round(number(arrival_rates[i]), 5),
+            "Tempo Médio de Serviço (E[S])": round(number(service_times[i]), 5),
+            "Variância do Serviço (Var[S])": round(number(service_variances[i]), 7),
+            "Taxa de Ocupação (ρ)": round(number(utilizacoes[i]), 5),
+            "Número Médio no Sistema (L)": round(number(arrays["L"][i]), 5),
+            "Número Médio na Fila (Lq)": round(number(arrays["Lq"][i]), 5),
+            "Tempo Médio no Sistema (W)": round(number(arrays["W"][i]), 5),
+            "Tempo Médio na Fila (Wq)": round(number(arrays["Wq"][i]), 5)
         }
 
     return results
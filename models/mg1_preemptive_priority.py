@@ -1,7 +1,10 @@
-from decimal import Decimal, getcontext
+from decimal import Decimal, localcontext
+from itertools import accumulate
 
+import numpy as np
 
-def mg1_preemptive_priority_metrics(arrival_rates, service_times, service_variances):
+
+def mg1_preemptive_priority_metrics(arrival_rates, service_times, service_variances, vectorized=False, precision="float"):
     """
     Calcula métricas para uma fila M/G/1 com prioridade preemptiva.
 
@@ -9,58 +12,115 @@ def mg1_preemptive_priority_metrics(arrival_rates, service_times, service_varian
     - arrival_rates: lista de taxas de chegada (λ) para cada classe de prioridade (ordem crescente de prioridade)
     - service_times: lista de tempos médios de serviço (E[S]) para cada classe
     - service_variances: lista de variâncias dos tempos de serviço (Var[S]) para cada classe
+    - vectorized: se True, retorna um dict com um array por métrica (W, Wq, L, Lq)
+    - precision: "float" (padrão, NumPy float64) ou "decimal" (Decimal com 10
+      dígitos, em contexto local e portanto seguro entre threads)
 
     Retorna:
     - dicionário com métricas por classe: Classe 1, Classe 2, ...
     """
-    getcontext().prec = 10
-
     n = len(arrival_rates)
     if not (len(service_times) == len(service_variances) == n):
         return {"Erro": "Listas de entrada devem ter o mesmo comprimento."}
 
-    # Conversão para Decimal
-    arrival_rates = [Decimal(str(l)) for l in arrival_rates]
-    service_times = [Decimal(str(s)) for s in service_times]
-    service_variances = [Decimal(str(v)) for v in service_variances]
+    if precision == "decimal":
+        return _metrics_decimal(arrival_rates, service_times, service_variances, vectorized)
+
+    arrival_rates = np.asarray(arrival_rates, dtype=float)
+    service_times = np.asarray(service_times, dtype=float)
+    service_variances = np.asarray(service_variances, dtype=float)
 
     # Utilizações individuais e total
-    utilizacoes = [arrival_rates[i] * service_times[i] for i in range(n)]
-    rho_total = sum(utilizacoes)
+    utilizacoes = arrival_rates * service_times
+    rho_total = utilizacoes.sum()
 
     if rho_total >= 1:
         return {"Erro": "Sistema instável: soma das utilizações ≥ 1."}
 
     # E[S²] = Var[S] + (E[S])²
-    ES2 = [service_variances[i] + service_times[i] ** 2 for i in range(n)]
+    ES2 = service_variances + service_times**2
 
-    results = {}
-    for i in range(n):
-        λi = arrival_rates[i]
-        ES_i = service_times[i]
-        ES2_i = ES2[i]
+    # Somas das classes de prioridade ≥ i (sufixos), em O(k)
+    rho_ge = np.cumsum(utilizacoes[::-1])[::-1]
+    numerators = np.cumsum((arrival_rates * ES2)[::-1])[::-1]
+
+    # Wq para preemptiva
+    Wq = numerators / (2 * (1 - rho_ge))
+    W = Wq + service_times
+    L = arrival_rates * W
+    Lq = L - arrival_rates * service_times  # ou Lq = λi * Wq
+
+    arrays = {"W": W, "Wq": Wq, "L": L, "Lq": Lq}
+    if vectorized:
+        return arrays
+    arrays = {name: values.tolist() for name, values in arrays.items()}
+    return _format(
+        arrival_rates.tolist(), service_times.tolist(), service_variances.tolist(), utilizacoes.tolist(), arrays, float
+    )
+
+
+def _metrics_decimal(arrival_rates, service_times, service_variances, vectorized):
+    n = len(arrival_rates)
+
+    with localcontext() as ctx:
+        ctx.prec = 10
 
-        # Soma das utilizações de classes de prioridade ≥ i
-        rho_ge_i = sum(utilizacoes[j] for j in range(i, n))
+        # Conversão para Decimal
+        arrival_rates = [Decimal(str(l)) for l in arrival_rates]
+        service_times = [Decimal(str(s)) for s in service_times]
+        service_variances = [Decimal(str(v)) for v in service_variances]
 
-        # Numerador e denominador da fórmula de Wq para preemptiva
-        numerator = sum(arrival_rates[j] * ES2[j] for j in range(i, n))
-        denominator = 2 * (1 - rho_ge_i)
+        # Utilizações individuais e total
+        utilizacoes = [arrival_rates[i] * service_times[i] for i in range(n)]
+        rho_total = sum(utilizacoes)
 
-        Wq = numerator / denominator
-        W = Wq + ES_i
-        L = λi * W
-        Lq = L - λi * ES_i  # ou Lq = λi * Wq
+        if rho_total >= 1:
+            return {"Erro": "Sistema instável: soma das utilizações ≥ 1."}
 
+        # E[S²] = Var[S] + (E[S])²
+        ES2 = [service_variances[i] + service_times[i] ** 2 for i in range(n)]
+
+        # Somas das classes de prioridade ≥ i (sufixos), calculadas uma vez em O(k)
+        rho_ge = list(accumulate(reversed(utilizacoes)))[::-1]
+        numerators = list(accumulate(arrival_rates[j] * ES2[j] for j in reversed(range(n))))[::-1]
+
+        arrays = {"W": [], "Wq": [], "L": [], "Lq": []}
+        for i in range(n):
+            λi = arrival_rates[i]
+            ES_i = service_times[i]
+
+            # Numerador e denominador da fórmula de Wq para preemptiva
+            numerator = numerators[i]
+            denominator = 2 * (1 - rho_ge[i])
+
+            Wq = numerator / denominator
+            W = Wq + ES_i
+            L = λi * W
+            Lq = L - λi * ES_i  # ou Lq = λi * Wq
+
+            arrays["W"].append(W)
+            arrays["Wq"].append(Wq)
+            arrays["L"].append(L)
+            arrays["Lq"].append(Lq)
+
+        if vectorized:
+            return {name: np.array(values, dtype=float) for name, values in arrays.items()}
+        return _format(arrival_rates, service_times, service_variances, utilizacoes, arrays, Decimal)
+
+
+def _format(arrival_rates, service_times, service_variances, utilizacoes, arrays, number):
+    """Dict por classe; number converte os valores para o tipo de saída (float ou Decimal)."""
+    results = {}
+    for i in range(len(arrival_rates)):
         results[f"Classe {i + 1}"] = {
-            "Taxa de Chegada (λ)": round(λi, 5),
-            "Tempo Médio de Serviço (E[S])": round(ES_i, 5),
-            "Variância do Serviço (Var[S])": round(service_variances[i], 7),
-            "Taxa de Ocupação (ρ)": round(utilizacoes[i], 5),
-            "Número Médio no Sistema (L)": round(L, 5),
-            "Número Médio na Fila (Lq)": round(Lq, 5),
-            "Tempo Médio no Sistema (W)": round(W, 5),
-            "Tempo Médio na Fila (Wq)": round(Wq, 5),
+            "Taxa de Chegada (λ)": round(number(arrival_rates[i]), 5),
+            "Tempo Médio de Serviço (E[S])": round(number(service_times[i]), 5),
+            "Variância do Serviço (Var[S])": round(number(service_variances[i]), 7),
+            "Taxa de Ocupação (ρ)": round(number(utilizacoes[i]), 5),
+            "Número Médio no Sistema (L)": round(number(arrays["L"][i]), 5),
+            "Número Médio na Fila (Lq)": round(number(arrays["Lq"][i]), 5),
+            "Tempo Médio no Sistema (W)": round(number(arrays["W"][i]), 5),
+            "Tempo Médio na Fila (Wq)": round(number(arrays["Wq"][i]), 5),
         }
 
     return results
@@ -1,55 +1,107 @@
-from decimal import Decimal, getcontext
-def mm1_priority_non_preemptive_metrics(arrival_rates, service_rate):
+from decimal import Decimal, localcontext
+from itertools import accumulate
+
+import numpy as np
+
+
+def mm1_priority_non_preemptive_metrics(arrival_rates, service_rate, vectorized=False, precision="float"):
     """
     arrival_rates: lista com λ de cada classe de prioridade [λ1, λ2, ..., λn]
     service_rate: taxa de serviço μ 
+    vectorized: se True, retorna um dict com um array por métrica (W, Wq, L, Lq)
+                em vez do dict por classe.
+    precision: "float" (padrão, NumPy float64) ou "decimal" (Decimal com 15
+               dígitos, em contexto local e portanto seguro entre threads).
     
     Retorna dict com métricas por classe.
     """
-    getcontext().prec = 15
-    
-    arrival_rates = [Decimal(str(lam)) for lam in arrival_rates]
-    service_rate = Decimal(str(service_rate))
-    
-    lambda_total = sum(arrival_rates)
-    rho_total = lambda_total / service_rate
-    
+    if precision == "decimal":
+        return _metrics_decimal(arrival_rates, service_rate, vectorized)
+
+    arrival_rates = np.asarray(arrival_rates, dtype=float)
+    service_rate = float(service_rate)
+
+    rho_total = arrival_rates.sum() / service_rate
+
     if rho_total >= 1:
         return {"Erro": "Sistema instável: soma das taxas de utilização >= 1."}
-    
-     # Calcula ρ_i para cada classe
-    rho_i = [lam / service_rate for lam in arrival_rates]
-    
-    # Calcula σ_i (soma acumulada dos ρ até a classe i)
-    sigma = []
-    for i in range(len(rho_i)):
-        sigma.append(sum(rho_i[:i+1]))
-        
+
+    # σ_i (soma acumulada dos ρ até a classe i) e σ_{i-1}, em O(k)
+    sigma = np.cumsum(arrival_rates / service_rate)
+    sigma_prev = np.concatenate(([0.0], sigma[:-1]))
+
+    # Wq_i = (ρ_total/μ) / [(1 - σ_{i-1}) * (1 - σ_i)]
+    Wq = (rho_total / service_rate) / ((1 - sigma_prev) * (1 - sigma))
+    W = Wq + 1 / service_rate
+    Lq = arrival_rates * Wq
+    L = arrival_rates * W
+
+    arrays = {"W": W, "Wq": Wq, "L": L, "Lq": Lq}
+    if vectorized:
+        return arrays
+    arrays = {name: values.tolist() for name, values in arrays.items()}
+    return _format(arrival_rates.tolist(), arrays)
+
+
+def _metrics_decimal(arrival_rates, service_rate, vectorized):
+    with localcontext() as ctx:
+        ctx.prec = 15
+
+        arrival_rates = [Decimal(str(lam)) for lam in arrival_rates]
+        service_rate = Decimal(str(service_rate))
+
+        lambda_total = sum(arrival_rates)
+        rho_total = lambda_total / service_rate
+
+        if rho_total >= 1:
+            return {"Erro": "Sistema instável: soma das taxas de utilização >= 1."}
+
+        # Calcula ρ_i para cada classe
+        rho_i = [lam / service_rate for lam in arrival_rates]
+
+        # Calcula σ_i (soma acumulada dos ρ até a classe i) em O(k)
+        sigma = list(accumulate(rho_i))
+
+        # Numerador de Wq_i é o mesmo para todas as classes
+        numerator = rho_total / service_rate
+
+        arrays = {"W": [], "Wq": [], "L": [], "Lq": []}
+        for i in range(len(arrival_rates)):
+            lambda_i = arrival_rates[i]
+
+            # σ_{i-1} (soma até a classe anterior)
+            sigma_prev = Decimal('0') if i == 0 else sigma[i-1]
+
+            # σ_i (soma até a classe atual)
+            sigma_current = sigma[i]
+
+            # Wq_i = (ρ_total/μ) / [(1 - σ_{i-1}) * (1 - σ_i)]
+            denominator = (Decimal('1') - sigma_prev) * (Decimal('1') - sigma_current)
+            Wq_i = numerator / denominator
+
+            W_i = Wq_i + (Decimal('1') / service_rate)
+            Lq_i = lambda_i * Wq_i
+            L_i = lambda_i * W_i
+
+            arrays["W"].append(float(W_i))
+            arrays["Wq"].append(float(Wq_i))
+            arrays["L"].append(float(L_i))
+            arrays["Lq"].append(float(Lq_i))
+
+    if vectorized:
+        return {name: np.array(values) for name, values in arrays.items()}
+    return _format(arrival_rates, arrays)
+
+
+def _format(arrival_rates, arrays):
     results = {}
     for i in range(len(arrival_rates)):
-        lambda_i = arrival_rates[i]
-        
-        # σ_{i-1} (soma até a classe anterior)
-        sigma_prev = Decimal('0') if i == 0 else sigma[i-1]
-        
-        # σ_i (soma até a classe atual)
-        sigma_current = sigma[i]
-        
-        # Wq_i = (ρ_total/μ) / [(1 - σ_{i-1}) * (1 - σ_i)]
-        numerator = rho_total / service_rate
-        denominator = (Decimal('1') - sigma_prev) * (Decimal('1') - sigma_current)
-        Wq_i = numerator / denominator
-        
-        W_i = Wq_i + (Decimal('1') / service_rate)
-        Lq_i = lambda_i * Wq_i
-        L_i = lambda_i * W_i
-        
         results[f"Classe {i+1}"] = {
-            "Taxa de Chegada (λ)": float(lambda_i),
-            "Tempo Médio na Fila (Wq)": float(Wq_i),
-            "Tempo Médio no Sistema (W)": float(W_i),
-            "Número Médio na Fila (Lq)": float(Lq_i),
-            "Número Médio no Sistema (L)": float(L_i)
+            "Taxa de Chegada (λ)": float(arrival_rates[i]),
+            "Tempo Médio na Fila (Wq)": float(arrays["Wq"][i]),
+            "Tempo Médio no Sistema (W)": float(arrays["W"][i]),
+            "Número Médio na Fila (Lq)": float(arrays["Lq"][i]),
+            "Número Médio no Sistema (L)": float(arrays["L"][i])
         }
     return results
 
@@ -1,43 +1,94 @@
-from decimal import Decimal, getcontext
-def mm1_priority_preemptive_metrics(arrival_rates, service_rate):
+from decimal import Decimal, localcontext
+from itertools import accumulate
+
+import numpy as np
+
+
+def mm1_priority_preemptive_metrics(arrival_rates, service_rate, vectorized=False, precision="float"):
     """
     arrival_rates: lista com λ de cada classe de prioridade [λ1, λ2, ..., λn]
     service_rate: taxa de serviço μ
-    s: número de canais (servidores)
+    vectorized: se True, retorna um dict com um array por métrica (W, Wq, L, Lq)
+                em vez do dict por classe.
+    precision: "float" (padrão, NumPy float64) ou "decimal" (Decimal com 10
+               dígitos, em contexto local e portanto seguro entre threads).
 
     Retorna dict com métricas por classe.
     """
-    
-    getcontext().prec = 10  
+    if precision == "decimal":
+        return _metrics_decimal(arrival_rates, service_rate, vectorized)
 
-    service_rate = Decimal(service_rate)
-    arrival_rates = [Decimal(lam) for lam in arrival_rates]
+    service_rate = float(service_rate)
+    arrival_rates = np.asarray(arrival_rates, dtype=float)
 
-    rho_total = sum(lam / service_rate for lam in arrival_rates)
+    rho_total = arrival_rates.sum() / service_rate
     if rho_total >= 1:
         return {"Erro": "Sistema instável: soma das taxas de chegada excede ou iguala capacidade do servidor."}
 
+    # Somas acumuladas de λ até a classe i e até a classe i-1, em O(k)
+    sums_lam_i = np.cumsum(arrival_rates)
+    sums_lam_i_minus_1 = np.concatenate(([0.0], sums_lam_i[:-1]))
+
+    denominator = (1 - sums_lam_i_minus_1 / service_rate) * (1 - sums_lam_i / service_rate)
+
+    W = (1 / service_rate) / denominator
+    Wq = W - 1 / service_rate
+    L = sums_lam_i * W
+    Lq = L - sums_lam_i / service_rate
+
+    arrays = {"W": W, "Wq": Wq, "L": L, "Lq": Lq}
+    if vectorized:
+        return arrays
+    arrays = {name: values.tolist() for name, values in arrays.items()}
+    return _format(arrival_rates.tolist(), float(rho_total), arrays, float)
+
+
+def _metrics_decimal(arrival_rates, service_rate, vectorized):
+    with localcontext() as ctx:
+        ctx.prec = 10
+
+        service_rate = Decimal(service_rate)
+        arrival_rates = [Decimal(lam) for lam in arrival_rates]
+
+        rho_total = sum(lam / service_rate for lam in arrival_rates)
+        if rho_total >= 1:
+            return {"Erro": "Sistema instável: soma das taxas de chegada excede ou iguala capacidade do servidor."}
+
+        # Somas acumuladas de λ até a classe i e até a classe i-1, em O(k)
+        sums_lam_i = list(accumulate(arrival_rates))
+        sums_lam_i_minus_1 = [Decimal('0')] + sums_lam_i[:-1]
+
+        arrays = {"W": [], "Wq": [], "L": [], "Lq": []}
+        for sum_lam_i, sum_lam_i_minus_1 in zip(sums_lam_i, sums_lam_i_minus_1):
+            denominator = (Decimal('1') - (sum_lam_i_minus_1 / (service_rate))) * \
+                          (Decimal('1') - (sum_lam_i / (service_rate)))
+
+            W = (Decimal('1') / service_rate) / denominator
+            Wq = W - (Decimal('1') / service_rate)
+            L = sum_lam_i * W
+            Lq = L - (sum_lam_i / service_rate)
+
+            arrays["W"].append(W)
+            arrays["Wq"].append(Wq)
+            arrays["L"].append(L)
+            arrays["Lq"].append(Lq)
+
+        if vectorized:
+            return {name: np.array(values, dtype=float) for name, values in arrays.items()}
+        return _format(arrival_rates, rho_total, arrays, Decimal)
+
+
+def _format(arrival_rates, rho_total, arrays, number):
+    """Dict por classe; number converte os valores para o tipo de saída (float ou Decimal)."""
     results = {}
     for i, lam_i in enumerate(arrival_rates):
-        sum_lam_i = sum(arrival_rates[j] for j in range(i + 1))
-        sum_lam_i_minus_1 = sum(arrival_rates[j] for j in range(i)) if i > 0 else Decimal('0')
-        
-        
-        denominator = (Decimal('1') - (sum_lam_i_minus_1 / (service_rate))) * \
-                      (Decimal('1') - (sum_lam_i / (service_rate)))
-        
-        W = (Decimal('1') / service_rate) / denominator
-        Wq = W - (Decimal('1') / service_rate)
-        L = sum_lam_i * W
-        Lq = L - (sum_lam_i / service_rate)
-
         results[f"Classe {i + 1}"] = {
-            "Taxa de Chegada (λ)": round(lam_i,5),
-            "Taxa de Ocupação (ρ)": round(rho_total,5),
-            "Número Médio no Sistema (L)": round(L, 5),
-            "Número Médio na Fila (Lq)": round(Lq, 5),
-            "Tempo Médio no Sistema (W)": round(W, 5),
-            "Tempo Médio na Fila (Wq)": round(Wq, 5)
+            "Taxa de Chegada (λ)": round(lam_i, 5),
+            "Taxa de Ocupação (ρ)": round(rho_total, 5),
+            "Número Médio no Sistema (L)": round(number(arrays["L"][i]), 5),
+            "Número Médio na Fila (Lq)": round(number(arrays["Lq"][i]), 5),
+            "Tempo Médio no Sistema (W)": round(number(arrays["W"][i]), 5),
+            "Tempo Médio na Fila (Wq)": round(number(arrays["Wq"][i]), 5)
         }
 
     return results
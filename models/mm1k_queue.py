@@ -1,5 +1,16 @@
+from models.birth_death import birth_death_metrics, finite_capacity_rates
+from models.waiting_time import arrival_probabilities_finite_capacity, waiting_time_metrics
+
+
 def mm1k_queue_metrics(
-    arrival_rate, service_rate, max_capacity, waiting_cost, service_cost, num_clients
+    arrival_rate,
+    service_rate,
+    max_capacity,
+    waiting_cost,
+    service_cost,
+    num_clients,
+    waiting_times=None,
+    percentiles=None,
 ):
     """
     Calcular as métricas chave para uma fila M/M/1/K.
@@ -11,6 +22,8 @@ def mm1k_queue_metrics(
         waiting_cost (float): Custo de espera por cliente.
         service_cost (float): Custo de serviço por cliente.
         num_clients (int): N, o número de clientes no sistema.
+        waiting_times (array): valores de t para P(W > t) e P(Wq > t), opcional.
+        percentiles (array): valores de p em (0, 1) para os percentis de W e Wq, opcional.
 
     Retorna:
         dict: Um dicionário contendo as métricas calculadas.
@@ -20,44 +33,30 @@ def mm1k_queue_metrics(
 
     rho = arrival_rate / service_rate  # Intensidade de tráfego (ρ)
 
-    # Calcular P0 (constante de normalização)
-    if rho == 1:
-        P0 = 1 / (max_capacity + 1)
-    else:
-        P0 = (1 - rho) / (1 - rho ** (max_capacity + 1))
-
-    # Calcular Pn para todos os n
-    Pn = []
-    for n in range(max_capacity + 1):
-        Pn.append(P0 * (rho**n))
+    # Distribuição e médias pelo solver de nascimento e morte, em escala
+    # logarítmica: vale para qualquer ρ, sem calcular ρ^(K+1)
+    solution = birth_death_metrics(
+        *finite_capacity_rates(arrival_rate, service_rate, 1, max_capacity), 1
+    )
+    P0 = solution["P0"]
 
     # Probabilidade de bloqueio (P_block = Pk)
-    P_block = Pn[max_capacity]
-
-    # Taxa efetiva de chegada
-    lambda_eff = arrival_rate * (1 - P_block)
-
-    # Número médio de clientes no sistema (L)
-    if rho == 1:
-        L = max_capacity / 2
-    else:
-        numerator = rho / (1 - rho)
-        correction = ((max_capacity + 1) * (rho ** (max_capacity + 1))) / (
-            1 - rho ** (max_capacity + 1)
-        )
-        L = numerator - correction
-
-    # Tempo médio no sistema (W)
-    W = L / lambda_eff if lambda_eff > 0 else 0
+    P_block = float(solution["probs"][max_capacity])
 
-    # Número médio de clientes na fila (Lq)
-    L_q = L - (1 - P0)
+    # Taxa efetiva de chegada, tempos e número médio (L, Lq, W, Wq)
+    lambda_eff = solution["lambda_eff"]
+    L = solution["L"]
+    L_q = solution["Lq"]
+    W = solution["W"]
+    W_q = solution["Wq"]
 
-    # Tempo médio de espera na fila (Wq)
-    W_q = L_q / lambda_eff if lambda_eff > 0 else 0
+    # Distribuição de W e Wq pelo que o cliente admitido encontra
+    waiting = waiting_time_metrics(
+        arrival_probabilities_finite_capacity(solution["probs"]), 1, service_rate, waiting_times, percentiles
+    )
 
     # Probabilidade de existir n clientes no sistema (Pn)
-    Pn = [round(P0 * (rho**num_clients), 4) for num_clients in range(max_capacity + 1)]
+    Pn = [round(p, 4) for p in solution["probs"].tolist()]
 
     # Custo Total (CT)
     CT = waiting_cost * L + service_cost * 1
@@ -73,6 +72,7 @@ def mm1k_queue_metrics(
         "Tempo Médio na Fila (Wq)": W_q,
         "Custo Total (CT)": CT,
         "Probabilidade de existir n clientes (Pn)": Pn,
+        **waiting,
     }
 
 
@@ -1,4 +1,8 @@
-def mm1n_queue_metrics(arrival_rate, service_rate, population_size, waiting_cost, service_cost):
+from models.birth_death import birth_death_metrics, finite_source_rates
+from models.waiting_time import arrival_probabilities_finite_source, waiting_time_metrics
+
+
+def mm1n_queue_metrics(arrival_rate, service_rate, population_size, waiting_cost, service_cost, waiting_times=None, percentiles=None):
     '''
     Modelo M/M/1 com população finita
     
@@ -8,6 +12,8 @@ def mm1n_queue_metrics(arrival_rate, service_rate, population_size, waiting_cost
         population_size (int): N - tamanho da população (capacidade do sistema).
         waiting_cost (float): CE - custo de espera por cliente.
         service_cost (float): CA - custo de atendimento por cliente.
+        waiting_times (array): valores de t para P(W > t) e P(Wq > t), opcional.
+        percentiles (array): valores de p em (0, 1) para os percentis de W e Wq, opcional.
         
     Retorna:
         dict: Métricas da fila M/M/1/N
@@ -16,46 +22,39 @@ def mm1n_queue_metrics(arrival_rate, service_rate, population_size, waiting_cost
     if service_rate <= arrival_rate:
         return {"Erro": "O sistema é instável (λ >= μ)."}
 
-    # Inicializa as probabilidades de estado
-    probabilities = [1.0]  # P0 começa em 1.0 e será ajustado mais tarde
-    normalization_constant = 1.0
-
-    # Calcula as probabilidades de estado
-    for n in range(1, population_size + 1):
-        p_n = probabilities[n - 1] * (arrival_rate * (population_size - (n - 1))) / service_rate
-        probabilities.append(p_n)
-        normalization_constant += p_n
+    # Distribuição de estados e médias pelo solver de nascimento e morte, com s = 1
+    solution = birth_death_metrics(
+        *finite_source_rates(arrival_rate, service_rate, 1, population_size), 1
+    )
+    probabilities = solution["probs"]
+    L = solution["L"]
+    Lq = solution["Lq"]
 
-    # Normaliza as probabilidades
-    probabilities = [p / normalization_constant for p in probabilities]
-
-    # Número médio de clientes no sistema (L)
-    L = sum(n * probabilities[n] for n in range(population_size + 1))
-    
-    # Número médio de clientes na fila (Lq)
-    Lq = L - (1 - probabilities[0])
-    
     # Taxa de processamento (T)
-    lambda_eff = arrival_rate * (population_size - L)
-    
-    # Tempo médio no sistema (W) 
-    W = L / lambda_eff
-    
-    # Tempo médio na fila (Wq)
-    Wq = Lq / lambda_eff
+    lambda_eff = solution["lambda_eff"]
+
+    # Tempos médios no sistema e na fila (W, Wq)
+    W = solution["W"]
+    Wq = solution["Wq"]
     
     # Custo Total (CT) 
     CT = waiting_cost * L + service_cost * 1 
 
+    # Distribuição de W e Wq pelo que o cliente que chega encontra
+    waiting = waiting_time_metrics(
+        arrival_probabilities_finite_source(probabilities), 1, service_rate, waiting_times, percentiles
+    )
+
     return {
         "\nNúmero Médio no Sistema (L)": L,
         "Número Médio na Fila (Lq)": Lq,
         "Taxa de Processamento (T)": lambda_eff,
         "Tempo Médio no Sistema (W)": W,
         "Tempo Médio na Fila (Wq)": Wq,
-        "Probabilidade de Inatividade (P0)": probabilities[0],
+        "Probabilidade de Inatividade (P0)": solution["P0"],
         "Custo Total (CT)": CT,
-        "Probabilidades Normalizadas": [round(p, 4) for p in probabilities]
+        "Probabilidades Normalizadas": [round(p, 4) for p in probabilities.tolist()],
+        **waiting,
     }
 
 '''
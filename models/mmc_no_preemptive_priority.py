@@ -1,6 +1,9 @@
 # models/mmc_no_preemptive_priority.py
 import math
 from decimal import Decimal, getcontext
+from itertools import accumulate
+
+from models.erlang import erlang_b
 
 getcontext().prec = 28
 
@@ -12,10 +15,13 @@ def _round(v, casas=6):
         return v
 
 
-def mmc_no_preemptive_priority(arrival_rates, service_rate, servers):
+def mmc_no_preemptive_priority(arrival_rates, service_rate, servers, vectorized=False):
     """
     Modelo M/M/s com prioridade SEM interrupção.
     Fórmulas iguais às do seu professor/exemplo.
+
+    vectorized: se True, retorna {"W": [...], "Wq": [...], "L": [...], "Lq": [...]}
+                sem arredondamento, em vez do dict por classe.
     """
 
     # ----------------------
@@ -57,19 +63,23 @@ def mmc_no_preemptive_priority(arrival_rates, service_rate, servers):
     r = lambda_total / mi
     s = servers
 
-    soma_r = sum((r**j) / math.factorial(j) for j in range(s))
-    r_pow_s = r**s
+    # s!/r^s · Σ_{j<s} r^j/j! = 1/B(s, r) - 1, com B de Erlang vindo do cache
+    # compartilhado; evita fatoriais e potências que estouram para s grande
+    B = erlang_b(r, s)
 
     # termo base do denominador
-    termo = (math.factorial(s) * (s * mi - lambda_total) / r_pow_s) * soma_r + s * mi
+    termo = (s * mi - lambda_total) * (1 / B - 1) + s * mi if B > 0 else math.inf
 
-    resultados = {}
+    # Somas acumuladas de λ até a classe i-1, em O(k)
+    somas_prev = [0.0] + list(accumulate(lambdas_))[:-1]
+
+    arrays = {"W": [], "Wq": [], "L": [], "Lq": []}
 
     # ----------------------
     # Computar classe por classe
     # ----------------------
     for i, lam_i in enumerate(lambdas_):
-        soma_prev = sum(lambdas_[:i])
+        soma_prev = somas_prev[i]
         soma_i = soma_prev + lam_i
 
         termo2 = 1.0 - soma_prev / capacidade
@@ -85,11 +95,21 @@ def mmc_no_preemptive_priority(arrival_rates, service_rate, servers):
         L = lam_i * W
         Lq = L - lam_i / mi
 
+        arrays["W"].append(W)
+        arrays["Wq"].append(Wq)
+        arrays["L"].append(L)
+        arrays["Lq"].append(Lq)
+
+    if vectorized:
+        return arrays
+
+    resultados = {}
+    for i in range(len(lambdas_)):
         resultados[f"Classe {i+1}"] = {
-            "W": _round(W),
-            "Wq": _round(Wq),
-            "L": _round(L),
-            "Lq": _round(Lq),
+            "W": _round(arrays["W"][i]),
+            "Wq": _round(arrays["Wq"][i]),
+            "L": _round(arrays["L"][i]),
+            "Lq": _round(arrays["Lq"][i]),
             "ρ_total": _round(rho),
         }
 
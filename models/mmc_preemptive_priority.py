@@ -1,6 +1,8 @@
 # models/mmc_preemptive_priority.py
-from math import factorial
 from decimal import Decimal, getcontext
+from itertools import accumulate
+
+from models.erlang import erlang_c
 
 getcontext().prec = 28
 
@@ -12,7 +14,7 @@ def _round(v, places=6):
         return v
 
 
-def mmc_priority_preemptive_metrics(arrival_rates, service_rate, s):
+def mmc_priority_preemptive_metrics(arrival_rates, service_rate, s, vectorized=False):
     """
     Implementação do modelo M/M/s com prioridades preemptivas (interrupção),
     baseada no código de referência que você enviou.
@@ -21,6 +23,8 @@ def mmc_priority_preemptive_metrics(arrival_rates, service_rate, s):
       arrival_rates: lista [λ1, λ2, ..., λk] (ordem: maior prioridade → menor)
       service_rate: μ (float ou Decimal)
       s: número de servidores (int)
+      vectorized: se True, retorna {"W": [...], "Wq": [...], "L": [...], "Lq": [...]}
+                  sem arredondamento, em vez do dict por classe
 
     Retorno:
       dict com chaves "Classe 1", "Classe 2", ... contendo W, Wq, L, Lq (valores arredondados).
@@ -57,13 +61,17 @@ def mmc_priority_preemptive_metrics(arrival_rates, service_rate, s):
     if rho >= 1:
         return {"Erro": "Soma das taxas deve ser menor que a capacidade do servidor"}
 
-    resultados = {}
+    # Somas acumuladas de λ até a classe i e até a classe i-1, em O(k)
+    somas_lambdas = list(accumulate(lambdas))
+    somas_lambdas_i_menos_1 = [0.0] + somas_lambdas[:-1]
+
+    arrays = {"W": [], "Wq": [], "L": [], "Lq": []}
 
     # Caso s == 1 (fórmulas preemptivas clássicas)
     if s == 1:
         for i, lam_i in enumerate(lambdas):
-            soma_lambdas = sum(lambdas[j] for j in range(i + 1))
-            soma_lambdas_i_menos_1 = sum(lambdas[j] for j in range(i)) if i > 0 else 0.0
+            soma_lambdas = somas_lambdas[i]
+            soma_lambdas_i_menos_1 = somas_lambdas_i_menos_1[i]
 
             denom = (1.0 - (soma_lambdas_i_menos_1 / mi)) * (1.0 - (soma_lambdas / mi))
             if denom <= 0:
@@ -77,36 +85,28 @@ def mmc_priority_preemptive_metrics(arrival_rates, service_rate, s):
             L = soma_lambdas * W
             Lq = L - (soma_lambdas / mi)
 
-            resultados[f"Classe {i+1}"] = {
-                "W": _round(W),
-                "Wq": _round(Wq),
-                "L": _round(L),
-                "Lq": _round(Lq),
-            }
+            arrays["W"].append(W)
+            arrays["Wq"].append(Wq)
+            arrays["L"].append(L)
+            arrays["Lq"].append(Lq)
 
-        return resultados
+        return _format(arrays, vectorized)
 
     # Caso s > 1
     def Pw(lambd, mi_local, s_local):
-        """Calcula Pw (Erlang-C like) para taxa lambda=lambd, serviço mi_local e s_local servidores."""
-        a = lambd / mi_local
-        # sum_{k=0}^{s-1} a^k / k!
-        sum_terms = sum((a**k) / factorial(k) for k in range(s_local))
-        last_term = (
-            (a**s_local / factorial(s_local))
-            * (s_local * mi_local)
-            / (s_local * mi_local - lambd)
-        )
+        """Calcula Pw (Erlang C) para taxa lambda=lambd, serviço mi_local e s_local servidores."""
         if (s_local * mi_local - lambd) <= 0:
             # retorno sinalizando erro
             return None
-        return last_term / (sum_terms + last_term)
+        # Vem do cache compartilhado: as somas prefixadas de λ se repetem entre chamadas
+        return erlang_c(lambd / mi_local, s_local)
 
-    # Ws mantém W calculados para classes anteriores (necessário no algoritmo)
-    Ws = []
+    # soma_previas = Σ_{j=0}^{i-1} λ_j * W_j, mantida incrementalmente
+    # (necessária no algoritmo) em vez de ser somada de novo a cada classe
+    soma_previas = 0.0
 
     for i, lam_i in enumerate(lambdas):
-        soma_lambdas = sum(lambdas[j] for j in range(i + 1))
+        soma_lambdas = somas_lambdas[i]
 
         Pw_bar = Pw(soma_lambdas, mi, s)
         if Pw_bar is None:
@@ -121,8 +121,6 @@ def mmc_priority_preemptive_metrics(arrival_rates, service_rate, s):
             # primeira classe: W igual ao W_bar (tempo médio ponderado)
             W = W_bar
         else:
-            # soma_previas = Σ_{j=0}^{i-1} λ_j * W_j
-            soma_previas = sum(lambdas[j] * Ws[j] for j in range(i))
             # rearranjo para obter W_i:
             # soma_lambdas * W_bar = soma_previas + lam_i * W_i  =>  W_i = (soma_lambdas*W_bar - soma_previas)/lam_i
             if lam_i == 0:
@@ -131,18 +129,32 @@ def mmc_priority_preemptive_metrics(arrival_rates, service_rate, s):
             else:
                 W = (soma_lambdas * W_bar - soma_previas) / lam_i
 
-        Ws.append(W)
+        soma_previas += lam_i * W
 
         Wq = W - 1.0 / mi
 
         L = soma_lambdas * W
         Lq = L - (soma_lambdas / mi)
 
+        arrays["W"].append(W)
+        arrays["Wq"].append(Wq)
+        arrays["L"].append(L)
+        arrays["Lq"].append(Lq)
+
+    return _format(arrays, vectorized)
+
+
+def _format(arrays, vectorized):
+    """Monta o retorno: listas por métrica ou dict por classe com valores arredondados."""
+    if vectorized:
+        return arrays
+
+    resultados = {}
+    for i in range(len(arrays["W"])):
         resultados[f"Classe {i+1}"] = {
-            "W": _round(W),
-            "Wq": _round(Wq),
-            "L": _round(L),
-            "Lq": _round(Lq),
+            "W": _round(arrays["W"][i]),
+            "Wq": _round(arrays["Wq"][i]),
+            "L": _round(arrays["L"][i]),
+            "Lq": _round(arrays["Lq"][i]),
         }
-
     return resultados
@@ -1,5 +1,11 @@
 import math
 
+from models.erlang import (
+    mmc_distribution,
+    mmc_state_probability,
+    mmc_tail_probability,
+)
+
 
 def mmc_queue_metrics(
     arrival_rate,
@@ -18,29 +24,20 @@ def mmc_queue_metrics(
         return {"Erro": "O sistema é instável (λ >= c * μ)."}
 
     rho = arrival_rate / (num_servers * service_rate)
+    offered_load = arrival_rate / service_rate
 
-    # ---------- P0 ----------
-    sum_terms = sum(
-        (arrival_rate / service_rate) ** n / math.factorial(n)
-        for n in range(num_servers)
-    )
-
-    last_term = (
-        (arrival_rate / service_rate) ** num_servers / math.factorial(num_servers)
-    ) * (1 / (1 - rho))
+    # ---------- P0 e probabilidade de formação de fila (Erlang C) ----------
+    # Calculados pela recorrência estável de models/erlang.py, em O(c)
+    distribution = mmc_distribution(offered_load, num_servers)
+    probs, P_queue = distribution
 
-    P0 = 1 / (sum_terms + last_term)
-
-    # ---------- Probabilidade de formação de fila ----------
-    P_queue = (
-        P0 * (arrival_rate / service_rate) ** num_servers / math.factorial(num_servers)
-    ) * (1 / (1 - rho))
+    P0 = probs[0]
 
     # ---------- Lq ----------
     L_q = P_queue * rho / (1 - rho)
 
     # ---------- L ----------
-    L = L_q + arrival_rate / service_rate
+    L = L_q + offered_load
 
     # ---------- Wq ----------
     W_q = L_q / arrival_rate
@@ -51,60 +48,31 @@ def mmc_queue_metrics(
     # ---------- Probabilidade de W > t ----------
     if waiting_time_w < 0 or waiting_time_wq < 0:
         return {"Erro": "Os tempos de espera devem ser >= 0."}
+    if num_clients < 0:
+        return {"Erro": "O número de clientes n deve ser >= 0."}
 
     exp_term_w = math.exp(-service_rate * waiting_time_w)
-    bracket_num = 1 - math.exp(
-        -service_rate
-        * waiting_time_w
-        * (num_servers - 1 - (arrival_rate / service_rate))
-    )
-    bracket_den = num_servers - 1 - (arrival_rate / service_rate)
+    bracket_den = num_servers - 1 - offered_load
 
     if bracket_den == 0:
-        P_W_greater_t = exp_term_w
+        # Limite de (1 - e^(-μt·x)) / x quando x -> 0
+        P_W_greater_t = exp_term_w * (1 + P_queue * service_rate * waiting_time_w)
     else:
-        P_W_greater_t = exp_term_w * (
-            1
-            + (
-                P0
-                * (arrival_rate / service_rate) ** num_servers
-                / (math.factorial(num_servers) * (1 - rho))
-            )
-            * (bracket_num / bracket_den)
-        )
+        bracket_num = 1 - math.exp(-service_rate * waiting_time_w * bracket_den)
+        P_W_greater_t = exp_term_w * (1 + P_queue * (bracket_num / bracket_den))
 
     # ---------- Probabilidade de Wq > t ----------
-    P_Wq_equals_0 = sum(
-        ((arrival_rate / service_rate) ** n / math.factorial(n)) * P0
-        for n in range(num_servers)
-    )
-
-    P_Wq_greater_t = (1 - P_Wq_equals_0) * math.exp(
+    P_Wq_greater_t = P_queue * math.exp(
         -service_rate * (num_servers - rho * num_servers) * waiting_time_wq
     )
 
     # ---------- Probabilidade de ter n clientes ----------
-    if num_clients < num_servers:
-        P_n = (
-            (arrival_rate / service_rate) ** num_clients / math.factorial(num_clients)
-        ) * P0
-    else:
-        P_n = (
-            (arrival_rate / service_rate) ** num_clients
-            / (math.factorial(num_servers) * num_servers ** (num_clients - num_servers))
-        ) * P0
+    P_n = mmc_state_probability(offered_load, num_servers, num_clients, distribution)
 
     # ---------- Probabilidade N > n ----------
-    def P_k(k):
-        if k < num_servers:
-            return ((arrival_rate / service_rate) ** k / math.factorial(k)) * P0
-        else:
-            return (
-                (arrival_rate / service_rate) ** k
-                / (math.factorial(num_servers) * num_servers ** (k - num_servers))
-            ) * P0
-
-    P_more_than_n = 1 - sum(P_k(k) for k in range(num_clients + 1))
+    P_more_than_n = mmc_tail_probability(
+        offered_load, num_servers, num_clients, distribution
+    )
 
     # ---------- Probabilidade N ≤ n ----------
     P_up_to_n = 1 - P_more_than_n
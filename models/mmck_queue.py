@@ -1,7 +1,10 @@
-import math
+import numpy as np
 
+from models.erlang import mmck_distribution
+from models.waiting_time import arrival_probabilities_finite_capacity, waiting_time_metrics
 
-def mmc_k_queue_metrics(arrival_rate, service_rate, num_servers, max_capacity, waiting_cost, service_cost, num_clients=0):
+
+def mmc_k_queue_metrics(arrival_rate, service_rate, num_servers, max_capacity, waiting_cost, service_cost, num_clients=0, waiting_times=None, percentiles=None):
     """
     Calcula as métricas chave para uma fila M/M/s/K.
 
@@ -13,6 +16,8 @@ def mmc_k_queue_metrics(arrival_rate, service_rate, num_servers, max_capacity, w
         waiting_cost (float): Custo de espera por cliente.
         service_cost (float): Custo de serviço por cliente.
         num_clients (int): Número de clientes no sistema.
+        waiting_times (array): valores de t para P(W > t) e P(Wq > t), opcional.
+        percentiles (array): valores de p em (0, 1) para os percentis de W e Wq, opcional.
 
     Retorna:
         dict: Métricas de desempenho do sistema.
@@ -24,31 +29,14 @@ def mmc_k_queue_metrics(arrival_rate, service_rate, num_servers, max_capacity, w
     # Intensidade de tráfego por servidor (ρ)
     rho = arrival_rate / (num_servers * service_rate)
 
-    def factorial(n):
-        return math.factorial(n)
-
-    # Cálculo de P0 (probabilidade de sistema vazio)
-    def P0_calc():
-        sum1 = sum(((arrival_rate / service_rate) ** n) / factorial(n)
-                   for n in range(num_servers))
-        sum2 = ((arrival_rate / service_rate) ** num_servers / factorial(num_servers)) * ((1 - rho **
-                                                                                           (max_capacity - num_servers + 1)) / (1 - rho)) if rho != 1 else (max_capacity - num_servers + 1)
-        return 1 / (sum1 + sum2)
-
-    P0 = P0_calc()
-
-    # Probabilidades Pn
-    Pn = []
-    for num_clients in range(0, max_capacity + 1):
-        if num_clients < num_servers:
-            Pn_val = ((arrival_rate / service_rate) ** num_clients / factorial(num_clients)) * P0
-        else:
-            Pn_val = ((arrival_rate / service_rate) ** num_clients /
-                      (factorial(num_servers) * num_servers ** (num_clients - num_servers))) * P0
-        Pn.append(Pn_val)
+    # Distribuição de estados pelo solver de nascimento e morte, válido também
+    # para ρ = 1 e ρ > 1, memoizada no cache compartilhado de models/erlang.py
+    probs, L, busy_servers = mmck_distribution(arrival_rate / service_rate, num_servers, max_capacity)
+    Pn = np.asarray(probs)
+    P0 = float(Pn[0])
 
     # Probabilidade de bloqueio (P_K)
-    P_block = Pn[max_capacity]
+    P_block = float(Pn[max_capacity])
 
     # Taxa efetiva de chegada (λ_eff)
     arrival_rate_eff = arrival_rate * (1 - P_block)
@@ -56,28 +44,19 @@ def mmc_k_queue_metrics(arrival_rate, service_rate, num_servers, max_capacity, w
     # Tempo médio de serviço (1/μ)
     service_time = 1 / service_rate
 
-    # Número médio na fila (Lq)
-    Lq_numerator = P0 * ((arrival_rate / service_rate) ** num_servers) * rho * (1 - rho ** (max_capacity -
-                                                                                            num_servers) * (max_capacity - num_servers + 1 - (max_capacity - num_servers) * rho)) if rho != 1 else 0
-    Lq_denominator = factorial(num_servers) * ((1 - rho) ** 2)
-    Lq = Lq_numerator / Lq_denominator if rho != 1 else 0
-
-    # Número médio no sistema (L)
-    L = sum(n * Pn[n] for n in range(max_capacity + 1))
-
-    # Tempo médio no sistema (W)
-    W = L / arrival_rate_eff if arrival_rate_eff != 0 else 0
-
-    # Tempo médio na fila (Wq)
-    Wq = Lq / arrival_rate_eff if arrival_rate_eff != 0 else 0
-
-    # Número médio de servidores ocupados
-    busy_servers = sum(min(n, num_servers) * Pn[n]
-                       for n in range(max_capacity + 1))
+    # Médias no sistema e na fila (L, Lq, W, Wq)
+    Lq = L - busy_servers
+    W = L / arrival_rate_eff
+    Wq = Lq / arrival_rate_eff
 
     # Custo Total (CT)
     CT = waiting_cost * L + service_cost * num_servers
 
+    # Distribuição de W e Wq pelo que o cliente admitido encontra
+    waiting = waiting_time_metrics(
+        arrival_probabilities_finite_capacity(Pn), num_servers, service_rate, waiting_times, percentiles
+    )
+
     return {
         "Taxa de Ocupação (ρ)": rho,
         "Probabilidade de 0 clientes (P0)": P0,
@@ -90,7 +69,8 @@ def mmc_k_queue_metrics(arrival_rate, service_rate, num_servers, max_capacity, w
         "Tempo Médio de Serviço (1/μ)": service_time,
         "Número Médio de Servidores Ocupados": busy_servers,
         "Custo Total (CT)": CT,
-        "Probabilidade de existir n clientes (Pn)": [round(p, 4) for p in Pn],
+        "Probabilidade de existir n clientes (Pn)": [round(p, 4) for p in Pn.tolist()],
+        **waiting,
     }
 
 
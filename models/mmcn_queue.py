@@ -1,7 +1,8 @@
-import math
+from models.birth_death import birth_death_metrics, finite_source_rates
+from models.waiting_time import arrival_probabilities_finite_source, waiting_time_metrics
 
 
-def mmcn_queue_metrics(arrival_rate, service_rate, num_servers, population_size, waiting_cost, service_cost):
+def mmcn_queue_metrics(arrival_rate, service_rate, num_servers, population_size, waiting_cost, service_cost, waiting_times=None, percentiles=None):
     """
     Modelo M/M/s/N
 
@@ -12,64 +13,43 @@ def mmcn_queue_metrics(arrival_rate, service_rate, num_servers, population_size,
         population_size (int): N - tamanho da população (capacidade do sistema).
         waiting_cost (float): CE - custo de espera por cliente.
         service_cost (float): CA - custo de atendimento por cliente.
+        waiting_times (array): valores de t para P(W > t) e P(Wq > t), opcional.
+        percentiles (array): valores de p em (0, 1) para os percentis de W e Wq, opcional.
 
     Retorna:
         dict: Métricas da fila M/M/s/N
     """
+    if service_rate <= 0 or arrival_rate <= 0 or num_servers <= 0 or population_size <= 0:
+        return {"Erro": "Todos os parâmetros devem ser maiores que zero."}
+
     rho = (population_size * arrival_rate) / (num_servers * service_rate)
 
-    # Cálculo de P0 (probabilidade do sistema vazio)
-    # Primeira soma: n=0 até s-1
-    sum1 = 0
-    for n in range(min(num_servers, population_size + 1)):
-        if population_size >= n:
-            factorial_term = math.factorial(
-                population_size) / (math.factorial(population_size - n) * math.factorial(n))
-            sum1 += factorial_term * ((arrival_rate/service_rate) ** n)
-
-    # Segunda soma: n=s até N
-    sum2 = 0
-    if population_size >= num_servers:
-        for n in range(num_servers, population_size + 1):
-            factorial_term = math.factorial(population_size) / (math.factorial(
-                population_size - n) * math.factorial(num_servers) * (num_servers ** (n - num_servers)))
-            sum2 += factorial_term * ((arrival_rate/service_rate) ** n)
-
-    P0 = 1 / (sum1 + sum2)
-
-    # Probabilidade de bloqueio (sistema cheio)
-    def Pn(n):
-        if n > population_size or n < 0:
-            return 0
-        elif n <= num_servers:
-            factorial_term = math.factorial(
-                population_size) / (math.factorial(population_size - n) * math.factorial(n))
-            return factorial_term * ((arrival_rate/service_rate) ** n) * P0
-        else:
-            factorial_term = math.factorial(population_size) / (math.factorial(
-                population_size - n) * math.factorial(num_servers) * (num_servers ** (n - num_servers)))
-            return factorial_term * ((arrival_rate/service_rate) ** n) * P0
-
-    probabilities = [Pn(n) for n in range(population_size + 1)]
-
-    # Número médio de clientes no sistema (L)
-    L = sum(n * Pn(n) for n in range(1, population_size + 1))
-
-    # Número médio de clientes na fila (Lq)
-    L_q = L - (arrival_rate/service_rate) * (population_size - L)
+    # Distribuição de estados e médias pelo solver de nascimento e morte, O(N)
+    solution = birth_death_metrics(
+        *finite_source_rates(arrival_rate, service_rate, num_servers, population_size), num_servers
+    )
+    probabilities = solution["probs"]
+    P0 = solution["P0"]
 
-    # Taxa efetiva de chegada (clientes realmente atendidos)
-    lambda_eff = arrival_rate * (population_size - L)
+    # Número médio de clientes no sistema e na fila (L, Lq)
+    L = solution["L"]
+    L_q = solution["Lq"]
 
-    # Tempo médio no sistema (W)
-    W = L / lambda_eff if lambda_eff > 0 else 0
+    # Taxa efetiva de chegada (clientes realmente atendidos)
+    lambda_eff = solution["lambda_eff"]
 
-    # Tempo médio na fila (Wq)
-    W_q = L_q / lambda_eff if lambda_eff > 0 else 0
+    # Tempos médios no sistema e na fila (W, Wq)
+    W = solution["W"]
+    W_q = solution["Wq"]
 
     # Custo Total (CT)
     CT = waiting_cost * L + service_cost * num_servers
 
+    # Distribuição de W e Wq pelo que o cliente que chega encontra
+    waiting = waiting_time_metrics(
+        arrival_probabilities_finite_source(probabilities), num_servers, service_rate, waiting_times, percentiles
+    )
+
     return {
         "\nTaxa de Ocupação (ρ)": rho,
         "Probabilidade de Inatividade (P0)": P0,
@@ -79,7 +59,8 @@ def mmcn_queue_metrics(arrival_rate, service_rate, num_servers, population_size,
         "Tempo Médio no Sistema (W)": W,
         "Tempo Médio na Fila (Wq)": W_q,
         "Custo Total (CT)": CT,
-        "Probabilidades Normalizadas": [round(p, 4) for p in probabilities]
+        "Probabilidades Normalizadas": [round(p, 4) for p in probabilities.tolist()],
+        **waiting,
     }
 
 
@@ -0,0 +1,323 @@
+import math
+
+import numpy as np
+
+from models.birth_death import finite_capacity_rates, finite_source_rates
+from models.erlang import erlang_b, mmck_distribution
+
+
+def mmc_staffing(
+    arrival_rate,
+    service_rate,
+    max_wq=None,
+    max_queue_probability=None,
+    max_wq_probability=None,
+    waiting_time=0.0,
+    max_servers=1_000_000,
+):
+    """
+    Menor número de servidores c de uma M/M/c que atende às metas informadas.
+
+    Parâmetros:
+        arrival_rate (float): λ, taxa média de chegada.
+        service_rate (float): μ, taxa média de serviço.
+        max_wq (float): meta para Wq ≤ max_wq.
+        max_queue_probability (float): meta para P_queue = P(Wq > 0).
+        max_wq_probability (float): meta para P(Wq > t), com t = waiting_time.
+        waiting_time (float): t usado em P(Wq > t).
+        max_servers (int): limite da busca.
+
+    As metas informadas são combinadas (todas devem ser atendidas). Todas caem
+    com c, então a busca parte do menor c estável e avança atualizando a
+    recorrência de Erlang B em O(1) por passo, sem recalcular somas.
+
+    Retorna:
+        dict: c mínimo e as métricas da fila com esse c.
+    """
+    if arrival_rate <= 0 or service_rate <= 0:
+        return {"Erro": "Taxas de chegada e serviço devem ser maiores que zero."}
+    if max_wq is None and max_queue_probability is None and max_wq_probability is None:
+        return {"Erro": "Informe ao menos uma meta."}
+    if waiting_time < 0:
+        return {"Erro": "O tempo de espera deve ser >= 0."}
+
+    offered_load = arrival_rate / service_rate
+
+    # Menor c estável (a < c); B(c) vem do cache e os seguintes da recorrência
+    c = int(offered_load) + 1
+    B = erlang_b(offered_load, c)
+
+    while c <= max_servers:
+        P_queue = B / (1 - offered_load / c * (1 - B))
+        W_q = P_queue / (c * service_rate - arrival_rate)
+        P_Wq_greater_t = P_queue * math.exp(
+            -(c * service_rate - arrival_rate) * waiting_time
+        )
+
+        if (
+            (max_wq is None or W_q <= max_wq)
+            and (max_queue_probability is None or P_queue <= max_queue_probability)
+            and (max_wq_probability is None or P_Wq_greater_t <= max_wq_probability)
+        ):
+            return {
+                "Número de Servidores (c)": c,
+                "Taxa de Ocupação (ρ)": offered_load / c,
+                "Probabilidade de Fila (P_queue)": P_queue,
+                "Tempo Médio na Fila (Wq)": W_q,
+                "Tempo Médio no Sistema (W)": W_q + 1 / service_rate,
+                "Probabilidade de Wq > t": P_Wq_greater_t,
+            }
+
+        c += 1
+        B = offered_load * B / (c + offered_load * B)
+
+    return {"Erro": f"Nenhum c até {max_servers} atende às metas."}
+
+
+def mmck_staffing(arrival_rate, service_rate, max_capacity, max_block):
+    """
+    Menor número de servidores c de uma M/M/c/K com P_K ≤ max_block.
+
+    O bloqueio cai com c (1 ≤ c ≤ K). A busca dobra c até atender à meta e
+    depois faz bisseção no intervalo encontrado, avaliando O(log K)
+    distribuições de O(K) cada.
+
+    Retorna:
+        dict: c mínimo e as métricas da fila com esse c.
+    """
+    if arrival_rate <= 0 or service_rate <= 0 or max_capacity <= 0:
+        return {"Erro": "Todos os parâmetros devem ser maiores que zero."}
+
+    offered_load = arrival_rate / service_rate
+
+    def blocking(c):
+        probs, _, _ = mmck_distribution(offered_load, c, max_capacity)
+        return probs[max_capacity]
+
+    if blocking(max_capacity) > max_block:
+        return {"Erro": f"Nem c = K = {max_capacity} atende à meta de bloqueio."}
+
+    # Colchete [lo, hi] com blocking(lo) > meta >= blocking(hi)
+    lo, hi = 0, 1
+    while hi < max_capacity and blocking(hi) > max_block:
+        lo, hi = hi, min(2 * hi, max_capacity)
+
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if blocking(mid) > max_block:
+            lo = mid
+        else:
+            hi = mid
+
+    probs, L, busy_servers = mmck_distribution(offered_load, hi, max_capacity)
+    P_block = probs[max_capacity]
+    arrival_rate_eff = arrival_rate * (1 - P_block)
+
+    return {
+        "Número de Servidores (c)": hi,
+        "Taxa de Ocupação (ρ)": offered_load / hi,
+        "Probabilidade de Bloqueio (P_K)": P_block,
+        "Taxa Efetiva de Chegada (lambda_eff)": arrival_rate_eff,
+        "Número Médio no Sistema (L)": L,
+        "Número Médio na Fila (Lq)": L - busy_servers,
+        "Tempo Médio no Sistema (W)": L / arrival_rate_eff,
+    }
+
+
+def _cost_curve(
+    birth, service_rate, waiting_cost, service_cost, capacities, lost_cost=None, max_states=None, max_points=None
+):
+    """
+    Custo CT(c, K) = CE·L + CA·c (+ CB·taxa perdida) para c = 1, 2, ... e
+    para cada último estado K de capacities, até o custo voltar a subir.
+
+    Os log-pesos log(P_n / P_0) da cadeia são atualizados de c - 1 para c em
+    vez de recalculados: só μ_n com n >= c muda (de (c-1)μ para cμ), então
+    log(P_n / P_0) cai (n - c + 1)·log(c / (c-1)) nesses estados. Truncar a
+    cadeia em K só corta os pesos depois de K, então todos os K saem dos
+    mesmos log-pesos por somas acumuladas em log (np.logaddexp.accumulate):
+    cada c custa O(max K), qualquer que seja o número de capacidades.
+
+    Para cada K a busca em c para quando:
+      - nenhum c maior pode ser melhor: para c' > c, L(c') >= λ_eff(c')/μ >=
+        λ_eff(c)/μ, então CT(c') >= CA·(c+1) + CE·λ_eff(c)/μ;
+      - ou CT sobe com c acima da maior taxa de chegada (c >= max λ_n / μ),
+        onde L(c) é convexa e CT(c) também. Abaixo disso a fila está
+        sobrecarregada, L cai quase linearmente e CT pode subir antes de cair.
+      - c chega a K.
+
+    lost_cost: (CB, λ) para somar CB·(λ - λ_eff) ao custo, ou None.
+    max_states: limite de estados processados, somados em todos os c (cada c
+        percorre max K + 1 estados); max_points: limite de pontos (c, K) da
+        curva. Se algum é excedido, devolve None.
+
+    Retorna:
+        list: (c, K, CT, L, P_K, λ_eff) de cada ponto avaliado, por K e c.
+    """
+    capacities = np.asarray(capacities)
+    states = int(capacities.max()) + 1
+    birth = np.asarray(birth[:states], dtype=float)
+    n = np.arange(states)
+    with np.errstate(divide="ignore"):
+        log_birth = np.log(birth)
+        log_n = np.log(n)
+    log_terms = np.concatenate(([0.0], np.cumsum(log_birth[:-1] - math.log(service_rate))))
+
+    # λ_n para n < K, em todas as capacidades (a de K é cortada)
+    saturation = birth[: states - 1].max(initial=0.0) / service_rate
+
+    curve = []
+    best = np.full(len(capacities), math.inf)
+    previous = np.full(len(capacities), math.inf)
+    active = np.ones(len(capacities), dtype=bool)
+    work = 0
+    for c in range(1, states):
+        active &= capacities >= c
+        if not active.any():
+            break
+        work += states
+        if max_states is not None and work > max_states:
+            return None
+        if max_points is not None and len(curve) + int(active.sum()) > max_points:
+            return None
+        if c > 1:
+            log_terms[c:] -= (n[c:] - c + 1) * math.log(c / (c - 1))
+
+        # log Σ_{n<=K} w_n, log Σ_{n<=K} n·w_n e log Σ_{n<K} λ_n·w_n
+        log_total = np.logaddexp.accumulate(log_terms)
+        log_mean = np.logaddexp.accumulate(log_terms + log_n)
+        log_flow = np.concatenate(([-np.inf], np.logaddexp.accumulate(log_terms + log_birth)[:-1]))
+
+        K = capacities[active]
+        with np.errstate(invalid="ignore"):
+            L = np.exp(log_mean[K] - log_total[K])
+            P_last = np.exp(log_terms[K] - log_total[K])
+            lambda_eff = np.exp(log_flow[K] - log_total[K])
+        CT = waiting_cost * L + service_cost * c
+        if lost_cost is not None:
+            blocking_cost, arrival_rate = lost_cost
+            CT += blocking_cost * (arrival_rate - lambda_eff)
+
+        curve += zip([c] * len(K), K.tolist(), CT.tolist(), L.tolist(), P_last.tolist(), lambda_eff.tolist())
+        best[active] = np.minimum(best[active], CT)
+        done = service_cost * (c + 1) + waiting_cost * lambda_eff / service_rate >= best[active]
+        if c >= saturation:
+            done |= CT > previous[active]
+        previous[active] = CT
+        active[np.flatnonzero(active)[done]] = False
+
+    curve.sort(key=lambda point: (point[1], point[0]))
+    return curve
+
+
+def _cost_point(c, K, CT, L, P_last, lambda_eff):
+    return {
+        "Número de Servidores (c)": c,
+        "Capacidade Máxima (K)": K,
+        "Custo Total (CT)": CT,
+        "Número Médio no Sistema (L)": L,
+        "Probabilidade do Último Estado": P_last,
+        "Taxa Efetiva de Chegada (lambda_eff)": lambda_eff,
+    }
+
+
+def mmck_cost_optimization(
+    arrival_rate,
+    service_rate,
+    max_capacity,
+    waiting_cost,
+    service_cost,
+    blocking_cost=0.0,
+    min_capacity=None,
+    max_states=None,
+    max_points=None,
+):
+    """
+    Configuração (c, K) de menor custo total de uma M/M/c/K.
+
+    Parâmetros:
+        arrival_rate (float): λ, taxa média de chegada.
+        service_rate (float): μ, taxa média de serviço.
+        max_capacity (int): K, capacidade máxima (o maior K da busca).
+        waiting_cost (float): CE, custo de espera por cliente no sistema.
+        service_cost (float): CA, custo por servidor.
+        blocking_cost (float): CB, custo por cliente bloqueado (taxa λ·P_K).
+        min_capacity (int): se informado, K também é buscado em
+            [min_capacity, max_capacity]; senão K = max_capacity.
+        max_states, max_points (int): limites da busca (ver _cost_curve), ou None.
+
+    c vai de 1 a K com a distribuição atualizada a partir da anterior, todos
+    os K de uma vez, e parada antecipada pela convexidade de CT(c) (ver
+    _cost_curve).
+
+    Retorna:
+        dict: c e K ótimos, suas métricas e a curva de custo avaliada.
+    """
+    if arrival_rate <= 0 or service_rate <= 0 or max_capacity <= 0:
+        return {"Erro": "Todos os parâmetros devem ser maiores que zero."}
+    if waiting_cost < 0 or service_cost < 0 or blocking_cost < 0:
+        return {"Erro": "Os custos não podem ser negativos."}
+    if min_capacity is not None and not 1 <= min_capacity <= max_capacity:
+        return {"Erro": "A capacidade mínima deve estar entre 1 e K."}
+
+    # Os pesos de P_n / P_0 não dependem de K: uma cadeia com o maior K
+    # serve para todas as capacidades
+    birth, _ = finite_capacity_rates(arrival_rate, service_rate, 1, max_capacity)
+    capacities = np.arange(min_capacity or max_capacity, max_capacity + 1)
+    points = _cost_curve(
+        birth, service_rate, waiting_cost, service_cost, capacities, (blocking_cost, arrival_rate), max_states, max_points
+    )
+    if points is None:
+        return {"Erro": "A busca excede o limite de estados ou de pontos avaliados."}
+    curve = [_cost_point(*point) for point in points]
+
+    best = min(curve, key=lambda point: point["Custo Total (CT)"])
+    return {
+        "Número de Servidores (c)": best["Número de Servidores (c)"],
+        "Capacidade Máxima (K)": best["Capacidade Máxima (K)"],
+        "Custo Total (CT)": best["Custo Total (CT)"],
+        "Número Médio no Sistema (L)": best["Número Médio no Sistema (L)"],
+        "Probabilidade de Bloqueio (P_K)": best["Probabilidade do Último Estado"],
+        "Taxa Efetiva de Chegada (lambda_eff)": best["Taxa Efetiva de Chegada (lambda_eff)"],
+        "Curva de Custo": curve,
+    }
+
+
+def mmcn_cost_optimization(
+    arrival_rate, service_rate, population_size, waiting_cost, service_cost, max_states=None, max_points=None
+):
+    """
+    Número de servidores c de menor custo total de uma M/M/c/N (população finita).
+
+    Parâmetros:
+        arrival_rate (float): λ, taxa de chegada por cliente fora do sistema.
+        service_rate (float): μ, taxa média de serviço.
+        population_size (int): N, tamanho da população.
+        waiting_cost (float): CE, custo de espera por cliente no sistema.
+        service_cost (float): CA, custo por servidor.
+        max_states, max_points (int): limites da busca (ver _cost_curve), ou None.
+
+    Retorna:
+        dict: c ótimo, suas métricas e a curva de custo avaliada.
+    """
+    if arrival_rate <= 0 or service_rate <= 0 or population_size <= 0:
+        return {"Erro": "Todos os parâmetros devem ser maiores que zero."}
+    if waiting_cost < 0 or service_cost < 0:
+        return {"Erro": "Os custos não podem ser negativos."}
+
+    birth, _ = finite_source_rates(arrival_rate, service_rate, 1, population_size)
+    points = _cost_curve(
+        birth, service_rate, waiting_cost, service_cost, [population_size], max_states=max_states, max_points=max_points
+    )
+    if points is None:
+        return {"Erro": "A busca excede o limite de estados ou de pontos avaliados."}
+    curve = [_cost_point(*point) for point in points]
+
+    best = min(curve, key=lambda point: point["Custo Total (CT)"])
+    return {
+        "Número de Servidores (c)": best["Número de Servidores (c)"],
+        "Custo Total (CT)": best["Custo Total (CT)"],
+        "Número Médio no Sistema (L)": best["Número Médio no Sistema (L)"],
+        "Taxa de Processamento (lambda_eff)": best["Taxa Efetiva de Chegada (lambda_eff)"],
+        "Curva de Custo": curve,
+    }
@@ -0,0 +1,80 @@
+from models.erlang import mmc_distribution
+
+# A tabela para quando a massa restante P(N > n) cai abaixo da tolerância
+# ou quando atinge o número máximo de linhas.
+TABLE_TOLERANCE = 1e-6
+TABLE_MAX_ROWS = 1000
+
+
+def _truncate(rows, tolerance, max_rows, min_rows):
+    """Repassa (n, P_n, acumulada, cauda) até a cauda ficar abaixo da tolerância."""
+    max_rows = max(max_rows, min_rows)
+    for n, p, cumulative, tail in rows:
+        yield n, p, cumulative
+        if n + 1 >= max_rows or (tail < tolerance and n + 1 >= min_rows):
+            return
+
+
+def geometric_states(rho, tolerance=TABLE_TOLERANCE, max_rows=TABLE_MAX_ROWS, min_rows=0):
+    """
+    Gera (n, P_n, P(N ≤ n)) da distribuição geométrica P_n = (1 - ρ)·ρ^n (M/M/1).
+
+    Cada termo sai do anterior por P_n = ρ·P_{n-1}, sem potências, e a cauda
+    P(N > n) = ρ^(n+1) é mantida pela mesma recorrência. A geração para
+    quando a cauda fica abaixo de tolerance (com ao menos min_rows linhas)
+    ou em max_rows linhas.
+    """
+
+    def rows():
+        p = 1 - rho
+        tail = rho
+        n = 0
+        while True:
+            yield n, p, 1 - tail, tail
+            n += 1
+            p *= rho
+            tail *= rho
+
+    return _truncate(rows(), tolerance, max_rows, min_rows)
+
+
+def mmc_states(offered_load, num_servers, tolerance=TABLE_TOLERANCE, max_rows=TABLE_MAX_ROWS, min_rows=0):
+    """
+    Gera (n, P_n, P(N ≤ n)) de uma fila M/M/c, com a = λ/μ < c.
+
+    Até n = c os termos vêm de mmc_distribution (em cache); depois seguem a
+    recorrência P_n = ρ·P_{n-1}, com cauda exata P(N > n) = C·ρ^(n-c+1).
+    """
+    probs, P_queue = mmc_distribution(offered_load, num_servers)
+    rho = offered_load / num_servers
+
+    def rows():
+        cumulative = 0.0
+        for n in range(num_servers):
+            cumulative += probs[n]
+            # Para n = c-1 a cauda é exatamente P_queue
+            tail = P_queue if n == num_servers - 1 else 1 - cumulative
+            yield n, probs[n], cumulative, tail
+
+        n = num_servers
+        p = probs[num_servers]
+        tail = P_queue * rho
+        while True:
+            cumulative += p
+            yield n, p, cumulative, tail
+            n += 1
+            p *= rho
+            tail *= rho
+
+    return _truncate(rows(), tolerance, max_rows, min_rows)
+
+
+def probability_table(states, digits=6):
+    """
+    Consome um gerador de estados e devolve ({n: P_n arredondado}, P(N > último n)).
+    """
+    table = {}
+    cumulative = 0.0
+    for n, p, cumulative in states:
+        table[n] = round(p, digits)
+    return table, max(1 - cumulative, 0.0)
@@ -0,0 +1,201 @@
+"""
+Análise transitória (dependente do tempo) das filas finitas: M/M/1/K,
+M/M/c/K e população finita M/M/c/N.
+
+As quatro filas são processos de nascimento e morte nos mesmos estados
+n = 0..K (ou 0..N) de mm1k_queue_metrics, mmc_k_queue_metrics,
+mm1n_queue_metrics e mmcn_queue_metrics, com gerador tridiagonal guardado
+só pelas taxas de nascimento e morte. Pela uniformização à taxa
+Λ = max(λ_n + μ_n):
+
+    p(t) = Σ_k Poisson(k; Λt)·v_k,   v_k = v_{k-1}·P,   P = I + Q/Λ
+
+Cada v_k custa O(estados) e serve para todos os t de uma vez: os iterados
+são agrupados em blocos e somados com os pesos de Poisson por um produto
+de matrizes (t × bloco) @ (bloco × estados).
+"""
+
+import math
+
+import numpy as np
+
+from models.birth_death import finite_capacity_rates, finite_source_rates, stationary_distribution
+
+# Iterados v_k acumulados por produto de matrizes
+_BLOCK_STEPS = 256
+
+# Pesos de Poisson abaixo disso não entram no produto do bloco
+_NEGLIGIBLE_WEIGHT = 1e-30
+
+# Limite de passos além de Λt: os pesos de Poisson depois de Λt + 12√(Λt) + 30
+# somam menos que 1e-30
+_POISSON_SPREAD = 12
+_POISSON_OFFSET = 30
+
+
+def transient_distribution(birth, death, times, initial_state=0, tolerance=1e-12):
+    """
+    Distribuição p_n(t) de um processo de nascimento e morte para um array de t.
+
+    Parâmetros:
+        birth, death: taxas λ_n e μ_n (death[0] e birth[-1] são ignoradas).
+        times: escalar ou array de t >= 0.
+        initial_state: número de clientes em t = 0, ou a distribuição inicial.
+        tolerance (float): a soma para quando a massa de Poisson restante de
+            todos os t fica abaixo dela, ou quando |v_k - π|₁ fica abaixo
+            dela (π estacionária). P é estocástica e tem π como ponto fixo,
+            então |v_j - π|₁ não cresce com j: todos os iterados seguintes,
+            e a massa restante atribuída a v_k, ficam a menos de tolerance
+            de π. A diferença entre iterados sucessivos não serve de critério:
+            em cadeias que misturam devagar (K grande, ρ perto de 1) ela é
+            pequena longe do estado estacionário.
+
+    Retorna:
+        np.ndarray: matriz (len(times), estados); linha i é p(times[i]).
+    """
+    birth = np.asarray(birth, dtype=float)
+    death = np.asarray(death, dtype=float)
+    states = len(birth)
+    t = np.atleast_1d(np.asarray(times, dtype=float)).ravel()
+
+    if np.ndim(initial_state) == 0:
+        v = np.zeros(states)
+        v[int(initial_state)] = 1.0
+    else:
+        v = np.asarray(initial_state, dtype=float).copy()
+
+    # Gerador tridiagonal: só saem λ_n para n < último e μ_n para n > 0
+    up = birth.copy()
+    up[-1] = 0.0
+    down = death.copy()
+    down[0] = 0.0
+    rate = float((up + down).max())
+    if rate == 0:
+        return np.tile(v, (len(t), 1))
+    up /= rate
+    down /= rate
+    stay = 1 - up - down
+
+    # Sem π (alguma μ_n nula, n >= 1) só vale o critério da cauda de Poisson
+    stationary = stationary_distribution(birth, death) if np.all(death[1:] > 0) else None
+
+    x = rate * t
+    x_max = float(x.max(initial=0.0))
+    max_steps = math.ceil(x_max + _POISSON_SPREAD * math.sqrt(x_max) + _POISSON_OFFSET)
+
+    with np.errstate(divide="ignore"):
+        log_x = np.log(x)
+    log_weight = -x  # log Poisson(0; x)
+    remaining = np.ones_like(x)
+    result = np.zeros((len(t), states))
+
+    block = np.empty((_BLOCK_STEPS, states))
+    weights = np.empty((len(t), _BLOCK_STEPS))
+    k = 0
+    converged = False
+    while not converged and k <= max_steps:
+        size = 0
+        while size < _BLOCK_STEPS and k <= max_steps:
+            if k > 0:
+                log_weight = log_weight + log_x - math.log(k)
+                following = v * stay
+                following[1:] += v[:-1] * up[:-1]
+                following[:-1] += v[1:] * down[1:]
+                v = following
+                converged = stationary is not None and np.abs(v - stationary).sum() < tolerance
+            block[size] = v
+            weights[:, size] = np.exp(log_weight)
+            remaining -= weights[:, size]
+            size += 1
+            k += 1
+            if converged or remaining.max() < tolerance:
+                converged = True
+                break
+        # Só os t cuja janela de Poisson cobre o bloco entram no produto
+        active = np.flatnonzero(weights[:, :size].max(axis=1) > _NEGLIGIBLE_WEIGHT)
+        if len(active):
+            result[active] += weights[active, :size] @ block[:size]
+
+    # Massa de Poisson ainda não usada vai para o último iterado
+    result += np.clip(remaining, 0, None)[:, None] * v
+    return result
+
+
+def transient_metrics(birth, death, num_servers, times, initial_state=0, tolerance=1e-12):
+    """
+    p_n(t), L(t), Lq(t), servidores ocupados e λ_eff(t) para um array de t.
+
+    Retorna:
+        dict: arrays com uma entrada por t ("Probabilidades Pn(t)" tem uma
+        linha por t).
+    """
+    probs = transient_distribution(birth, death, times, initial_state, tolerance)
+    n = np.arange(probs.shape[1])
+    return {
+        "Tempos (t)": np.atleast_1d(np.asarray(times, dtype=float)).ravel(),
+        "Número Médio no Sistema L(t)": probs @ n,
+        "Número Médio na Fila Lq(t)": probs @ np.maximum(n - num_servers, 0),
+        "Número Médio de Servidores Ocupados(t)": probs @ np.minimum(n, num_servers),
+        "Taxa Efetiva de Chegada lambda_eff(t)": probs[:, :-1] @ np.asarray(birth, dtype=float)[:-1],
+        "Probabilidades Pn(t)": probs,
+    }
+
+
+def mmck_transient_metrics(arrival_rate, service_rate, num_servers, max_capacity, times, initial_clients=0):
+    """
+    Métricas transitórias de uma fila M/M/c/K (M/M/1/K com num_servers = 1).
+
+    Parâmetros:
+        arrival_rate (float): λ, taxa média de chegada.
+        service_rate (float): μ, taxa média de serviço.
+        num_servers (int): c, número de servidores.
+        max_capacity (int): K, capacidade máxima do sistema.
+        times: valores de t >= 0.
+        initial_clients: clientes no sistema em t = 0 (ou a distribuição inicial).
+
+    Retorna:
+        dict: métricas de transient_metrics e "Probabilidade de Bloqueio P_K(t)".
+    """
+    if service_rate <= 0 or arrival_rate <= 0 or num_servers <= 0 or max_capacity <= 0:
+        return {"Erro": "Todos os parâmetros devem ser maiores que zero."}
+    if np.ndim(initial_clients) == 0 and not 0 <= initial_clients <= max_capacity:
+        return {"Erro": "O número inicial de clientes deve estar entre 0 e K."}
+
+    birth, death = finite_capacity_rates(arrival_rate, service_rate, num_servers, max_capacity)
+    metrics = transient_metrics(birth, death, num_servers, times, initial_clients)
+    metrics["Probabilidade de Bloqueio P_K(t)"] = metrics["Probabilidades Pn(t)"][:, -1]
+    return metrics
+
+
+def mm1k_transient_metrics(arrival_rate, service_rate, max_capacity, times, initial_clients=0):
+    """Métricas transitórias de uma fila M/M/1/K (ver mmck_transient_metrics)."""
+    return mmck_transient_metrics(arrival_rate, service_rate, 1, max_capacity, times, initial_clients)
+
+
+def mmcn_transient_metrics(arrival_rate, service_rate, num_servers, population_size, times, initial_clients=0):
+    """
+    Métricas transitórias de uma fila M/M/c/N com população finita.
+
+    Parâmetros:
+        arrival_rate (float): λ, taxa de chegada por cliente fora do sistema.
+        service_rate (float): μ, taxa média de serviço.
+        num_servers (int): c, número de servidores.
+        population_size (int): N, tamanho da população.
+        times: valores de t >= 0.
+        initial_clients: clientes no sistema em t = 0 (ou a distribuição inicial).
+
+    Retorna:
+        dict: métricas de transient_metrics.
+    """
+    if service_rate <= 0 or arrival_rate <= 0 or num_servers <= 0 or population_size <= 0:
+        return {"Erro": "Todos os parâmetros devem ser maiores que zero."}
+    if np.ndim(initial_clients) == 0 and not 0 <= initial_clients <= population_size:
+        return {"Erro": "O número inicial de clientes deve estar entre 0 e N."}
+
+    birth, death = finite_source_rates(arrival_rate, service_rate, num_servers, population_size)
+    return transient_metrics(birth, death, num_servers, times, initial_clients)
+
+
+def mm1n_transient_metrics(arrival_rate, service_rate, population_size, times, initial_clients=0):
+    """Métricas transitórias de uma fila M/M/1/N (ver mmcn_transient_metrics)."""
+    return mmcn_transient_metrics(arrival_rate, service_rate, 1, population_size, times, initial_clients)
@@ -0,0 +1,199 @@
+"""
+Distribuição dos tempos de espera (Wq) e no sistema (W), sob FCFS, das filas
+markovianas com capacidade finita (M/M/c/K) ou população finita (M/M/c/N).
+
+Um cliente admitido que encontra n >= c clientes espera n - c + 1 saídas a
+taxa cμ, ou seja, uma Erlang(n - c + 1, cμ); depois é atendido em Exp(μ).
+Com uniformização à taxa r = cμ, as duas caudas ficam somas de pesos de
+Poisson:
+
+    P(Wq > t) = Σ_j Poisson(j; rt)·G_j,   G_j = P(fases > j)
+    P(W > t)  = Σ_m Poisson(m; rt)·H_m,   H_m = G_m + D_m,
+    D_m = β·D_{m-1} + q_m,   β = 1 - 1/c
+
+onde q_k é a probabilidade de o cliente precisar de k fases. Todos os
+termos ficam entre 0 e 1, então não há estouro, e a matriz de pesos de
+Poisson é montada para um array inteiro de t de uma vez.
+"""
+
+import math
+
+import numpy as np
+
+# Elementos da matriz (t × estados) avaliados por bloco
+_BLOCK_ELEMENTS = 1 << 22
+
+# Fases por bloco da recorrência D_m = β·D_{m-1} + q_m
+_FILTER_BLOCK = 256
+
+
+def arrival_probabilities_finite_capacity(probs):
+    """P(cliente admitido encontra n), n = 0..K-1, em uma fila com capacidade K."""
+    probs = np.asarray(probs, dtype=float)
+    return probs[:-1] / (1 - probs[-1])
+
+
+def arrival_probabilities_finite_source(probs):
+    """
+    P(cliente que chega encontra n), n = 0..N-1, em uma fila de população N:
+    proporcional a (N - n)·P_n.
+    """
+    probs = np.asarray(probs, dtype=float)
+    population_size = len(probs) - 1
+    weights = (population_size - np.arange(population_size)) * probs[:-1]
+    return weights / weights.sum()
+
+
+def waiting_time_metrics(arrival_probs, num_servers, service_rate, waiting_times=None, percentiles=None):
+    """
+    Chaves extras dos modelos finitos para os t e percentis pedidos (ou {}).
+    """
+    metrics = {}
+    if waiting_times is not None:
+        P_Wq, P_W = waiting_time_tails(arrival_probs, num_servers, service_rate, waiting_times)
+        metrics["Probabilidade de W > t"] = P_W
+        metrics["Probabilidade de Wq > t"] = P_Wq
+    if percentiles is not None:
+        Wq_p, W_p = waiting_time_percentiles(arrival_probs, num_servers, service_rate, percentiles)
+        metrics["Percentis de W"] = W_p
+        metrics["Percentis de Wq"] = Wq_p
+    return metrics
+
+
+def _phase_weights(arrival_probs, num_servers):
+    """q_k: probabilidade de o cliente esperar k saídas (k = 0 = sem espera)."""
+    waiting = arrival_probs[num_servers:]
+    return np.concatenate(([arrival_probs[:num_servers].sum()], waiting))
+
+
+def _geometric_filter(q, beta):
+    """
+    D_m = β·D_{m-1} + q_m (D_{-1} = 0), em blocos: dentro de cada bloco
+    D = T·q + β^(i+1)·D_anterior, com T[i, k] = β^(i-k) triangular.
+    """
+    i = np.arange(_FILTER_BLOCK)
+    powers = np.tril(np.power(beta, np.maximum(i[:, None] - i[None, :], 0)))
+    carry = np.power(beta, i + 1)
+
+    D = np.empty(len(q))
+    d = 0.0
+    for begin in range(0, len(q), _FILTER_BLOCK):
+        chunk = q[begin : begin + _FILTER_BLOCK]
+        size = len(chunk)
+        D[begin : begin + size] = powers[:size, :size] @ chunk + carry[:size] * d
+        d = D[begin + size - 1]
+    return D
+
+
+def _tail_terms(arrival_probs, num_servers):
+    """
+    G_m e H_m = G_m + D_m de todas as fases m, independentes de t e de μ.
+
+    Além de M + log(ε)/log(β) fases o termo D_m é desprezível, então os
+    arrays param aí; para m > M o D_m é só a cauda geométrica D_M·β^(m-M).
+    """
+    q = _phase_weights(np.asarray(arrival_probs, dtype=float), num_servers)
+    phases = len(q) - 1
+    beta = 1 - 1 / num_servers
+    decay = math.ceil(math.log(1e-17) / math.log(beta)) if beta > 0 else 1
+    size = max(1, phases + decay)
+
+    G = np.zeros(size)
+    tail = q[::-1].cumsum()[::-1]  # P(fases >= k)
+    head = min(phases, size)
+    G[:head] = tail[1 : head + 1]
+
+    D = np.zeros(size)
+    D[: phases + 1] = _geometric_filter(q, beta)[:size]
+    if size > phases + 1:
+        D[phases + 1 :] = D[phases] * np.power(beta, np.arange(1, size - phases))
+    return G, G + D
+
+
+def _poisson_tails(G, H, x):
+    """Σ_m Poisson(m; x)·G_m e Σ_m Poisson(m; x)·H_m para um array x = rt."""
+    x_max = float(x.max(initial=0.0))
+
+    # Além de m ≈ x + 12√x os pesos de Poisson são desprezíveis
+    poisson_limit = math.ceil(x_max + 12 * math.sqrt(x_max) + 30)
+    size = max(1, min(len(G), poisson_limit))
+    G = G[:size]
+    H = H[:size]
+
+    m = np.arange(size)
+    log_factorial = np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, size)))))
+    P_Wq = np.empty_like(x)
+    P_W = np.empty_like(x)
+    block = max(1, _BLOCK_ELEMENTS // size)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for begin in range(0, len(x), block):
+            xb = x[begin : begin + block, None]
+            log_x = np.log(xb)
+            log_pmf = np.where(xb > 0, m * log_x - xb - log_factorial, np.where(m == 0, 0.0, -np.inf))
+            pmf = np.exp(log_pmf)
+            P_Wq[begin : begin + block] = pmf @ G
+            P_W[begin : begin + block] = pmf @ H
+
+    return np.clip(P_Wq, 0, 1), np.clip(P_W, 0, 1)
+
+
+def waiting_time_tails(arrival_probs, num_servers, service_rate, waiting_times):
+    """
+    P(Wq > t) e P(W > t) para um array de t, em uma única chamada.
+
+    Parâmetros:
+        arrival_probs: P(cliente admitido encontra n), n = 0, 1, ...
+        num_servers (int): c.
+        service_rate (float): μ.
+        waiting_times: escalar ou array de t >= 0.
+
+    Retorna:
+        tuple: (P(Wq > t), P(W > t)), arrays com o formato de waiting_times.
+    """
+    t = np.asarray(waiting_times, dtype=float)
+    G, H = _tail_terms(arrival_probs, num_servers)
+    P_Wq, P_W = _poisson_tails(G, H, num_servers * service_rate * t.ravel())
+    return P_Wq.reshape(t.shape), P_W.reshape(t.shape)
+
+
+def waiting_time_percentiles(arrival_probs, num_servers, service_rate, percentiles):
+    """
+    Percentis de Wq e W (t tal que P(· <= t) = p) para um array de p em (0, 1).
+
+    Os termos G_m e H_m por fase são montados uma vez; a bisseção só refaz
+    os pesos de Poisson, com os percentis de Wq e de W de todos os p no
+    mesmo array. O percentil de Wq é 0 quando P(Wq > 0) <= 1 - p.
+
+    Retorna:
+        tuple: (percentis de Wq, percentis de W).
+    """
+    p = np.asarray(percentiles, dtype=float)
+    count = p.size
+    G, H = _tail_terms(arrival_probs, num_servers)
+    rate = num_servers * service_rate
+
+    # Primeira metade: Wq; segunda: W
+    target = np.tile(1 - p.ravel(), 2)
+    is_wq = np.arange(2 * count) < count
+
+    def tail(t):
+        P_Wq, P_W = _poisson_tails(G, H, rate * t)
+        return np.where(is_wq, P_Wq, P_W)
+
+    lo = np.zeros_like(target)
+    hi = np.full_like(target, 1 / service_rate)
+    for _ in range(200):
+        above = tail(hi) > target
+        if not above.any():
+            break
+        hi = np.where(above, 2 * hi, hi)
+
+    for _ in range(60):
+        mid = (lo + hi) / 2
+        above = tail(mid) > target
+        lo = np.where(above, mid, lo)
+        hi = np.where(above, hi, mid)
+
+    result = np.where(tail(np.zeros_like(target)) <= target, 0.0, hi)
+    return result[:count].reshape(p.shape), result[count:].reshape(p.shape)
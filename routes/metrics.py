@@ -0,0 +1,127 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import Response, before_render_template, g, has_request_context, request, template_rendered
+
+
+# Tempo por request, por blueprint e por fase, exposto em /metrics no
+# formato texto do Prometheus. "compute" é o tempo dentro dos modelos
+# (cached_metrics), "render" o de render_template e "parse" o restante
+# (leitura do formulário e montagem das tabelas).
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_lock = threading.Lock()
+_requests = {}  # (blueprint, método, status) -> contagem
+_histograms = {}  # (blueprint, fase) -> [contagens por faixa, soma, total]
+
+
+@contextmanager
+def phase(name):
+    """Soma a duração do bloco à fase name do request atual, se houver."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if has_request_context() and "phases" in g:
+            g.phases[name] += time.perf_counter() - start
+
+
+def _observe(blueprint, name, seconds):
+    key = (blueprint, name)
+    histogram = _histograms.get(key)
+    if histogram is None:
+        histogram = _histograms.setdefault(key, [[0] * (len(BUCKETS) + 1), 0.0, 0])
+    histogram[0][bisect.bisect_left(BUCKETS, seconds)] += 1
+    histogram[1] += seconds
+    histogram[2] += 1
+
+
+def _before_request():
+    g.phases = {"compute": 0.0, "render": 0.0}
+    g.request_start = time.perf_counter()
+
+
+def _after_request(response):
+    if "request_start" not in g:
+        return response
+
+    total = time.perf_counter() - g.request_start
+    phases = g.phases
+    blueprint = request.blueprint or "app"
+    parse = max(total - phases["compute"] - phases["render"], 0.0)
+
+    with _lock:
+        key = (blueprint, request.method, response.status_code)
+        _requests[key] = _requests.get(key, 0) + 1
+        _observe(blueprint, "parse", parse)
+        _observe(blueprint, "compute", phases["compute"])
+        _observe(blueprint, "render", phases["render"])
+        _observe(blueprint, "total", total)
+    return response
+
+
+def _render_started(sender, template, context, **extra):
+    g.render_start = time.perf_counter()
+
+
+def _render_finished(sender, template, context, **extra):
+    if "phases" in g and "render_start" in g:
+        g.phases["render"] += time.perf_counter() - g.render_start
+
+
+def _labels(**labels):
+    return ",".join(f'{name}="{value}"' for name, value in labels.items())
+
+
+def metrics_text():
+    """Contadores e histogramas no formato texto do Prometheus."""
+    from models.erlang import erlang_cache_info
+    from routes.result_cache import result_cache_info
+
+    with _lock:
+        requests = sorted(_requests.items())
+        histograms = sorted((key, [list(h[0]), h[1], h[2]]) for key, h in _histograms.items())
+
+    lines = [
+        "# HELP filas_requests_total Requests por blueprint, método e status.",
+        "# TYPE filas_requests_total counter",
+    ]
+    for (blueprint, method, status), count in requests:
+        lines.append(
+            f"filas_requests_total{{{_labels(blueprint=blueprint, method=method, status=status)}}} {count}"
+        )
+
+    lines += [
+        "# HELP filas_request_phase_seconds Duração dos requests por fase (parse, compute, render, total).",
+        "# TYPE filas_request_phase_seconds histogram",
+    ]
+    for (blueprint, name), (counts, total, count) in histograms:
+        labels = _labels(blueprint=blueprint, phase=name)
+        cumulative = 0
+        for bound, bucket in zip(BUCKETS + ("+Inf",), counts):
+            cumulative += bucket
+            lines.append(f'filas_request_phase_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f"filas_request_phase_seconds_sum{{{labels}}} {total}")
+        lines.append(f"filas_request_phase_seconds_count{{{labels}}} {count}")
+
+    caches = (("routes", result_cache_info()), ("erlang", erlang_cache_info()))
+    for name in ("hits", "misses", "evictions"):
+        lines.append(f"# TYPE filas_cache_{name}_total counter")
+        for cache, info in caches:
+            lines.append(f'filas_cache_{name}_total{{cache="{cache}"}} {info[name]}')
+
+    return "\n".join(lines) + "\n"
+
+
+def init_metrics(app):
+    """Registra os hooks de tempo e a rota /metrics na aplicação."""
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    before_render_template.connect(_render_started, app)
+    template_rendered.connect(_render_finished, app)
+
+    @app.route("/metrics")
+    def metrics():
+        return Response(metrics_text(), mimetype="text/plain; version=0.0.4")
@@ -1,7 +1,10 @@
 from flask import Blueprint, render_template, request, flash
 from models.mg1_queue import mg1_queue_metrics
+from models.ggc_queue import ggc_queue_metrics
+from models.state_tables import geometric_states, probability_table
 from models.mg1_preemptive_priority import mg1_preemptive_priority_metrics
 from models.mg1_non_preemptive_priority import mg1_non_preemptive_priority_metrics
+from routes.result_cache import cached_metrics
 
 bp = Blueprint("mg1", __name__, url_prefix="/mg1")
 
@@ -31,17 +34,27 @@ def index():
             params = {"lambda": lam, "mu": mu, "sigma2": var}
 
             try:
-                metrics = mg1_queue_metrics(lam, mu, var)
+                metrics = cached_metrics(mg1_queue_metrics, lam, mu, var)
 
                 rho = metrics.get("Taxa de Ocupação (ρ)", 0)
-                P0 = metrics.get("\nProbabilidade de Não Esperar (P0)", 0)
+                prob_table, _ = probability_table(geometric_states(rho))
 
-                table = {}
-                for n in range(21):
-                    table[n] = round(P0 * (rho**n), 6)
+            except Exception as e:
+                flash(str(e), "danger")
+
+        elif mode == "ggc":
+
+            lam = _to_float(request.form.get("lambda"))
+            mu = _to_float(request.form.get("mu"))
+            var = _to_float(request.form.get("sigma2"))
+            c = int(_to_float(request.form.get("c"), 1))
+            ca2 = _to_float(request.form.get("ca2"), 1.0)
+            method = request.form.get("method", "allen_cunneen")
 
-                prob_table = table
+            params = {"lambda": lam, "mu": mu, "sigma2": var, "c": c, "ca2": ca2, "method": method}
 
+            try:
+                metrics = cached_metrics(ggc_queue_metrics, lam, mu, c, var, ca2, method)
             except Exception as e:
                 flash(str(e), "danger")
 
@@ -52,7 +65,7 @@ def index():
                 variances = [_to_float(x) for x in request.form.getlist("var[]")]
 
                 params = {"lambda": lambdas, "service": services, "var": variances}
-                metrics = mg1_preemptive_priority_metrics(lambdas, services, variances)
+                metrics = cached_metrics(mg1_preemptive_priority_metrics, lambdas, services, variances)
 
             except Exception as e:
                 flash(str(e), "danger")
@@ -64,7 +77,8 @@ def index():
                 variances = [_to_float(x) for x in request.form.getlist("var[]")]
 
                 params = {"lambda": lambdas, "service": services, "var": variances}
-                metrics = mg1_non_preemptive_priority_metrics(
+                metrics = cached_metrics(
+                    mg1_non_preemptive_priority_metrics,
                     lambdas, services, variances
                 )
 
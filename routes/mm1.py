@@ -1,5 +1,7 @@
 from flask import Blueprint, render_template, request, flash
 from models.mm1_queue import mm1_queue_metrics
+from models.state_tables import geometric_states, probability_table
+from routes.result_cache import cached_metrics
 
 bp = Blueprint("mm1", __name__, url_prefix="/mm1")
 
@@ -41,7 +43,7 @@ def index():
         }
 
         try:
-            metrics = mm1_queue_metrics(lam, mu, t_w, t_wq, n)
+            metrics = cached_metrics(mm1_queue_metrics, lam, mu, t_w, t_wq, n)
 
             if "Erro" in metrics:
                 flash(metrics["Erro"], "danger")
@@ -57,15 +59,9 @@ def index():
             or 0
         )
 
-        P0 = (
-            metrics.get("Probabilidade de Não Esperar (P_0)")
-            or metrics.get("Probabilidade de o Sistema Ocioso (P(n=0))")
-            or (1 - rho)
-        )
-
-        prob_table = {}
-        for k in range(21):
-            prob_table[k] = round(P0 * (rho**k), 6)
+        # Tabela até a massa restante ficar desprezível (ou TABLE_MAX_ROWS linhas)
+        prob_table, tail = probability_table(geometric_states(rho))
+        metrics["prob_table_tail"] = tail
 
         metrics["prob_table"] = prob_table
 
@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, request, flash
 from models.mm1_non_preemptive_priority import mm1_priority_non_preemptive_metrics
+from routes.result_cache import cached_metrics
 
 bp = Blueprint("mm1_non_preemptive", __name__, url_prefix="/mm1_non_preemptive")
 
@@ -36,7 +37,7 @@ def index():
             flash("Informe pelo menos um valor de λ.", "danger")
         else:
             try:
-                metrics = mm1_priority_non_preemptive_metrics(lambdas, mu)
+                metrics = cached_metrics(mm1_priority_non_preemptive_metrics, lambdas, mu)
 
                 if "Erro" in metrics:
                     flash(metrics["Erro"], "danger")
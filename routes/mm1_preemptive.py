@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, request, flash
 from models.mm1_preemptive_priority import mm1_priority_preemptive_metrics
+from routes.result_cache import cached_metrics
 
 bp = Blueprint("mm1_preemptive", __name__, url_prefix="/mm1_preemptive")
 
@@ -34,7 +35,7 @@ def index():
 
         else:
             try:
-                metrics = mm1_priority_preemptive_metrics(lambdas, mu)
+                metrics = cached_metrics(mm1_priority_preemptive_metrics, lambdas, mu)
 
                 if isinstance(metrics, dict) and "Erro" in metrics:
                     flash(metrics["Erro"], "danger")
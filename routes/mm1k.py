@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, request, flash
 from models.mm1k_queue import mm1k_queue_metrics
+from routes.result_cache import cached_metrics
 
 bp = Blueprint("mm1k", __name__, url_prefix="/mm1k")
 
@@ -39,7 +40,7 @@ def index():
         }
 
         try:
-            metrics = mm1k_queue_metrics(lam, mu, K, CE, CA, n)
+            metrics = cached_metrics(mm1k_queue_metrics, lam, mu, K, CE, CA, n)
 
             if "Erro" in metrics:
                 flash(metrics["Erro"], "danger")
@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, request, flash
 from models.mm1n_queue import mm1n_queue_metrics
+from routes.result_cache import cached_metrics
 
 bp = Blueprint("mm1n", __name__, url_prefix="/mm1n")
 
@@ -31,7 +32,7 @@ def index():
         params = {"lambda": lam, "mu": mu, "N": N, "CE": CE, "CA": CA}
 
         try:
-            metrics = mm1n_queue_metrics(lam, mu, N, CE, CA)
+            metrics = cached_metrics(mm1n_queue_metrics, lam, mu, N, CE, CA)
             if isinstance(metrics, dict) and "Erro" in metrics:
                 flash(metrics["Erro"], "danger")
                 metrics = None
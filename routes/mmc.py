@@ -1,6 +1,8 @@
-import math
 from flask import Blueprint, render_template, request, flash
 from models.mmc_queue import mmc_queue_metrics
+from models.staffing import mmc_staffing, mmck_staffing
+from models.state_tables import TABLE_MAX_ROWS, mmc_states, probability_table
+from routes.result_cache import cached_metrics
 
 bp = Blueprint("mmc", __name__, url_prefix="/mmc")
 
@@ -40,7 +42,7 @@ def index():
         }
 
         try:
-            metrics = mmc_queue_metrics(lam, mu, c, t_w, t_wq, n)
+            metrics = cached_metrics(mmc_queue_metrics, lam, mu, c, t_w, t_wq, n)
 
             if "Erro" in metrics:
                 flash(metrics["Erro"], "danger")
@@ -50,23 +52,78 @@ def index():
             flash(f"Erro no M/M/s: {e}", "danger")
             return render_template("model_mmc.html", params=params)
 
-        prob_table = {}
+        # Tabela até n e além, até a massa restante ficar desprezível
+        prob_table, tail = probability_table(
+            mmc_states(lam / mu, c, min_rows=min(n + 1, TABLE_MAX_ROWS))
+        )
 
-        rho = metrics.get("Taxa de Ocupação (ρ)")
-        P0 = metrics.get("Probabilidade do sistema estar vazio (P0)")
+        metrics["prob_table"] = prob_table
+        metrics["prob_table_tail"] = tail
 
-        for i in range(n + 1):
-            if i < c:
-                val = ((lam / mu) ** i / math.factorial(i)) * P0
-            else:
-                val = ((lam / mu) ** i / (math.factorial(c) * (c ** (i - c)))) * P0
+        metrics["P(n)"] = round(metrics["P(n) — Probabilidade de haver n clientes"], 6)
+        metrics["P(N > n)"] = metrics["P(N > n) — Probabilidade de haver mais que n clientes"]
+        metrics["P(N ≤ n)"] = metrics["P(N ≤ n) — Probabilidade de haver até n clientes"]
 
-            prob_table[i] = round(val, 6)
+    return render_template("model_mmc.html", params=params, metrics=metrics)
 
-        metrics["prob_table"] = prob_table
 
-        metrics["P(n)"] = prob_table.get(n, 0)
-        metrics["P(N > n)"] = 1 - sum(prob_table.values())
-        metrics["P(N ≤ n)"] = sum(prob_table.values())
+@bp.route("/staffing", methods=["GET", "POST"])
+def staffing():
+    params = {}
+    metrics = None
 
-    return render_template("model_mmc.html", params=params, metrics=metrics)
+    if request.method == "POST":
+        mode = request.form.get("mode", "mmc")
+        lam = _to_float(request.form.get("lambda"))
+        mu = _to_float(request.form.get("mu"))
+        t = _to_float(request.form.get("t"))
+
+        # Metas em branco são ignoradas
+        max_wq = _to_float(request.form.get("max_wq"), None)
+        max_pq = _to_float(request.form.get("max_pq"), None)
+        max_pwq = _to_float(request.form.get("max_pwq"), None)
+        max_block = _to_float(request.form.get("max_block"), None)
+
+        try:
+            K = int(request.form.get("K", 0))
+        except:
+            K = 0
+
+        params = {
+            "mode": mode,
+            "lambda": lam,
+            "mu": mu,
+            "t": t,
+            "K": K,
+            "max_wq": max_wq,
+            "max_pq": max_pq,
+            "max_pwq": max_pwq,
+            "max_block": max_block,
+        }
+
+        try:
+            if mode == "mmck":
+                if max_block is None:
+                    metrics = {"Erro": "Informe a meta de bloqueio."}
+                else:
+                    metrics = cached_metrics(mmck_staffing, lam, mu, K, max_block)
+            else:
+                metrics = cached_metrics(
+                    mmc_staffing,
+                    lam,
+                    mu,
+                    max_wq=max_wq,
+                    max_queue_probability=max_pq,
+                    max_wq_probability=max_pwq,
+                    waiting_time=t,
+                )
+
+            if "Erro" in metrics:
+                flash(metrics["Erro"], "danger")
+                metrics = None
+
+        except Exception as e:
+            flash(f"Erro no dimensionamento: {e}", "danger")
+            metrics = None
+
+    return render_template("model_mmc_staffing.html", params=params, metrics=metrics)
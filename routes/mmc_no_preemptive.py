@@ -1,6 +1,7 @@
 # routes/mmc_no_preemptive.py
 from flask import Blueprint, render_template, request, flash
 from models.mmc_no_preemptive_priority import mmc_no_preemptive_priority
+from routes.result_cache import cached_metrics
 
 bp = Blueprint("mmc_no_preemptive", __name__, url_prefix="/mmc_no_preemptive")
 
@@ -48,7 +49,7 @@ def index():
 
         else:
             try:
-                metrics = mmc_no_preemptive_priority(lambdas, mu, servers)
+                metrics = cached_metrics(mmc_no_preemptive_priority, lambdas, mu, servers)
                 if isinstance(metrics, dict) and "Erro" in metrics:
                     flash(metrics["Erro"], "danger")
                     metrics = None
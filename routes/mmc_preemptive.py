@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, request, flash
 from models.mmc_preemptive_priority import mmc_priority_preemptive_metrics
+from routes.result_cache import cached_metrics
 
 bp = Blueprint("mmc_preemptive", __name__, url_prefix="/mmc_preemptive")
 
@@ -48,7 +49,7 @@ def index():
 
         else:
             try:
-                metrics = mmc_priority_preemptive_metrics(lambdas, mu, servers)
+                metrics = cached_metrics(mmc_priority_preemptive_metrics, lambdas, mu, servers)
 
                 if isinstance(metrics, dict) and "Erro" in metrics:
                     flash(metrics["Erro"], "danger")
@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, request, flash
 from models.mmck_queue import mmc_k_queue_metrics
+from routes.result_cache import cached_metrics
 
 bp = Blueprint("mmck", __name__, url_prefix="/mmck")
 
@@ -47,7 +48,7 @@ def index():
         }
 
         try:
-            metrics = mmc_k_queue_metrics(lam, mu, c, K, CE, CA, n)
+            metrics = cached_metrics(mmc_k_queue_metrics, lam, mu, c, K, CE, CA, n)
 
             if isinstance(metrics, dict) and "Erro" in metrics:
                 flash(metrics["Erro"], "danger")
@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, request, flash
 from models.mmcn_queue import mmcn_queue_metrics
+from routes.result_cache import cached_metrics
 
 bp = Blueprint("mmcn", __name__, url_prefix="/mmcn")
 
@@ -29,7 +30,7 @@ def index():
 
         params = {"lambda": lam, "mu": mu, "s": s, "N": N, "CE": CE, "CA": CA}
         try:
-            metrics = mmcn_queue_metrics(lam, mu, s, N, CE, CA)
+            metrics = cached_metrics(mmcn_queue_metrics, lam, mu, s, N, CE, CA)
             if isinstance(metrics, dict) and "Erro" in metrics:
                 flash(metrics["Erro"], "danger")
                 metrics = None
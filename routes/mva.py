@@ -0,0 +1,63 @@
+from flask import Blueprint, render_template, request, flash
+from models.closed_network import mva_metrics
+from routes.result_cache import cached_metrics
+
+bp = Blueprint("mva", __name__, url_prefix="/mva")
+
+
+def _to_float(val, default=None):
+    try:
+        return float(str(val).replace(",", "."))
+    except:
+        return default
+
+
+@bp.route("/", methods=["GET", "POST"])
+def index():
+    params = {"N": "", "Z": "0", "method": "auto", "stations": []}
+    metrics = None
+
+    if request.method == "POST":
+        try:
+            N = int(request.form.get("N", 0))
+        except:
+            N = 0
+        Z = _to_float(request.form.get("Z"), 0.0)
+        method = request.form.get("method", "auto")
+
+        # Uma linha por estação: S, V e c (linhas sem S são ignoradas)
+        stations = []
+        for S, V, c in zip(
+            request.form.getlist("S[]"), request.form.getlist("V[]"), request.form.getlist("c[]")
+        ):
+            S = _to_float(S)
+            if S is None:
+                continue
+            try:
+                c = int(c)
+            except:
+                c = 1
+            stations.append({"S": S, "V": _to_float(V, 1.0), "c": c})
+
+        params = {"N": N, "Z": Z, "method": method, "stations": stations}
+
+        if not stations:
+            flash("Informe pelo menos uma estação.", "danger")
+        else:
+            try:
+                metrics = cached_metrics(
+                    mva_metrics,
+                    N,
+                    [s["S"] for s in stations],
+                    [s["V"] for s in stations],
+                    [s["c"] for s in stations],
+                    Z,
+                    method,
+                )
+                if isinstance(metrics, dict) and "Erro" in metrics:
+                    flash(metrics["Erro"], "danger")
+                    metrics = None
+            except Exception as e:
+                flash(f"Erro ao executar a MVA: {e}", "danger")
+
+    return render_template("model_mva.html", params=params, metrics=metrics)
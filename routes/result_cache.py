@@ -0,0 +1,128 @@
+import threading
+import time
+from collections import OrderedDict
+
+from routes.metrics import phase
+
+
+# Cache de resultados das rotas HTML. Turmas inteiras enviam os mesmos
+# parâmetros padrão; a chave é a função do modelo com os parâmetros já
+# convertidos por _to_float, em forma canônica.
+# Além do número de entradas, o cache é limitado pelo total de valores
+# guardados (números das listas Pn, tabelas etc.), como CACHE_MAX_STATES em
+# models/erlang.py; resultados maiores que RESULT_CACHE_MAX_ENTRY_VALUES
+# (K ou N enormes) não entram.
+RESULT_CACHE_MAX_ENTRIES = 4096
+RESULT_CACHE_MAX_VALUES = 2_000_000
+RESULT_CACHE_MAX_ENTRY_VALUES = 100_000
+RESULT_CACHE_TTL = 600.0  # segundos
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "skipped": 0, "values": 0}
+
+
+def _canonical(value):
+    """
+    Forma canônica de um parâmetro: -0.0 vira 0.0 e listas viram tuplas.
+
+    O texto do formulário já chega normalizado por _to_float ("2,5" e "2.50"
+    viram 2.5), então a chave só depende dos valores numéricos.
+    """
+    if isinstance(value, float):
+        return value + 0.0
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _canonical(v)) for k, v in value.items()))
+    return value
+
+
+def _size(value):
+    """Quantidade de valores de um resultado (folhas de dicts, listas e arrays)."""
+    if isinstance(value, dict):
+        return sum(_size(v) for v in value.values()) or 1
+    if isinstance(value, (list, tuple)):
+        return sum(_size(v) for v in value) or 1
+    return getattr(value, "size", 1)
+
+
+def _copy(value):
+    """
+    Copia só os dicionários: as rotas acrescentam chaves (prob_table, ...)
+    ao dicionário de métricas, mas não alteram as listas dentro dele, que
+    ficam compartilhadas com o cache em vez de copiadas a cada acerto.
+    """
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    return value
+
+
+def _evict(key):
+    _, _, size = _cache.pop(key)
+    _cache_stats["values"] -= size
+
+
+def cached_metrics(function, *args, **kwargs):
+    """
+    Chama function(*args, **kwargs) passando pelo cache LRU com validade.
+
+    Resultados com "Erro" também são guardados (são determinísticos);
+    exceções não, nem resultados com mais de RESULT_CACHE_MAX_ENTRY_VALUES
+    valores. Devolve uma cópia dos dicionários (ver _copy), pois as rotas
+    acrescentam chaves como prob_table ao dicionário de métricas.
+    """
+    key = (
+        function.__module__,
+        function.__qualname__,
+        _canonical(args),
+        _canonical(kwargs),
+    )
+    now = time.monotonic()
+
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            value, expires, _ = entry
+            if expires > now:
+                _cache.move_to_end(key)
+                _cache_stats["hits"] += 1
+                return _copy(value)
+            _evict(key)
+            _cache_stats["expirations"] += 1
+        _cache_stats["misses"] += 1
+
+    with phase("compute"):
+        value = function(*args, **kwargs)
+
+    size = _size(value)
+    with _cache_lock:
+        if size > RESULT_CACHE_MAX_ENTRY_VALUES:
+            _cache_stats["skipped"] += 1
+            return value
+        if key in _cache:
+            _evict(key)
+        _cache[key] = (_copy(value), now + RESULT_CACHE_TTL, size)
+        _cache_stats["values"] += size
+        while len(_cache) > RESULT_CACHE_MAX_ENTRIES or _cache_stats["values"] > RESULT_CACHE_MAX_VALUES:
+            _evict(next(iter(_cache)))
+            _cache_stats["evictions"] += 1
+    return value
+
+
+def result_cache_info():
+    """Contadores do cache: hits, misses, evictions, expirations, skipped, values, entries e hit_rate."""
+    with _cache_lock:
+        lookups = _cache_stats["hits"] + _cache_stats["misses"]
+        return dict(
+            _cache_stats,
+            entries=len(_cache),
+            hit_rate=_cache_stats["hits"] / lookups if lookups else 0.0,
+        )
+
+
+def result_cache_clear():
+    """Esvazia o cache e zera os contadores."""
+    with _cache_lock:
+        _cache.clear()
+        _cache_stats.update(hits=0, misses=0, evictions=0, expirations=0, skipped=0, values=0)
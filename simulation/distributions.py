@@ -0,0 +1,96 @@
+"""
+Distribuições de amostragem para a simulação.
+
+Um amostrador é uma função sample(rng, size) que devolve um array NumPy com
+size amostras. Os simuladores aceitam, no lugar de um amostrador, um número
+(interpretado como taxa de uma exponencial).
+"""
+
+import functools
+import math
+
+import numpy as np
+
+# Tamanho dos lotes pré-gerados de amostras
+BATCH_SIZE = 65_536
+
+
+def _exponential(scale, rng, size):
+    return rng.exponential(scale, size)
+
+
+def _constant(value, rng, size):
+    return np.full(size, value)
+
+
+def _uniform(low, high, rng, size):
+    return rng.uniform(low, high, size)
+
+
+def _gamma(shape, scale, rng, size):
+    return rng.gamma(shape, scale, size)
+
+
+def _lognormal(mu, sigma, rng, size):
+    return rng.lognormal(mu, sigma, size)
+
+
+def _choice(values, rng, size):
+    return rng.choice(values, size)
+
+
+# Os amostradores são functools.partial de funções do módulo, e não lambdas,
+# para poderem ser enviados a outros processos (simulation/replications.py).
+
+
+def exponential(rate):
+    """Exponencial com taxa rate (média 1/rate)."""
+    return functools.partial(_exponential, 1 / rate)
+
+
+def deterministic(value):
+    """Tempo constante (M/D/1)."""
+    return functools.partial(_constant, float(value))
+
+
+def uniform(low, high):
+    """Uniforme em [low, high)."""
+    return functools.partial(_uniform, low, high)
+
+
+def gamma(mean, variance):
+    """Gama com a média e a variância dadas; variância 0 vira determinística."""
+    if variance == 0:
+        return deterministic(mean)
+    return functools.partial(_gamma, mean**2 / variance, variance / mean)
+
+
+def lognormal(mean, variance):
+    """Lognormal com a média e a variância dadas."""
+    if variance == 0:
+        return deterministic(mean)
+    sigma2 = math.log1p(variance / mean**2)
+    return functools.partial(_lognormal, math.log(mean) - sigma2 / 2, math.sqrt(sigma2))
+
+
+def empirical(values):
+    """Reamostragem uniforme de valores observados."""
+    return functools.partial(_choice, np.asarray(values, dtype=float))
+
+
+def sampler(spec):
+    """Converte spec (amostrador ou taxa numérica) em amostrador."""
+    if callable(spec):
+        return spec
+    return exponential(spec)
+
+
+def stream(sample, rng, batch_size=BATCH_SIZE):
+    """
+    Gerador infinito de amostras floats, produzidas em lotes de batch_size.
+
+    Gerar em lote amortiza o custo de chamar o NumPy por amostra; next() no
+    gerador custa só a iteração sobre a lista.
+    """
+    while True:
+        yield from sample(rng, batch_size).tolist()
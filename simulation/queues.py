@@ -0,0 +1,244 @@
+"""
+Simulação de eventos discretos das filas de classe única.
+
+As métricas usam as mesmas chaves de models/batch.py (rho, P_queue, L, Lq,
+W, Wq, P_block, lambda_eff, busy_servers) para comparação direta com os
+modelos analíticos.
+"""
+
+import heapq
+
+import numpy as np
+
+from simulation.distributions import BATCH_SIZE, exponential, sampler, stream
+
+
+def simulate_multi_server(
+    arrival_rate,
+    service,
+    num_servers=1,
+    max_capacity=None,
+    num_customers=1_000_000,
+    warmup=None,
+    seed=None,
+):
+    """
+    Simula uma fila FCFS M/G/c ou M/G/c/K (M/M/c, M/M/c/K e M/G/1 como casos
+    particulares).
+
+    Parâmetros:
+        arrival_rate (float): λ, taxa de chegada (Poisson).
+        service: taxa μ (serviço exponencial) ou amostrador de
+            simulation.distributions.
+        num_servers (int): c, número de servidores.
+        max_capacity (int): K, capacidade do sistema; None = fila infinita.
+        num_customers (int): chegadas medidas.
+        warmup (int): chegadas descartadas no início; padrão num_customers // 10.
+        seed: semente do gerador NumPy.
+
+    Os tempos entre chegadas e de serviço são gerados em lotes. O próximo
+    servidor livre sai de um heap com os instantes de liberação (e, com K,
+    outro heap guarda as saídas para contar quem está no sistema). Com c = 1
+    e fila infinita, as esperas de cada lote saem da recursão de Lindley
+    vetorizada, sem laço em Python.
+
+    Retorna:
+        dict: rho, P_queue, L, Lq, W, Wq, lambda_eff, busy_servers,
+        P_block (se houver K) e customers.
+    """
+    if arrival_rate <= 0 or num_servers < 1 or num_customers < 1:
+        return {"Erro": "λ, c e o número de clientes devem ser maiores que zero."}
+    if max_capacity is not None and max_capacity < num_servers:
+        return {"Erro": "A capacidade K deve ser >= c."}
+    if max_capacity is None and not callable(service) and arrival_rate >= num_servers * service:
+        return {"Erro": "O sistema é instável (λ >= c·μ)."}
+
+    if warmup is None:
+        warmup = num_customers // 10
+
+    rng = np.random.default_rng(seed)
+    interarrival = exponential(arrival_rate)
+    service = sampler(service)
+    lindley = num_servers == 1 and max_capacity is None
+
+    free = [0.0] * num_servers
+    departures = [] if max_capacity is not None else None
+    w_prev = s_prev = 0.0
+    t = 0.0
+    t_start = 0.0
+
+    arrivals = blocked = waited = 0
+    sum_wait = sum_service = 0.0
+
+    index = 0
+    total = warmup + num_customers
+    while index < total:
+        size = min(BATCH_SIZE, total - index)
+        gaps = interarrival(rng, size)
+        services = service(rng, size)
+        times = t + np.cumsum(gaps)
+
+        if lindley:
+            # W_i = max(0, W_{i-1} + S_{i-1} - A_i) em forma fechada:
+            # W_i = X_i + max(W_0, max_{k<=i} -X_k), com X as somas de S - A
+            steps = np.empty(size)
+            steps[0] = s_prev - gaps[0]
+            steps[1:] = services[:-1] - gaps[1:]
+            X = np.cumsum(steps)
+            waits = X + np.maximum(w_prev, np.maximum.accumulate(-X))
+            w_prev, s_prev = waits[-1], services[-1]
+            accepted = np.ones(size, dtype=bool)
+        else:
+            waits, accepted = _multi_server_chunk(
+                times.tolist(), services.tolist(), free, departures, max_capacity
+            )
+
+        skip = max(0, warmup - index)
+        if skip and skip <= size:
+            t_start = float(times[skip - 1])
+        if skip < size:
+            ok = accepted[skip:]
+            w = waits[skip:][ok]
+            arrivals += size - skip
+            blocked += int(np.count_nonzero(~ok))
+            waited += int(np.count_nonzero(w > 0))
+            sum_wait += float(w.sum())
+            sum_service += float(services[skip:][ok].sum())
+
+        t = float(times[-1])
+        index += size
+
+    served = arrivals - blocked
+    lambda_eff = served / (t - t_start)
+    Wq = sum_wait / served
+    W = Wq + sum_service / served
+    busy_servers = lambda_eff * sum_service / served
+
+    results = {
+        "rho": busy_servers / num_servers,
+        "P_queue": waited / served,
+        "L": lambda_eff * W,
+        "Lq": lambda_eff * Wq,
+        "W": W,
+        "Wq": Wq,
+        "lambda_eff": lambda_eff,
+        "busy_servers": busy_servers,
+        "customers": arrivals,
+    }
+    if max_capacity is not None:
+        results["P_block"] = blocked / arrivals
+    return results
+
+
+def _multi_server_chunk(times, services, free, departures, max_capacity):
+    """Esperas FCFS de um lote com c servidores; free e departures são heaps mantidos entre lotes."""
+    waits = [0.0] * len(times)
+    accepted = [True] * len(times)
+    heapreplace = heapq.heapreplace
+
+    for i, (a, s) in enumerate(zip(times, services)):
+        if departures is not None:
+            while departures and departures[0] <= a:
+                heapq.heappop(departures)
+            if len(departures) >= max_capacity:
+                accepted[i] = False
+                continue
+
+        f = free[0]
+        start = a if a > f else f
+        heapreplace(free, start + s)
+        if departures is not None:
+            heapq.heappush(departures, start + s)
+        waits[i] = start - a
+
+    return np.array(waits), np.array(accepted)
+
+
+def simulate_finite_source(
+    arrival_rate,
+    service,
+    num_servers,
+    population_size,
+    num_customers=1_000_000,
+    warmup=None,
+    seed=None,
+):
+    """
+    Simula uma fila M/G/c com população finita N (M/M/c/N e M/M/1/N).
+
+    Cada cliente fora do sistema volta após um tempo Exp(λ). O escalonador é
+    um heap de eventos (instante, tipo) com as próximas chegadas e saídas;
+    L, Lq e P0 são médias no tempo e W, Wq vêm da lei de Little.
+
+    Retorna:
+        dict: rho, P0, L, Lq, W, Wq, lambda_eff, busy_servers e customers.
+    """
+    if arrival_rate <= 0 or num_servers < 1 or population_size < 1 or num_customers < 1:
+        return {"Erro": "Todos os parâmetros devem ser maiores que zero."}
+
+    if warmup is None:
+        warmup = num_customers // 10
+
+    rng = np.random.default_rng(seed)
+    think = stream(exponential(arrival_rate), rng)
+    service = stream(sampler(service), rng)
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+
+    # tipo 0 = chegada, 1 = saída
+    events = [(next(think), 0) for _ in range(population_size)]
+    heapq.heapify(events)
+
+    busy = queue = 0
+    t = t_start = 0.0
+    area_L = area_Lq = area_busy = idle = 0.0
+    arrivals = 0
+    total = warmup + num_customers
+    measuring = warmup == 0
+
+    while arrivals < total:
+        time, kind = heappop(events)
+        if measuring:
+            dt = time - t
+            area_L += (busy + queue) * dt
+            area_Lq += queue * dt
+            area_busy += busy * dt
+            if not busy:
+                idle += dt
+        t = time
+
+        if kind == 0:
+            arrivals += 1
+            if arrivals == warmup:
+                measuring = True
+                t_start = t
+            if busy < num_servers:
+                busy += 1
+                heappush(events, (t + next(service), 1))
+            else:
+                queue += 1
+        else:
+            if queue:
+                queue -= 1
+                heappush(events, (t + next(service), 1))
+            else:
+                busy -= 1
+            heappush(events, (t + next(think), 0))
+
+    elapsed = t - t_start
+    lambda_eff = num_customers / elapsed
+    L = area_L / elapsed
+    Lq = area_Lq / elapsed
+    busy_servers = area_busy / elapsed
+
+    return {
+        "rho": busy_servers / num_servers,
+        "P0": idle / elapsed,
+        "L": L,
+        "Lq": Lq,
+        "W": L / lambda_eff,
+        "Wq": Lq / lambda_eff,
+        "lambda_eff": lambda_eff,
+        "busy_servers": busy_servers,
+        "customers": num_customers,
+    }
@@ -0,0 +1,214 @@
+"""
+Replicações independentes da simulação em paralelo, com intervalos de
+confiança ao lado do valor analítico correspondente de models/.
+
+Cada replicação roda em um processo do ProcessPoolExecutor com uma semente
+própria (SeedSequence.spawn), descarta o aquecimento (warmup) e contribui
+com uma média por métrica; o intervalo usa a t de Student sobre essas
+médias (método replicação/eliminação).
+"""
+
+import functools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from scipy import stats
+
+from models import batch
+from models.mg1_non_preemptive_priority import mg1_non_preemptive_priority_metrics
+from models.mg1_preemptive_priority import mg1_preemptive_priority_metrics
+from models.mm1_non_preemptive_priority import mm1_priority_non_preemptive_metrics
+from models.mm1_preemptive_priority import mm1_priority_preemptive_metrics
+from models.mmc_no_preemptive_priority import mmc_no_preemptive_priority
+from models.mmc_preemptive_priority import mmc_priority_preemptive_metrics
+from simulation.distributions import gamma
+from simulation.priority import simulate_priority
+from simulation.queues import simulate_finite_source, simulate_multi_server
+
+
+def _t_quantile(p, df):
+    """Quantil p da t de Student com df graus de liberdade."""
+    return float(stats.t.ppf(p, df))
+
+
+def _scalar(arrays):
+    return {name: float(values) for name, values in arrays.items() if name != "stable"}
+
+
+def _carried_load(analytic, mu, c):
+    """
+    Nas filas finitas o rho dos kernels é a carga oferecida (λ/cμ ou Nλ/cμ);
+    o simulador mede a utilização, servidores ocupados / c = λ_eff / (cμ).
+    """
+    return {**analytic, "rho": analytic["lambda_eff"] / (c * mu)}
+
+
+def _setup(model, params):
+    """
+    Simulador, argumentos, métricas analíticas e ordem de prioridade de um modelo.
+
+    order[i] é a classe (na ordem informada) simulada na i-ésima prioridade.
+    """
+    p = dict(params)
+    lam = p.get("arrival_rate")
+    mu = p.get("service_rate")
+    c = p.get("num_servers", 1)
+
+    if model in ("mm1", "mmc"):
+        return (
+            simulate_multi_server,
+            {"arrival_rate": lam, "service": mu, "num_servers": c},
+            _scalar(batch.mmc_batch(lam, mu, c)),
+            None,
+        )
+    if model in ("mm1k", "mmck"):
+        K = p["max_capacity"]
+        return (
+            simulate_multi_server,
+            {"arrival_rate": lam, "service": mu, "num_servers": c, "max_capacity": K},
+            _carried_load(_scalar(batch.mmck_batch(lam, mu, c, K)), mu, c),
+            None,
+        )
+    if model in ("mm1n", "mmcn"):
+        N = p["population_size"]
+        return (
+            simulate_finite_source,
+            {"arrival_rate": lam, "service": mu, "num_servers": c, "population_size": N},
+            _carried_load(_scalar(batch.mmcn_batch(lam, mu, c, N)), mu, c),
+            None,
+        )
+    if model == "mg1":
+        # Serviço gama com a média e a variância informadas
+        var = p["sigma_squared"]
+        return (
+            simulate_multi_server,
+            {"arrival_rate": lam, "service": gamma(1 / mu, var)},
+            _scalar(batch.mg1_batch(lam, mu, var)),
+            None,
+        )
+
+    rates = list(p.get("arrival_rates", []))
+    k = len(rates)
+    if model in ("mm1_preemptive", "mm1_non_preemptive", "mmc_preemptive", "mmc_no_preemptive"):
+        analytic = {
+            "mm1_preemptive": lambda: mm1_priority_preemptive_metrics(rates, mu, vectorized=True),
+            "mm1_non_preemptive": lambda: mm1_priority_non_preemptive_metrics(rates, mu, vectorized=True),
+            "mmc_preemptive": lambda: mmc_priority_preemptive_metrics(rates, mu, c, vectorized=True),
+            "mmc_no_preemptive": lambda: mmc_no_preemptive_priority(rates, mu, c, vectorized=True),
+        }[model]()
+        order = list(range(k))
+        services = mu
+    elif model in ("mg1_preemptive", "mg1_non_preemptive"):
+        times = list(p["service_times"])
+        variances = list(p["service_variances"])
+        if model == "mg1_preemptive":
+            # O modelo lista as classes em ordem crescente de prioridade
+            order = list(range(k))[::-1]
+            analytic = mg1_preemptive_priority_metrics(rates, times, variances, vectorized=True)
+        else:
+            # O modelo dá prioridade ao menor tempo de serviço (SPT)
+            order = np.argsort(times, kind="stable").tolist()
+            analytic = mg1_non_preemptive_priority_metrics(rates, times, variances, vectorized=True)
+        services = [gamma(times[i], variances[i]) for i in order]
+        c = 1
+    else:
+        return {"Erro": f"Modelo desconhecido: {model}"}
+
+    if "Erro" in analytic:
+        analytic = {}
+    else:
+        analytic = {name: np.asarray(values, dtype=float).tolist() for name, values in analytic.items()}
+
+    return (
+        simulate_priority,
+        {
+            "arrival_rates": [rates[i] for i in order],
+            "services": services,
+            "num_servers": c,
+            "preemptive": "non" not in model and "no_" not in model,
+        },
+        analytic,
+        order,
+    )
+
+
+def _replicate(simulator, kwargs, num_customers, warmup, seed):
+    return simulator(**kwargs, num_customers=num_customers, warmup=warmup, seed=seed)
+
+
+def run_replications(
+    model,
+    params,
+    replications=10,
+    num_customers=200_000,
+    warmup=None,
+    confidence=0.95,
+    workers=None,
+    seed=None,
+):
+    """
+    Roda replicações independentes de um modelo em paralelo.
+
+    Parâmetros:
+        model (str): mm1, mmc, mm1k, mmck, mm1n, mmcn, mg1 ou um dos modelos
+            de prioridade (mm1_preemptive, mm1_non_preemptive, mmc_preemptive,
+            mmc_no_preemptive, mg1_preemptive, mg1_non_preemptive).
+        params (dict): parâmetros com os nomes da API (/api/v1).
+        replications (int): número de replicações (>= 2).
+        num_customers (int): clientes medidos por replicação.
+        warmup (int): clientes descartados no início de cada replicação.
+        confidence (float): nível do intervalo de confiança.
+        workers (int): processos; padrão os.cpu_count().
+        seed: semente mestre; as replicações recebem sementes independentes.
+
+    Retorna:
+        dict: por métrica, mean, half_width, ci_low, ci_high e analytic (listas
+        por classe nos modelos de prioridade, na ordem informada).
+    """
+    if replications < 2:
+        return {"Erro": "São necessárias ao menos 2 replicações."}
+    if not 0 < confidence < 1:
+        return {"Erro": "O nível de confiança deve estar entre 0 e 1."}
+
+    setup = _setup(model, params)
+    if isinstance(setup, dict):
+        return setup
+    simulator, kwargs, analytic, order = setup
+
+    seeds = np.random.SeedSequence(seed).spawn(replications)
+    workers = min(workers or os.cpu_count() or 1, replications)
+    run = functools.partial(_replicate, simulator, kwargs, num_customers, warmup)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        runs = list(executor.map(run, seeds))
+
+    for result in runs:
+        if "Erro" in result:
+            return result
+
+    t = _t_quantile(0.5 + confidence / 2, replications - 1)
+    summary = {}
+    for name in runs[0]:
+        if name == "customers":
+            continue
+        values = np.array([result[name] for result in runs], dtype=float)
+        if order is not None:
+            # Volta da ordem de prioridade simulada para a ordem informada
+            original = np.empty_like(values)
+            original[:, order] = values
+            values = original
+
+        mean = values.mean(axis=0)
+        half_width = t * values.std(axis=0, ddof=1) / math.sqrt(replications)
+        summary[name] = {
+            "mean": mean.tolist(),
+            "half_width": half_width.tolist(),
+            "ci_low": (mean - half_width).tolist(),
+            "ci_high": (mean + half_width).tolist(),
+            "analytic": analytic.get(name),
+        }
+
+    summary["replications"] = replications
+    summary["customers"] = replications * runs[0]["customers"]
+    return summary